@@ -4,24 +4,34 @@
 
 import argparse
 import io
+import json
 import logging
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from pydantic import ValidationError
 
 logger = logging.getLogger("airbyte")
 
+_FAST_PATH_MESSAGE_FIELDS = frozenset(("type", "record"))
+_FAST_PATH_RECORD_MESSAGE_FIELDS = frozenset(("namespace", "stream", "data", "emitted_at"))
+
 
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
 
+    # When enabled, the input is read from stdin in blocks of INPUT_BLOCK_SIZE bytes and RECORD messages are created without validating
+    # them against the protocol models, which is where most of the time is spent when parsing the input. The other messages are still
+    # fully validated.
+    fast_input_decoding = False
+    INPUT_BLOCK_SIZE = 1024 * 1024
+
     @abstractmethod
     def write(
         self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
@@ -34,12 +44,79 @@ class Destination(Connector, ABC):
 
     def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
         """Reads from stdin, converting to Airbyte messages"""
+        if self.fast_input_decoding:
+            yield from self._parse_input_stream_fast(input_stream)
+            return
         for line in input_stream:
             try:
                 yield AirbyteMessage.parse_raw(line)
             except ValidationError:
                 logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
 
+    def _parse_input_stream_fast(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
+        # The text layer is bypassed when there is a binary buffer under it as the json module decodes UTF-8 bytes itself
+        binary_stream = getattr(input_stream, "buffer", None)
+        lines: Iterable[Union[str, bytes]] = self._read_lines_in_blocks(binary_stream) if binary_stream is not None else input_stream
+        for line in lines:
+            message = self._decode_message(line)
+            if message is not None:
+                yield message
+
+    def _read_lines_in_blocks(self, binary_stream: io.BufferedIOBase) -> Iterable[bytes]:
+        # a line longer than a block spans several blocks so its parts are accumulated until its end is read
+        line_parts: List[bytes] = []
+        # read1 returns the bytes already available instead of waiting for a full block, so a message is not held back until more input
+        # arrives
+        while block := binary_stream.read1(self.INPUT_BLOCK_SIZE):
+            lines = block.split(b"\n")
+            if len(lines) == 1:
+                line_parts.append(block)
+                continue
+            line_parts.append(lines[0])
+            yield b"".join(line_parts)
+            yield from lines[1:-1]
+            line_parts = [lines[-1]]
+        last_line = b"".join(line_parts)
+        if last_line:
+            yield last_line
+
+    @staticmethod
+    def _decode_message(line: Union[str, bytes]) -> Optional[AirbyteMessage]:
+        """
+        Decode a line of the input without validating RECORD messages which only have the fields and types the protocol models would
+        create as is. Any other message is validated against the protocol models.
+
+        The json module is used rather than orjson as orjson decodes integers which do not fit on 64 bits as floats which loses precision.
+
+        :return: The message or None if the line is not a valid Airbyte message
+        """
+        try:
+            decoded = json.loads(line)
+            if (
+                isinstance(decoded, dict)
+                and decoded.get("type") == Type.RECORD.value
+                and decoded.keys() <= _FAST_PATH_MESSAGE_FIELDS
+                and Destination._is_fast_path_record(decoded.get("record"))
+            ):
+                return AirbyteMessage.construct(type=Type.RECORD, record=AirbyteRecordMessage.construct(**decoded["record"]))
+            return AirbyteMessage.parse_obj(decoded)
+        except (ValueError, ValidationError):
+            # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
+            printable_line = line.decode("utf-8", errors="replace") if isinstance(line, bytes) else line
+            logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {printable_line}")
+            return None
+
+    @staticmethod
+    def _is_fast_path_record(record: Any) -> bool:
+        return (
+            isinstance(record, dict)
+            and record.keys() <= _FAST_PATH_RECORD_MESSAGE_FIELDS
+            and isinstance(record.get("stream"), str)
+            and isinstance(record.get("data"), dict)
+            and type(record.get("emitted_at")) is int  # bool is an int but would be converted by the protocol models
+            and (record.get("namespace") is None or isinstance(record["namespace"], str))
+        )
+
     def _run_write(
         self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
     ) -> Iterable[AirbyteMessage]:
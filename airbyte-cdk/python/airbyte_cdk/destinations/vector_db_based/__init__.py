@@ -12,13 +12,14 @@ from .config import (
     ProcessingConfigModel,
 )
 from .document_processor import Chunk, DocumentProcessor
-from .embedder import CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
+from .embedder import CachedEmbedder, CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
 from .indexer import Indexer
 from .writer import Writer
 
 __all__ = [
     "AzureOpenAIEmbedder",
     "AzureOpenAIEmbeddingConfigModel",
+    "CachedEmbedder",
     "Chunk",
     "CohereEmbedder",
     "CohereEmbeddingConfigModel",
@@ -2,10 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import hashlib
 import os
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional, Union, cast
+from typing import Dict, List, Optional, Set, Union, cast
 
 from airbyte_cdk.destinations.vector_db_based.config import (
     AzureOpenAIEmbeddingConfigModel,
@@ -233,6 +237,79 @@ class FromFieldEmbedder(Embedder):
         return self.config.dimensions
 
 
+class CachedEmbedder(Embedder):
+    """
+    Wraps an embedder so that a text is only sent to it if it was not embedded before. The embeddings are stored in a local SQLite database
+    keyed by the SHA-256 hash of the text so that identical chunks are embedded once across batches and, if the database file is kept
+    between syncs, across syncs. Identical texts within the same call are also only embedded once.
+
+    The embedding of a text has to only depend on the text, so this must not wrap a FromFieldEmbedder, and a database must only be used
+    with a single embedding model. Texts which the wrapped embedder does not embed (i.e. it returns None for them) are not cached.
+    """
+
+    def __init__(self, embedder: Embedder, database_path: str = ":memory:") -> None:
+        """
+        :param embedder: The embedder called for the texts which are not in the cache
+        :param database_path: The path of the SQLite database holding the cache. By default, the cache is only kept in memory
+        """
+        super().__init__()
+        self.embedder = embedder
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database_path, isolation_level=None, check_same_thread=False)
+        # The cache can be rebuilt from the embedding API so durability is not needed
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (text_hash TEXT PRIMARY KEY, embedding BLOB NOT NULL)")
+        self.hits = 0
+        self.misses = 0
+
+    def check(self) -> Optional[str]:
+        return self.embedder.check()
+
+    def embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        text_hashes = [hashlib.sha256(document.page_content.encode("utf-8")).hexdigest() for document in documents]
+        embeddings_by_hash = self._get_cached_embeddings(set(text_hashes))
+        self.hits += sum(1 for text_hash in text_hashes if text_hash in embeddings_by_hash)
+
+        documents_to_embed: Dict[str, Document] = {}
+        for text_hash, document in zip(text_hashes, documents):
+            if text_hash not in embeddings_by_hash:
+                documents_to_embed.setdefault(text_hash, document)
+        if documents_to_embed:
+            self.misses += len(documents_to_embed)
+            new_embeddings = self.embedder.embed_documents(list(documents_to_embed.values()))
+            embeddings_by_hash.update(zip(documents_to_embed.keys(), new_embeddings))
+            self._cache_embeddings(
+                {text_hash: embedding for text_hash, embedding in zip(documents_to_embed.keys(), new_embeddings) if embedding is not None}
+            )
+        return [embeddings_by_hash[text_hash] for text_hash in text_hashes]
+
+    @property
+    def embedding_dimensions(self) -> int:
+        return self.embedder.embedding_dimensions
+
+    def _get_cached_embeddings(self, text_hashes: Set[str]) -> Dict[str, Optional[List[float]]]:
+        embeddings: Dict[str, Optional[List[float]]] = {}
+        hashes = list(text_hashes)
+        # SQLite limits the number of parameters of a query
+        for start in range(0, len(hashes), 500):
+            hashes_to_look_up = hashes[start : start + 500]
+            placeholders = ", ".join("?" * len(hashes_to_look_up))
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT text_hash, embedding FROM embeddings WHERE text_hash IN ({placeholders})", hashes_to_look_up
+                ).fetchall()
+            for text_hash, embedding in rows:
+                embeddings[text_hash] = array("d", embedding).tolist()
+        return embeddings
+
+    def _cache_embeddings(self, embeddings: Dict[str, List[float]]) -> None:
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (text_hash, embedding) VALUES (?, ?)",
+                [(text_hash, array("d", embedding).tobytes()) for text_hash, embedding in embeddings.items()],
+            )
+
+
 embedder_map = {
     "openai": OpenAIEmbedder,
     "cohere": CohereEmbedder,
@@ -3,8 +3,11 @@
 #
 
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
 from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, DocumentProcessor
@@ -13,6 +16,96 @@ from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 
 
+@dataclass
+class _Batch:
+    chunks: Dict[Tuple[str, str], List[Chunk]] = field(default_factory=lambda: defaultdict(list))
+    ids_to_delete: Dict[Tuple[str, str], List[str]] = field(default_factory=lambda: defaultdict(list))
+
+
+_NO_MORE_BATCHES = object()
+
+
+class _EmbeddingAndIndexingPipeline:
+    """
+    Embeds and indexes batches in two background threads connected by bounded queues so that processing the input messages, embedding
+    a batch and indexing the previous one overlap. Each stage handles one batch at a time so batches are indexed in the order they are
+    submitted. An exception raised by a stage stops the pipeline and is raised again in the thread submitting the batches.
+    """
+
+    _TIMEOUT_IN_SECONDS = 0.1
+
+    def __init__(self, embed: Callable[[_Batch], None], index: Callable[[_Batch], None], queue_size: int) -> None:
+        self._embedding_queue: "Queue[Any]" = Queue(maxsize=queue_size)
+        self._indexing_queue: "Queue[Any]" = Queue(maxsize=queue_size)
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._indexed_batches = 0
+        self.submitted_batches = 0
+        self._threads = [
+            threading.Thread(target=self._run_stage, args=(embed, self._embedding_queue, self._indexing_queue), daemon=True),
+            threading.Thread(target=self._run_stage, args=(index, self._indexing_queue, None), daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def indexed_batches(self) -> int:
+        with self._condition:
+            self._raise_if_failed()
+            return self._indexed_batches
+
+    def submit(self, batch: _Batch) -> None:
+        while not self._put(self._embedding_queue, batch):
+            with self._condition:
+                self._raise_if_failed()
+        self.submitted_batches += 1
+
+    def wait_until_indexed(self, number_of_batches: int) -> None:
+        with self._condition:
+            while self._indexed_batches < number_of_batches:
+                self._raise_if_failed()
+                self._condition.wait(self._TIMEOUT_IN_SECONDS)
+
+    def close(self) -> None:
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _run_stage(self, process: Callable[[_Batch], None], input_queue: "Queue[Any]", output_queue: "Optional[Queue[Any]]") -> None:
+        try:
+            while not self._stopped.is_set():
+                try:
+                    batch = input_queue.get(timeout=self._TIMEOUT_IN_SECONDS)
+                except Empty:
+                    continue
+                process(batch)
+                if output_queue is not None:
+                    while not self._put(output_queue, batch):
+                        if self._stopped.is_set():
+                            return
+                else:
+                    with self._condition:
+                        self._indexed_batches += 1
+                        self._condition.notify_all()
+        except BaseException as exception:
+            with self._condition:
+                self._error = exception
+                self._condition.notify_all()
+            self._stopped.set()
+
+    def _put(self, queue: "Queue[Any]", batch: _Batch) -> bool:
+        try:
+            queue.put(batch, timeout=self._TIMEOUT_IN_SECONDS)
+            return True
+        except Full:
+            return False
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
 class Writer:
     """
     The Writer class is orchestrating the document processor, the embedder and the indexer:
@@ -24,21 +117,30 @@ class Writer:
     The destination connector is responsible to create a writer instance and pass the input messages iterable to the write method.
     The batch size can be configured by the destination connector to give the freedom of either letting the user configure it or hardcoding it to a sensible value depending on the destination.
     The omit_raw_text parameter can be used to omit the raw text from the chunks. This can be useful if the raw text is very large and not needed for the destination.
+    The pipeline_queue_size parameter can be used to embed and index batches in background threads while the next batches are processed. Up to pipeline_queue_size batches wait in front of each stage and state messages are only emitted once all the batches before them are indexed. The indexer is then only called from the indexing thread during the write, so it does not need to be thread-safe.
     """
 
     def __init__(
-        self, processing_config: ProcessingConfigModel, indexer: Indexer, embedder: Embedder, batch_size: int, omit_raw_text: bool
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: Indexer,
+        embedder: Embedder,
+        batch_size: int,
+        omit_raw_text: bool,
+        pipeline_queue_size: int = 0,
     ) -> None:
         self.processing_config = processing_config
         self.indexer = indexer
         self.embedder = embedder
         self.batch_size = batch_size
         self.omit_raw_text = omit_raw_text
+        self.pipeline_queue_size = pipeline_queue_size
         self._init_batch()
 
     def _init_batch(self) -> None:
-        self.chunks: Dict[Tuple[str, str], List[Chunk]] = defaultdict(list)
-        self.ids_to_delete: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._batch = _Batch()
+        self.chunks = self._batch.chunks
+        self.ids_to_delete = self._batch.ids_to_delete
         self.number_of_chunks = 0
 
     def _convert_to_document(self, chunk: Chunk) -> Document:
@@ -49,37 +151,80 @@ class Writer:
             raise ValueError("Cannot embed a chunk without page content")
         return Document(page_content=chunk.page_content, record=chunk.record)
 
-    def _process_batch(self) -> None:
-        for (namespace, stream), ids in self.ids_to_delete.items():
-            self.indexer.delete(ids, namespace, stream)
-
-        for (namespace, stream), chunks in self.chunks.items():
+    def _embed_batch(self, batch: _Batch) -> None:
+        for chunks in batch.chunks.values():
             embeddings = self.embedder.embed_documents([self._convert_to_document(chunk) for chunk in chunks])
             for i, document in enumerate(chunks):
                 document.embedding = embeddings[i]
                 if self.omit_raw_text:
                     document.page_content = None
+
+    def _index_batch(self, batch: _Batch) -> None:
+        for (namespace, stream), ids in batch.ids_to_delete.items():
+            self.indexer.delete(ids, namespace, stream)
+
+        for (namespace, stream), chunks in batch.chunks.items():
             self.indexer.index(chunks, namespace, stream)
 
+    def _process_batch(self) -> None:
+        self._embed_batch(self._batch)
+        self._index_batch(self._batch)
         self._init_batch()
 
+    def _add_record(self, message: AirbyteMessage) -> None:
+        record_chunks, record_id_to_delete = self.processor.process(message.record)
+        self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
+        if record_id_to_delete is not None:
+            self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
+        self.number_of_chunks += len(record_chunks)
+
     def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
         self.processor = DocumentProcessor(self.processing_config, configured_catalog)
         self.indexer.pre_sync(configured_catalog)
-        for message in input_messages:
-            if message.type == Type.STATE:
-                # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
-                # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
-                self._process_batch()
-                yield message
-            elif message.type == Type.RECORD:
-                record_chunks, record_id_to_delete = self.processor.process(message.record)
-                self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
-                if record_id_to_delete is not None:
-                    self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
-                self.number_of_chunks += len(record_chunks)
-                if self.number_of_chunks >= self.batch_size:
+        if self.pipeline_queue_size > 0:
+            yield from self._write_pipelined(input_messages)
+        else:
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
+                    # the queue to ensure writes happen, then output the state message to indicate it's safe to checkpoint state
                     self._process_batch()
+                    yield message
+                elif message.type == Type.RECORD:
+                    self._add_record(message)
+                    if self.number_of_chunks >= self.batch_size:
+                        self._process_batch()
 
-        self._process_batch()
+            self._process_batch()
         yield from self.indexer.post_sync()
+
+    def _write_pipelined(self, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
+        pipeline = _EmbeddingAndIndexingPipeline(self._embed_batch, self._index_batch, self.pipeline_queue_size)
+        # state messages waiting for the number of batches submitted before them to be indexed
+        pending_states: Deque[Tuple[int, AirbyteMessage]] = deque()
+        try:
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    self._submit_batch(pipeline)
+                    pending_states.append((pipeline.submitted_batches, message))
+                elif message.type == Type.RECORD:
+                    self._add_record(message)
+                    if self.number_of_chunks >= self.batch_size:
+                        self._submit_batch(pipeline)
+                if pending_states:
+                    indexed_batches = pipeline.indexed_batches
+                    while pending_states and pending_states[0][0] <= indexed_batches:
+                        yield pending_states.popleft()[1]
+
+            self._submit_batch(pipeline)
+            pipeline.wait_until_indexed(pipeline.submitted_batches)
+            while pending_states:
+                yield pending_states.popleft()[1]
+        finally:
+            pipeline.close()
+
+    def _submit_batch(self, pipeline: _EmbeddingAndIndexingPipeline) -> None:
+        # Unlike the synchronous path, empty batches are not submitted as they would only delay the state messages
+        if self.chunks or self.ids_to_delete:
+            pipeline.submit(self._batch)
+        self._init_batch()
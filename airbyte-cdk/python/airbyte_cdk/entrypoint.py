@@ -10,9 +10,11 @@ import os.path
 import socket
 import sys
 import tempfile
-from collections import defaultdict
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from functools import wraps
-from typing import Any, DefaultDict, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, DefaultDict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import requests
@@ -27,6 +29,7 @@ from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_o
 from airbyte_cdk.utils import is_cloud_environment, message_utils
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.message_serializer import AirbyteMessageWriter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from requests import PreparedRequest, Response, Session
 
@@ -83,6 +86,12 @@ class AirbyteEntrypoint(object):
         return main_parser.parse_args(args)
 
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.run_messages(parsed_args))
+
+    def run_messages(self, parsed_args: argparse.Namespace) -> Iterable[AirbyteMessage]:
+        """
+        Same as `run` but the messages are not serialized which allows the caller to decide how to output them
+        """
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -100,30 +109,26 @@ class AirbyteEntrypoint(object):
                 os.environ[ENV_REQUEST_CACHE_PATH] = temp_dir  # set this as default directory for request_cache to store *.sqlite files
                 if cmd == "spec":
                     message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                    yield from [
-                        self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)
-                    ]
-                    yield self.airbyte_message_to_string(message)
+                    yield from list(self._emit_queued_messages(self.source))
+                    yield message
                 else:
                     raw_config = self.source.read_config(parsed_args.config)
                     config = self.source.configure(raw_config, temp_dir)
 
-                    yield from [
-                        self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)
-                    ]
+                    yield from list(self._emit_queued_messages(self.source))
                     if cmd == "check":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.check(source_spec, config))
+                        yield from self.check(source_spec, config)
                     elif cmd == "discover":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.discover(source_spec, config))
+                        yield from self.discover(source_spec, config)
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state))
+                        yield from self.read(source_spec, config, config_catalog, state)
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
-            yield from [self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
+            yield from list(self._emit_queued_messages(self.source))
 
     def check(self, source_spec: ConnectorSpecification, config: TConfig) -> Iterable[AirbyteMessage]:
         self.set_up_secret_filter(config, source_spec.connectionSpecification)
@@ -229,13 +234,16 @@ class AirbyteEntrypoint(object):
         return
 
 
-def launch(source: Source, args: List[str]) -> None:
+def launch(source: Source, args: List[str], message_writer: Optional[AirbyteMessageWriter] = None) -> None:
+    """
+    :param message_writer: Controls how messages are serialized and written to stdout. By default, every message is serialized using the
+    protocol models and flushed individually
+    """
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
-        # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
-        print(f"{message}\n", end="", flush=True)
+    with message_writer or AirbyteMessageWriter() as writer:
+        for message in source_entrypoint.run_messages(parsed_args):
+            writer.write(message)
 
 
 def _init_internal_request_filter() -> None:
@@ -243,6 +251,7 @@ def _init_internal_request_filter() -> None:
     Wraps the Python requests library to prevent sending requests to internal URL endpoints.
     """
     wrapped_fn = Session.send
+    private_url_verdicts = _PrivateUrlVerdictCache()
 
     @wraps(wrapped_fn)
     def filtered_send(self: Any, request: PreparedRequest, **kwargs: Any) -> Response:
@@ -258,7 +267,7 @@ def _init_internal_request_filter() -> None:
             raise requests.exceptions.InvalidURL("Invalid URL specified: The endpoint that data is being requested from is not a valid URL")
 
         try:
-            is_private = _is_private_url(parsed_url.hostname, parsed_url.port)  # type: ignore [arg-type]
+            is_private = private_url_verdicts.is_private_url(parsed_url.hostname, parsed_url.port)  # type: ignore [arg-type]
             if is_private:
                 raise AirbyteTracedException(
                     internal_message=f"Invalid URL endpoint: `{parsed_url.hostname!r}` belongs to a private network",
@@ -276,6 +285,45 @@ def _init_internal_request_filter() -> None:
     Session.send = filtered_send  # type: ignore [method-assign]
 
 
+class _PrivateUrlVerdictCache:
+    """
+    Caches whether a hostname and port resolve to a private address so that the DNS resolution is not done for every request. Verdicts
+    expire after `ttl_in_seconds` so that a hostname resolving to a private address later on (e.g. DNS rebinding) is still rejected once
+    the verdict expires. The least recently used verdicts are evicted once `max_size` verdicts are cached.
+
+    This is thread-safe. The hostname is resolved without holding the lock so that resolving different hostnames is not serialized.
+    """
+
+    DEFAULT_TTL_IN_SECONDS = 30.0
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, ttl_in_seconds: float = DEFAULT_TTL_IN_SECONDS, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._ttl_in_seconds = ttl_in_seconds
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._verdicts: "OrderedDict[Tuple[str, Optional[int]], Tuple[bool, float]]" = OrderedDict()
+
+    def is_private_url(self, hostname: str, port: Optional[int]) -> bool:
+        key = (hostname, port)
+        with self._lock:
+            cached = self._verdicts.get(key)
+            if cached is not None:
+                is_private, expires_at = cached
+                if time.monotonic() < expires_at:
+                    self._verdicts.move_to_end(key)
+                    return is_private
+                del self._verdicts[key]
+
+        # Resolution errors are not cached and are raised to the caller
+        is_private = _is_private_url(hostname, port)  # type: ignore [arg-type]
+        with self._lock:
+            self._verdicts[key] = (is_private, time.monotonic() + self._ttl_in_seconds)
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self._max_size:
+                self._verdicts.popitem(last=False)
+        return is_private
+
+
 def _is_private_url(hostname: str, port: int) -> bool:
     """
     Helper method that checks if any of the IP addresses associated with a hostname belong to a private network.
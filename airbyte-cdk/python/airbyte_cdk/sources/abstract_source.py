@@ -253,7 +253,10 @@ class AbstractSource(Source, ABC):
         if isinstance(record_data_or_message, AirbyteMessage):
             return record_data_or_message
         else:
-            return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
+            transformer = stream.transformer
+            # The schema is only needed to transform the record. Getting it for every record can be costly for some streams
+            schema = stream.get_json_schema() if transformer.is_enabled() else None
+            return stream_data_to_airbyte_message(stream.name, record_data_or_message, transformer, schema)
 
     @property
     def message_repository(self) -> Union[None, MessageRepository]:
@@ -15,9 +15,9 @@ from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStrea
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
-from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.record_helper import current_emitted_at, stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from airbyte_cdk.utils import AirbyteTracedException
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
@@ -140,6 +140,24 @@ class ConcurrentReadProcessor:
         yield message
         yield from self._message_repository.consume_queue()
 
+    def on_record_batch(self, record_batch: RecordBatch) -> Iterable[AirbyteMessage]:
+        """
+        This method is called when a batch of records is read from a partition. It behaves like `on_record` for every record of the batch
+        except that messages added to the message repository are only emitted once the whole batch has been emitted.
+        """
+        stream = self._stream_name_to_instance[record_batch.stream_name]
+        # The clock is read once for the whole batch
+        emitted_at = current_emitted_at()
+        for record in record_batch.records:
+            message = stream_data_to_airbyte_message(stream.name, record.data, emitted_at=emitted_at)
+            if message.type == MessageType.RECORD:
+                if self._record_counter[stream.name] == 0:
+                    self._logger.info(f"Marking stream {stream.name} as RUNNING")
+                    yield stream_status_as_airbyte_message(stream.as_airbyte_stream(), AirbyteStreamStatus.RUNNING)
+                self._record_counter[stream.name] += 1
+            yield message
+        yield from self._message_repository.consume_queue()
+
     def on_exception(self, exception: StreamThreadException) -> Iterable[AirbyteMessage]:
         """
         This method is called when an exception is raised.
@@ -4,7 +4,7 @@
 import concurrent
 import logging
 from queue import Queue
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Optional
 
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
@@ -16,7 +16,7 @@ from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStrea
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
 
@@ -30,6 +30,11 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
+    # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
+    # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
+    # information and might even need to be configurable depending on the source
+    _MAX_QUEUED_RECORDS = 10_000
 
     @staticmethod
     def create(
@@ -39,6 +44,8 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = 1,
+        max_record_batch_bytes: Optional[int] = None,
     ) -> "ConcurrentSource":
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = not is_single_threaded and initial_number_of_partitions_to_generate >= num_workers
@@ -48,7 +55,14 @@ class ConcurrentSource:
             logger,
         )
         return ConcurrentSource(
-            threadpool, logger, slice_logger, message_repository, initial_number_of_partitions_to_generate, timeout_seconds
+            threadpool,
+            logger,
+            slice_logger,
+            message_repository,
+            initial_number_of_partitions_to_generate,
+            timeout_seconds,
+            record_batch_size,
+            max_record_batch_bytes,
         )
 
     def __init__(
@@ -59,6 +73,8 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        record_batch_size: int = 1,
+        max_record_batch_bytes: Optional[int] = None,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -67,6 +83,8 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param record_batch_size: The maximum number of records the partition readers hand over to the main thread in a single queue item. The default of 1 puts every record in the queue individually.
+        :param max_record_batch_bytes: The approximate maximum size in bytes of a batch of records. Only used when batching records.
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -74,6 +92,8 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._record_batch_size = record_batch_size
+        self._max_record_batch_bytes = max_record_batch_bytes
 
     def read(
         self,
@@ -86,11 +106,9 @@ class ConcurrentSource:
         if not stream_instances_to_read_from:
             return
 
-        # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
-        # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
-        # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
-        # information and might even need to be configurable depending on the source
-        queue: Queue[QueueItem] = Queue(maxsize=10_000)
+        # When records are batched, each queue item holds up to `record_batch_size` records so the queue is shrunk accordingly to keep the
+        # number of records held in memory bounded
+        queue: Queue[QueueItem] = Queue(maxsize=max(self._MAX_QUEUED_RECORDS // self._record_batch_size, 1))
         concurrent_stream_processor = ConcurrentReadProcessor(
             stream_instances_to_read_from,
             PartitionEnqueuer(queue, self._threadpool),
@@ -98,7 +116,7 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            PartitionReader(queue, self._record_batch_size, self._max_record_batch_bytes),
         )
 
         # Enqueue initial partition generation tasks
@@ -137,8 +155,13 @@ class ConcurrentSource:
         queue_item: QueueItem,
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
-        # handle queue item and call the appropriate handler depending on the type of the queue item
-        if isinstance(queue_item, StreamThreadException):
+        # handle queue item and call the appropriate handler depending on the type of the queue item. Records are checked first as they are
+        # by far the most frequent queue items
+        if isinstance(queue_item, Record):
+            yield from concurrent_stream_processor.on_record(queue_item)
+        elif isinstance(queue_item, RecordBatch):
+            yield from concurrent_stream_processor.on_record_batch(queue_item)
+        elif isinstance(queue_item, StreamThreadException):
             yield from concurrent_stream_processor.on_exception(queue_item)
         elif isinstance(queue_item, PartitionGenerationCompletedSentinel):
             yield from concurrent_stream_processor.on_partition_generation_completed(queue_item)
@@ -146,8 +169,6 @@ class ConcurrentSource:
             concurrent_stream_processor.on_partition(queue_item)
         elif isinstance(queue_item, PartitionCompleteSentinel):
             yield from concurrent_stream_processor.on_partition_complete_sentinel(queue_item)
-        elif isinstance(queue_item, Record):
-            yield from concurrent_stream_processor.on_record(queue_item)
         else:
             raise ValueError(f"Unknown queue item type: {type(queue_item)}")
 
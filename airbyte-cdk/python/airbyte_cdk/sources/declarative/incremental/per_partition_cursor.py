@@ -3,7 +3,11 @@
 #
 
 import json
-from typing import Any, Callable, Iterable, Mapping, MutableMapping, Optional, Union
+import os
+import sqlite3
+import tempfile
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
@@ -38,6 +42,232 @@ class CursorFactory:
         return self._create_function()
 
 
+class _SpilledCursorStates:
+    """
+    SQLite database in a temporary directory holding the states of the partitions which cursors were spilled to disk. The database is
+    removed when the object is garbage collected.
+    """
+
+    def __init__(self, directory: Optional[str]) -> None:
+        self._directory = tempfile.TemporaryDirectory(prefix="airbyte-partition-states-", dir=directory)
+        self._connection = sqlite3.connect(
+            os.path.join(self._directory.name, "states.sqlite"), isolation_level=None, check_same_thread=False
+        )
+        # The database is only a scratch space for the current sync so durability is not needed
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute("CREATE TABLE states (partition_key TEXT PRIMARY KEY, state TEXT NOT NULL)")
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, partition_key: str, state: StreamState) -> None:
+        is_new = self._connection.execute("SELECT 1 FROM states WHERE partition_key = ?", (partition_key,)).fetchone() is None
+        # Replacing the row also moves the partition to the end of the rowid order as it is now the most recently used
+        self._connection.execute("INSERT OR REPLACE INTO states (partition_key, state) VALUES (?, ?)", (partition_key, json.dumps(state)))
+        if is_new:
+            self._size += 1
+
+    def pop(self, partition_key: str) -> Optional[StreamState]:
+        row = self._connection.execute("SELECT state FROM states WHERE partition_key = ?", (partition_key,)).fetchone()
+        if row is None:
+            return None
+        self._connection.execute("DELETE FROM states WHERE partition_key = ?", (partition_key,))
+        self._size -= 1
+        return json.loads(row[0])  # type: ignore # the states are stored as JSON objects
+
+    def pop_oldest(self) -> Optional[Tuple[str, StreamState]]:
+        row = self._connection.execute("SELECT partition_key, state FROM states ORDER BY rowid LIMIT 1").fetchone()
+        if row is None:
+            return None
+        self._connection.execute("DELETE FROM states WHERE partition_key = ?", (row[0],))
+        self._size -= 1
+        return row[0], json.loads(row[1])
+
+    def items(self) -> Iterator[Tuple[str, StreamState]]:
+        for partition_key, state in self._connection.execute("SELECT partition_key, state FROM states ORDER BY rowid"):
+            yield partition_key, json.loads(state)
+
+
+class PartitionCursorStore:
+    """
+    Holds the cursor of each partition of a PerPartitionCursor.
+
+    Without limits, a cursor is kept in memory for every partition ever seen. Two optional limits bound the resources used by streams with
+    a huge number of partitions:
+    * max_cursors_in_memory: the cursors of the least recently used partitions are spilled to disk as their state. The cursor is created
+      again from its state when the partition is accessed again.
+    * max_partitions_in_state: the states of the least recently used partitions are compacted into a global state which holds the lowest
+      of their cursor values. Partitions without a state of their own then start from the global state. This might lead to records being
+      synced again for these partitions but the global state never moves past the state of a compacted partition.
+
+    Cursors are only spilled or compacted once all their slices are closed. The global state of the previous sync is kept until the
+    partition router has generated all its partitions as partitions which were compacted during the previous sync rely on it. Note that
+    partitions seen for the first time also start from the global state once it is set.
+    """
+
+    _NO_CURSOR_STATE: Mapping[str, Any] = {}
+
+    def __init__(
+        self,
+        cursor_factory: CursorFactory,
+        max_cursors_in_memory: Optional[int] = None,
+        max_partitions_in_state: Optional[int] = None,
+        spill_directory: Optional[str] = None,
+    ) -> None:
+        """
+        :param cursor_factory: The factory creating the cursor of each partition
+        :param max_cursors_in_memory: The number of cursors kept in memory before spilling cursors to disk. None disables spilling
+        :param max_partitions_in_state: The number of partitions in the state before compacting partitions into the global state. None
+        disables compaction
+        :param spill_directory: The directory in which cursors are spilled. Defaults to the system temporary directory
+        """
+        if max_cursors_in_memory is not None and max_cursors_in_memory < 1:
+            raise ValueError(f"max_cursors_in_memory must be greater than 0 but was {max_cursors_in_memory}")
+        if max_partitions_in_state is not None and max_partitions_in_state < 1:
+            raise ValueError(f"max_partitions_in_state must be greater than 0 but was {max_partitions_in_state}")
+        self._cursor_factory = cursor_factory
+        self._max_cursors_in_memory = max_cursors_in_memory
+        self._max_partitions_in_state = max_partitions_in_state
+        self._spill_directory = spill_directory
+        self._cursors: "OrderedDict[str, DeclarativeCursor]" = OrderedDict()
+        self._spilled_states: Optional[_SpilledCursorStates] = None
+        self._partitions_in_use: Dict[str, int] = {}
+        self._previous_sync_global_state: Optional[StreamState] = None
+        self._compacted_state: Optional[StreamState] = None
+        self._comparison_cursor: Optional[DeclarativeCursor] = None
+
+    def __len__(self) -> int:
+        return len(self._cursors) + (len(self._spilled_states) if self._spilled_states else 0)
+
+    @property
+    def global_state(self) -> Optional[StreamState]:
+        """
+        The state of the partitions which were compacted or None if no partition was compacted
+        """
+        return self._lowest_state(self._previous_sync_global_state, self._compacted_state)
+
+    def set_global_state(self, global_state: StreamState) -> None:
+        self._previous_sync_global_state = global_state
+
+    def add(self, partition_key: str, cursor_state: StreamState) -> None:
+        """
+        Add a partition with its state from the previous sync
+        """
+        if (
+            self._max_cursors_in_memory is not None
+            and len(self._cursors) >= self._max_cursors_in_memory
+            and partition_key not in self._cursors
+        ):
+            # There is no need to create a cursor that would be spilled right away
+            self._get_spilled_states().put(partition_key, cursor_state)
+        else:
+            self._cursors[partition_key] = self._create_cursor(cursor_state)
+        self._compact()
+
+    def get(self, partition_key: str) -> Optional[DeclarativeCursor]:
+        cursor = self._cursors.get(partition_key)
+        if cursor is not None:
+            if self._max_cursors_in_memory is not None:
+                self._cursors.move_to_end(partition_key)
+            return cursor
+
+        spilled_state = self._spilled_states.pop(partition_key) if self._spilled_states else None
+        if spilled_state is None:
+            return None
+        cursor = self._create_cursor(spilled_state)
+        self._cursors[partition_key] = cursor
+        self._spill()
+        return cursor
+
+    def get_or_create(self, partition_key: str) -> DeclarativeCursor:
+        cursor = self.get(partition_key)
+        if cursor is None:
+            cursor = self._create_cursor(self.global_state or self._NO_CURSOR_STATE)
+            self._cursors[partition_key] = cursor
+            self._spill()
+            self._compact()
+        return cursor
+
+    def acquire(self, partition_key: str) -> None:
+        """
+        Prevent the cursor of the partition from being spilled or compacted until it is released
+        """
+        self._partitions_in_use[partition_key] = self._partitions_in_use.get(partition_key, 0) + 1
+
+    def release(self, partition_key: str) -> None:
+        usage_count = self._partitions_in_use[partition_key] - 1
+        if usage_count:
+            self._partitions_in_use[partition_key] = usage_count
+        else:
+            del self._partitions_in_use[partition_key]
+            self._spill()
+            self._compact()
+
+    def on_all_partitions_generated(self) -> None:
+        """
+        All the partitions relying on the global state of the previous sync have been generated and got a state of their own, the global
+        state of the previous sync is therefore not needed anymore if partitions were compacted during this sync.
+        """
+        if self._compacted_state is not None:
+            self._previous_sync_global_state = None
+
+    def states(self) -> Iterator[Tuple[str, StreamState]]:
+        for partition_key, cursor in self._cursors.items():
+            yield partition_key, cursor.get_stream_state()
+        if self._spilled_states:
+            yield from self._spilled_states.items()
+
+    def _create_cursor(self, cursor_state: Any) -> DeclarativeCursor:
+        cursor = self._cursor_factory.create()
+        cursor.set_initial_state(cursor_state)
+        return cursor
+
+    def _get_spilled_states(self) -> _SpilledCursorStates:
+        if self._spilled_states is None:
+            self._spilled_states = _SpilledCursorStates(self._spill_directory)
+        return self._spilled_states
+
+    def _least_recently_used_partition_not_in_use(self) -> Optional[str]:
+        return next((partition_key for partition_key in self._cursors if partition_key not in self._partitions_in_use), None)
+
+    def _spill(self) -> None:
+        if self._max_cursors_in_memory is None:
+            return
+        while len(self._cursors) > self._max_cursors_in_memory:
+            partition_key = self._least_recently_used_partition_not_in_use()
+            if partition_key is None:
+                return
+            self._get_spilled_states().put(partition_key, self._cursors.pop(partition_key).get_stream_state())
+
+    def _compact(self) -> None:
+        if self._max_partitions_in_state is None:
+            return
+        while len(self) > self._max_partitions_in_state:
+            spilled = self._spilled_states.pop_oldest() if self._spilled_states else None
+            if spilled is not None:
+                state = spilled[1]
+            else:
+                partition_key = self._least_recently_used_partition_not_in_use()
+                if partition_key is None:
+                    return
+                state = self._cursors.pop(partition_key).get_stream_state()
+            if state:
+                # Partitions without state will start from the global state which is fine as they did not have any record until now
+                self._compacted_state = self._lowest_state(self._compacted_state, state)
+
+    def _lowest_state(self, first: Optional[StreamState], second: Optional[StreamState]) -> Optional[StreamState]:
+        if not first:
+            return second or None
+        if not second:
+            return first
+        if self._comparison_cursor is None:
+            self._comparison_cursor = self._cursor_factory.create()
+        # States are compared as records as cursors only know how to compare records
+        return second if self._comparison_cursor.is_greater_than_or_equal(Record(first, None), Record(second, None)) else first
+
+
 class PerPartitionCursor(DeclarativeCursor):
     """
     Given a stream has many partitions, it is important to provide a state per partition.
@@ -57,6 +287,10 @@ class PerPartitionCursor(DeclarativeCursor):
     Between record #3 and #4 | Duplication | #1, #2
 
     Therefore, we need to manage state per partition.
+
+    For streams with a huge number of partitions, the number of cursors kept in memory and the number of partitions in the state can be
+    bounded. See PartitionCursorStore for details. When partitions are compacted, the state has a "state" key holding the global state
+    from which partitions without a state of their own start.
     """
 
     _NO_STATE: Mapping[str, Any] = {}
@@ -64,22 +298,40 @@ class PerPartitionCursor(DeclarativeCursor):
     _KEY = 0
     _VALUE = 1
 
-    def __init__(self, cursor_factory: CursorFactory, partition_router: PartitionRouter):
+    def __init__(
+        self,
+        cursor_factory: CursorFactory,
+        partition_router: PartitionRouter,
+        max_cursors_in_memory: Optional[int] = None,
+        max_partitions_in_state: Optional[int] = None,
+        spill_directory: Optional[str] = None,
+    ):
+        """
+        :param cursor_factory: The factory creating the cursor of each partition
+        :param partition_router: The partition router generating the partitions
+        :param max_cursors_in_memory: The number of cursors kept in memory before spilling cursors to disk. None disables spilling
+        :param max_partitions_in_state: The number of partitions in the state before compacting partitions into the global state. None
+        disables compaction
+        :param spill_directory: The directory in which cursors are spilled. Defaults to the system temporary directory
+        """
         self._cursor_factory = cursor_factory
         self._partition_router = partition_router
-        self._cursor_per_partition: MutableMapping[str, DeclarativeCursor] = {}
+        self._cursor_per_partition = PartitionCursorStore(cursor_factory, max_cursors_in_memory, max_partitions_in_state, spill_directory)
         self._partition_serializer = PerPartitionKeySerializer()
 
     def stream_slices(self) -> Iterable[StreamSlice]:
         slices = self._partition_router.stream_slices()
         for partition in slices:
-            cursor = self._cursor_per_partition.get(self._to_partition_key(partition.partition))
-            if not cursor:
-                cursor = self._create_cursor(self._NO_CURSOR_STATE)
-                self._cursor_per_partition[self._to_partition_key(partition.partition)] = cursor
-
-            for cursor_slice in cursor.stream_slices():
-                yield StreamSlice(partition=partition, cursor_slice=cursor_slice)
+            partition_key = self._to_partition_key(partition.partition)
+            # The cursor must stay available until all the slices of the partition are closed
+            self._cursor_per_partition.acquire(partition_key)
+            try:
+                cursor = self._cursor_per_partition.get_or_create(partition_key)
+                for cursor_slice in cursor.stream_slices():
+                    yield StreamSlice(partition=partition, cursor_slice=cursor_slice)
+            finally:
+                self._cursor_per_partition.release(partition_key)
+        self._cursor_per_partition.on_all_partitions_generated()
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         """
@@ -104,12 +356,16 @@ class PerPartitionCursor(DeclarativeCursor):
                             }
                         }
                     ],
+                    "state": {
+                        "last_updated": "2023-05-01T00:00:00Z"
+                    },
                     "parent_state": {
                         "parent_stream_name": {
                             "last_updated": "2023-05-27T00:00:00Z"
                         }
                     }
                 }
+                The "state" key is optional and is only set when partitions were compacted.
         """
         if not stream_state:
             return
@@ -122,20 +378,23 @@ class PerPartitionCursor(DeclarativeCursor):
                 failure_type=FailureType.config_error,
             )
 
+        if stream_state.get("state"):
+            self._cursor_per_partition.set_global_state(stream_state["state"])
+
         for state in stream_state["states"]:
-            self._cursor_per_partition[self._to_partition_key(state["partition"])] = self._create_cursor(state["cursor"])
+            self._cursor_per_partition.add(self._to_partition_key(state["partition"]), state["cursor"])
 
         # Set parent state for partition routers based on parent streams
         self._partition_router.set_initial_state(stream_state)
 
     def observe(self, stream_slice: StreamSlice, record: Record) -> None:
-        self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].observe(
+        self._get_cursor_for_partition(stream_slice.partition).observe(
             StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice), record
         )
 
     def close_slice(self, stream_slice: StreamSlice, *args: Any) -> None:
         try:
-            self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].close_slice(
+            self._get_cursor_for_partition(stream_slice.partition).close_slice(
                 StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice), *args
             )
         except KeyError as exception:
@@ -146,8 +405,7 @@ class PerPartitionCursor(DeclarativeCursor):
 
     def get_stream_state(self) -> StreamState:
         states = []
-        for partition_tuple, cursor in self._cursor_per_partition.items():
-            cursor_state = cursor.get_stream_state()
+        for partition_tuple, cursor_state in self._cursor_per_partition.states():
             if cursor_state:
                 states.append(
                     {
@@ -157,6 +415,10 @@ class PerPartitionCursor(DeclarativeCursor):
                 )
         state: dict[str, Any] = {"states": states}
 
+        global_state = self._cursor_per_partition.global_state
+        if global_state:
+            state["state"] = global_state
+
         parent_state = self._partition_router.get_stream_state()
         if parent_state:
             state["parent_state"] = parent_state
@@ -169,6 +431,13 @@ class PerPartitionCursor(DeclarativeCursor):
 
         return None
 
+    def _get_cursor_for_partition(self, partition: Mapping[str, Any]) -> DeclarativeCursor:
+        partition_key = self._to_partition_key(partition)
+        cursor = self._cursor_per_partition.get(partition_key)
+        if cursor is None:
+            raise KeyError(partition_key)
+        return cursor
+
     @staticmethod
     def _is_new_state(stream_state: Mapping[str, Any]) -> bool:
         return not bool(stream_state)
@@ -188,11 +457,6 @@ class PerPartitionCursor(DeclarativeCursor):
 
         return self._get_state_for_partition(stream_slice.partition)
 
-    def _create_cursor(self, cursor_state: Any) -> DeclarativeCursor:
-        cursor = self._cursor_factory.create()
-        cursor.set_initial_state(cursor_state)
-        return cursor
-
     def get_request_params(
         self,
         *,
@@ -205,7 +469,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_params(
+            ) | self._get_cursor_for_partition(stream_slice.partition).get_request_params(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -225,7 +489,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_headers(
+            ) | self._get_cursor_for_partition(stream_slice.partition).get_request_headers(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -245,7 +509,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_data(
+            ) | self._get_cursor_for_partition(stream_slice.partition).get_request_body_data(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -265,7 +529,7 @@ class PerPartitionCursor(DeclarativeCursor):
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition=stream_slice.partition, cursor_slice={}),
                 next_page_token=next_page_token,
-            ) | self._cursor_per_partition[self._to_partition_key(stream_slice.partition)].get_request_body_json(
+            ) | self._get_cursor_for_partition(stream_slice.partition).get_request_body_json(
                 stream_state=stream_state,
                 stream_slice=StreamSlice(partition={}, cursor_slice=stream_slice.cursor_slice),
                 next_page_token=next_page_token,
@@ -298,8 +562,7 @@ class PerPartitionCursor(DeclarativeCursor):
     def _get_cursor(self, record: Record) -> DeclarativeCursor:
         if not record.associated_slice:
             raise ValueError("Invalid state as stream slices that are emitted should refer to an existing cursor")
-        partition_key = self._to_partition_key(record.associated_slice.partition)
-        if partition_key not in self._cursor_per_partition:
+        cursor = self._cursor_per_partition.get(self._to_partition_key(record.associated_slice.partition))
+        if cursor is None:
             raise ValueError("Invalid state as stream slices that are emitted should refer to an existing cursor")
-        cursor = self._cursor_per_partition[partition_key]
         return cursor
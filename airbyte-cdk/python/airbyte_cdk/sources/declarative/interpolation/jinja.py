@@ -3,13 +3,15 @@
 #
 
 import ast
-from typing import Any, Mapping, Optional, Tuple, Type
+import threading
+from typing import Any, Callable, FrozenSet, Mapping, Optional, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.types import Config
-from jinja2 import meta
+from cachetools import LRUCache
+from jinja2 import Template, meta
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
 
@@ -27,6 +29,56 @@ class StreamPartitionAccessEnvironment(SandboxedEnvironment):
         return super().is_safe_attribute(obj, attr, value)  # type: ignore  # for some reason, mypy says 'Returning Any from function declared to return "bool"'
 
 
+class CompiledTemplateCache:
+    """
+    Thread-safe LRU cache of compiled Jinja templates and their undeclared variables, keyed by template string.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._cache: LRUCache[str, Tuple[Template, FrozenSet[str]]] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compile(
+        self, template_str: str, compile_template: Callable[[str], Tuple[Template, FrozenSet[str]]]
+    ) -> Tuple[Template, FrozenSet[str]]:
+        with self._lock:
+            compiled = self._cache.get(template_str)
+            if compiled is not None:
+                self._hits += 1
+                return compiled
+            self._misses += 1
+
+        # Compiling is done outside the lock to avoid blocking other threads. In the worst case, a template is compiled more than once
+        compiled = compile_template(template_str)
+        with self._lock:
+            self._cache[template_str] = compiled
+        return compiled
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -61,6 +113,14 @@ class JinjaInterpolation(Interpolation):
     # Please add a unit test to test_jinja.py when adding a restriction.
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
+    # Low-code streams evaluate the same templates for every request, page and record. Compiling them is costly so the compiled
+    # templates are cached. The cache is shared by all instances as they all configure their environment the same way
+    TEMPLATE_CACHE = CompiledTemplateCache(max_size=2048)
+
+    # Characters which are required for a string to be a template. Strings without them are returned as is without going through Jinja.
+    # Strings with line breaks are excluded from this fast path as Jinja normalizes line breaks
+    _TEMPLATE_MARKERS = ("{", "\n", "\r")
+
     def __init__(self) -> None:
         self._environment = StreamPartitionAccessEnvironment()
         self._environment.filters.update(**filters)
@@ -113,14 +173,22 @@ class JinjaInterpolation(Interpolation):
         return result
 
     def _eval(self, s: Optional[str], context: Mapping[str, Any]) -> Optional[str]:
+        if not isinstance(s, str) or not any(marker in s for marker in self._TEMPLATE_MARKERS):
+            # The input is a static value, not a jinja template
+            # It can be returned as is
+            return s
         try:
-            ast = self._environment.parse(s)  # type: ignore # parse is able to handle None
-            undeclared = meta.find_undeclared_variables(ast)
+            template, undeclared = self.TEMPLATE_CACHE.get_or_compile(s, self._compile)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)  # type: ignore # from_string is able to handle None
+            return template.render(context)  # type: ignore # render returns a str
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+    def _compile(self, s: str) -> Tuple[Template, FrozenSet[str]]:
+        ast = self._environment.parse(s)
+        undeclared = frozenset(meta.find_undeclared_variables(ast))
+        return self._environment.from_string(s), undeclared
@@ -617,6 +617,12 @@ class OffsetIncrement(BaseModel):
     inject_on_first_request: Optional[bool] = Field(
         False, description='Using the `offset` with value `0` during the first request', title='Inject Offset'
     )
+    total_records: Optional[str] = Field(
+        None,
+        description='The total number of records across all pages. When it is returned by the API and the retriever sets `concurrent_page_requests`, all the pages after the first one are requested concurrently.',
+        examples=["{{ response['meta']['total'] }}"],
+        title='Total Records',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -634,6 +640,12 @@ class PageIncrement(BaseModel):
         description='Using the `page number` with value defined by `start_from_page` during the first request',
         title='Inject Page Number',
     )
+    total_pages: Optional[str] = Field(
+        None,
+        description='The total number of pages. When it is returned by the API and the retriever sets `concurrent_page_requests`, all the pages after the first one are requested concurrently.',
+        examples=["{{ response['total_pages'] }}"],
+        title='Total Pages',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -948,12 +960,32 @@ class DatetimeBasedCursor(BaseModel):
         examples=['P1D', "P{{ config['lookback_days'] }}D"],
         title='Lookback Window',
     )
+    max_cursors_in_memory: Optional[int] = Field(
+        None,
+        description='Only applies to streams with a partition router. The number of partition cursors kept in memory. The cursors of the least recently used partitions are spilled to disk beyond this number. All the cursors are kept in memory if not set.',
+        examples=[10000],
+        ge=1,
+        title='Maximum Number of Cursors in Memory',
+    )
+    max_partitions_in_state: Optional[int] = Field(
+        None,
+        description='Only applies to streams with a partition router. The number of partitions in the state. The least recently used partitions are compacted into a global state holding their lowest cursor value beyond this number. This might lead to records being synced again for these partitions. All the partitions are kept in the state if not set.',
+        examples=[100000],
+        ge=1,
+        title='Maximum Number of Partitions in State',
+    )
     partition_field_end: Optional[str] = Field(
         None, description='Name of the partition start time field.', examples=['ending_time'], title='Partition Field End'
     )
     partition_field_start: Optional[str] = Field(
         None, description='Name of the partition end time field.', examples=['starting_time'], title='Partition Field Start'
     )
+    spill_directory: Optional[str] = Field(
+        None,
+        description='Only applies to streams with a partition router. The directory in which the cursors beyond `max_cursors_in_memory` are spilled. Defaults to the system temporary directory.',
+        examples=['/tmp'],
+        title='Spill Directory',
+    )
     start_time_option: Optional[RequestOption] = Field(
         None,
         description='Optionally configures how the start datetime will be sent in requests to the source API.',
@@ -1327,6 +1359,16 @@ class SimpleRetriever(BaseModel):
         False,
         description='If true, the partition router and incremental request options will be ignored when paginating requests. Request options set directly on the requester will not be ignored.',
     )
+    page_prefetch_depth: Optional[int] = Field(
+        0,
+        description='The number of pages requested ahead while the records of the current page are processed. Pages are only prefetched when the paginator is a DefaultPaginator whose next page token does not depend on `last_record` or `last_page_size`. Otherwise, or when 0, pages are requested one after the other.',
+        title='Page Prefetch Depth',
+    )
+    concurrent_page_requests: Optional[int] = Field(
+        1,
+        description='The number of pages requested concurrently when the pagination strategy knows the number of pages from the response i.e. an OffsetIncrement with `total_records` or a PageIncrement with `total_pages`. The records are still emitted in the order of the pages. Resumable full refresh streams checkpoint their state after each batch of concurrent pages.',
+        title='Concurrent Page Requests',
+    )
     partition_router: Optional[
         Union[
             CustomPartitionRouter,
@@ -1349,6 +1391,17 @@ class SubstreamPartitionRouter(BaseModel):
         description='Specifies which parent streams are being iterated over and how parent records should be used to partition the child stream data set.',
         title='Parent Stream Configs',
     )
+    stream_parent_records: Optional[bool] = Field(
+        False,
+        description='Emit the partitions as soon as the parent records are read instead of once all the records of the parent slice are read. This allows the child stream to be read while the parent slice is still being read and bounds the memory used for parent slices with many records.',
+        title='Stream Parent Records',
+    )
+    parent_read_concurrency: Optional[int] = Field(
+        1,
+        description='The number of threads reading the parent streams. When greater than 1, parent records are read in the background while the child stream is read and the parent streams are read in parallel. The slices of a single parent stream are always read one after the other.',
+        examples=[1, 4],
+        title='Parent Read Concurrency',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -138,6 +138,7 @@ from airbyte_cdk.sources.declarative.stream_slicers import StreamSlicer
 from airbyte_cdk.sources.declarative.transformations import AddFields, RecordTransformation, RemoveFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.message import InMemoryMessageRepository, LogAppenderMessageRepositoryDecorator, MessageRepository
+from airbyte_cdk.sources.streams.http import AdaptiveConcurrencyLimiter
 from airbyte_cdk.sources.streams.http.error_handlers.response_models import ResponseAction
 from airbyte_cdk.sources.types import Config
 from airbyte_cdk.sources.utils.transform import TypeTransformer
@@ -158,12 +159,15 @@ class ModelToComponentFactory:
         emit_connector_builder_messages: bool = False,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
         self._limit_slices_fetched = limit_slices_fetched
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._disable_retries = disable_retries
+        # The limiter is shared by the requesters of all the streams as they read from the same API
+        self._concurrency_limiter = concurrency_limiter
         self._message_repository = message_repository or InMemoryMessageRepository(  # type: ignore
             self._evaluate_log_level(emit_connector_builder_messages)
         )
@@ -695,6 +699,9 @@ class ModelToComponentFactory:
                     lambda: self._create_component_from_model(model=incremental_sync_model, config=config),
                 ),
                 partition_router=stream_slicer,
+                max_cursors_in_memory=getattr(incremental_sync_model, "max_cursors_in_memory", None),
+                max_partitions_in_state=getattr(incremental_sync_model, "max_partitions_in_state", None),
+                spill_directory=getattr(incremental_sync_model, "spill_directory", None),
             )
         elif model.incremental_sync:
             return self._create_component_from_model(model=model.incremental_sync, config=config) if model.incremental_sync else None
@@ -809,6 +816,7 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
             message_repository=self._message_repository,
             use_cache=model.use_cache,
+            concurrency_limiter=self._concurrency_limiter,
         )
 
     @staticmethod
@@ -954,6 +962,7 @@ class ModelToComponentFactory:
             page_size=model.page_size,
             config=config,
             inject_on_first_request=model.inject_on_first_request or False,
+            total_records=model.total_records,
             parameters=model.parameters or {},
         )
 
@@ -964,6 +973,7 @@ class ModelToComponentFactory:
             config=config,
             start_from_page=model.start_from_page or 0,
             inject_on_first_request=model.inject_on_first_request or False,
+            total_pages=model.total_pages,
             parameters=model.parameters or {},
         )
 
@@ -1115,6 +1125,8 @@ class ModelToComponentFactory:
             cursor=cursor,
             config=config,
             ignore_stream_slicer_parameters_on_paginated_requests=ignore_stream_slicer_parameters_on_paginated_requests,
+            page_prefetch_depth=model.page_prefetch_depth or 0,
+            concurrent_page_requests=model.concurrent_page_requests or 1,
             parameters=model.parameters or {},
         )
 
@@ -1139,7 +1151,10 @@ class ModelToComponentFactory:
                 ]
             )
 
-        return SubstreamPartitionRouter(parent_stream_configs=parent_stream_configs, parameters=model.parameters or {}, config=config)
+        partition_router = SubstreamPartitionRouter(parent_stream_configs=parent_stream_configs, parameters=model.parameters or {}, config=config)
+        partition_router.stream_parent_records = model.stream_parent_records or False
+        partition_router.parent_read_concurrency = model.parent_read_concurrency or 1
+        return partition_router
 
     def _create_message_repository_substream_wrapper(self, model: ParentStreamConfigModel, config: Config) -> Any:
         substream_factory = ModelToComponentFactory(
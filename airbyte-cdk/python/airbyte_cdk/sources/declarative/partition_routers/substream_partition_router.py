@@ -2,7 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from dataclasses import InitVar, dataclass
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import InitVar, dataclass, field
+from queue import Empty, Full, Queue
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Union
 
 import dpath
@@ -41,6 +45,27 @@ class ParentStreamConfig:
         self.partition_field = InterpolatedString.create(self.partition_field, parameters=parameters)
 
 
+@dataclass
+class _ParentSliceRead:
+    """
+    Marks the end of the child slices generated from a parent slice along with the state of the parent stream at that point
+    """
+
+    parent_stream_name: str
+    parent_state: StreamState
+
+
+@dataclass
+class _ParentStreamRead:
+    """
+    Marks the end of the child slices generated from a parent stream read in a background thread
+    """
+
+
+class _ReadCancelled(Exception):
+    pass
+
+
 @dataclass
 class SubstreamPartitionRouter(PartitionRouter):
     """
@@ -49,11 +74,21 @@ class SubstreamPartitionRouter(PartitionRouter):
 
     Attributes:
         parent_stream_configs (List[ParentStreamConfig]): parent streams to iterate over and their config
+        stream_parent_records (bool): Emit the slices as soon as the parent records are read instead of once the whole parent slice is read
+        parent_read_concurrency (int): The number of threads reading the parent streams. When greater than 1, parent records are read in
+            background threads while the child slices are processed and different parent streams are read in parallel. The slices of a
+            parent stream are read one after the other as the components of a stream are not thread-safe
     """
 
     parent_stream_configs: List[ParentStreamConfig]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
+    # Not init fields so that subclasses can still declare fields without default values
+    stream_parent_records: bool = field(init=False, default=False)
+    parent_read_concurrency: int = field(init=False, default=1)
+
+    _PARENT_RECORDS_QUEUE_SIZE = 1_000
+    _QUEUE_TIMEOUT_IN_SECONDS = 0.1
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         if not self.parent_stream_configs:
@@ -118,6 +153,10 @@ class SubstreamPartitionRouter(PartitionRouter):
 
         If a parent slice contains no record, emit a slice with parent_record=None.
 
+        When `incremental_dependency` is set, the state of a parent stream is only updated once all the slices generated from a parent
+        slice are emitted when `stream_parent_records` is set or before they are emitted otherwise. Either way, the parent state is the
+        state of the parent stream after the parent slice was fully read.
+
         The template string can interpolate the following values:
         - parent_stream_slice: mapping representing the parent's stream slice
         - parent_record: mapping representing the parent record
@@ -125,46 +164,122 @@ class SubstreamPartitionRouter(PartitionRouter):
         """
         if not self.parent_stream_configs:
             yield from []
-        else:
+            return
+
+        items = self._read_parent_streams_in_background() if self.parent_read_concurrency > 1 else self._read_parent_streams()
+        for item in items:
+            if isinstance(item, _ParentSliceRead):
+                self._parent_state[item.parent_stream_name] = item.parent_state
+            else:
+                yield item
+
+    def _read_parent_streams(self) -> Iterable[Union[StreamSlice, _ParentSliceRead]]:
+        for parent_stream_config in self.parent_stream_configs:
+            yield from self._read_parent_stream(parent_stream_config, copy_state=False)
+
+    def _read_parent_stream(
+        self, parent_stream_config: ParentStreamConfig, copy_state: bool
+    ) -> Iterable[Union[StreamSlice, _ParentSliceRead]]:
+        """
+        Yield the slices generated from the records of the parent stream. When the parent stream is read incrementally, a _ParentSliceRead
+        is yielded for each parent slice once the state of the parent stream is updated.
+
+        :param copy_state: Copy the state of the parent stream as it is read from another thread and will change while the slices are
+        processed
+        """
+        parent_stream = parent_stream_config.stream
+        parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
+        partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
+        incremental_dependency = parent_stream_config.incremental_dependency
+        for parent_stream_slice in parent_stream.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None):
+            parent_partition = parent_stream_slice.partition if parent_stream_slice else {}
+
+            # we need to read all records for slice to update the parent stream cursor
+            stream_slices_for_parent = []
+
+            # only stream_slice param is used in the declarative stream, stream state is set in PerPartitionCursor set_initial_state
+            for parent_record in parent_stream.read_records(
+                sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
+            ):
+                # Skip non-records (eg AirbyteLogMessage)
+                if isinstance(parent_record, AirbyteMessage):
+                    if parent_record.type == Type.RECORD:
+                        parent_record = parent_record.record.data
+                    else:
+                        continue
+                elif isinstance(parent_record, Record):
+                    parent_record = parent_record.data
+                try:
+                    partition_value = dpath.get(parent_record, parent_field)
+                except KeyError:
+                    pass
+                else:
+                    stream_slice = StreamSlice(
+                        partition={partition_field: partition_value, "parent_slice": parent_partition}, cursor_slice={}
+                    )
+                    if self.stream_parent_records:
+                        yield stream_slice
+                    else:
+                        stream_slices_for_parent.append(stream_slice)
+
+            # update the parent state, as parent stream read all record for current slice and state is already updated
+            if incremental_dependency:
+                yield _ParentSliceRead(parent_stream.name, copy.deepcopy(parent_stream.state) if copy_state else parent_stream.state)
+
+            yield from stream_slices_for_parent
+
+    def _read_parent_streams_in_background(self) -> Iterable[Union[StreamSlice, _ParentSliceRead]]:
+        """
+        Read the parent streams in background threads and yield the items they generate as they come. The queue between the threads is
+        bounded so that parent records are not read much faster than the child slices are processed.
+        """
+        queue: Queue[Any] = Queue(maxsize=self._PARENT_RECORDS_QUEUE_SIZE)
+        cancelled = threading.Event()
+
+        def put(item: Any) -> None:
+            while True:
+                if cancelled.is_set():
+                    raise _ReadCancelled()
+                try:
+                    queue.put(item, timeout=self._QUEUE_TIMEOUT_IN_SECONDS)
+                    return
+                except Full:
+                    continue
+
+        def read(parent_stream_config: ParentStreamConfig) -> None:
+            try:
+                for item in self._read_parent_stream(parent_stream_config, copy_state=True):
+                    put(item)
+                put(_ParentStreamRead())
+            except _ReadCancelled:
+                pass
+            except Exception as exception:
+                # The exception is raised from the thread consuming the slices as exceptions from the executor are never checked
+                try:
+                    put(exception)
+                except _ReadCancelled:
+                    pass
+
+        executor = ThreadPoolExecutor(max_workers=self.parent_read_concurrency, thread_name_prefix="substream_partition_router")
+        try:
             for parent_stream_config in self.parent_stream_configs:
-                parent_stream = parent_stream_config.stream
-                parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
-                partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
-                incremental_dependency = parent_stream_config.incremental_dependency
-                for parent_stream_slice in parent_stream.stream_slices(
-                    sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None
-                ):
-                    parent_partition = parent_stream_slice.partition if parent_stream_slice else {}
-
-                    # we need to read all records for slice to update the parent stream cursor
-                    stream_slices_for_parent = []
-
-                    # only stream_slice param is used in the declarative stream, stream state is set in PerPartitionCursor set_initial_state
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
-                        # Skip non-records (eg AirbyteLogMessage)
-                        if isinstance(parent_record, AirbyteMessage):
-                            if parent_record.type == Type.RECORD:
-                                parent_record = parent_record.record.data
-                            else:
-                                continue
-                        elif isinstance(parent_record, Record):
-                            parent_record = parent_record.data
-                        try:
-                            partition_value = dpath.get(parent_record, parent_field)
-                        except KeyError:
-                            pass
-                        else:
-                            stream_slices_for_parent.append(
-                                StreamSlice(partition={partition_field: partition_value, "parent_slice": parent_partition}, cursor_slice={})
-                            )
-
-                    # update the parent state, as parent stream read all record for current slice and state is already updated
-                    if incremental_dependency:
-                        self._parent_state[parent_stream.name] = parent_stream.state
-
-                    yield from stream_slices_for_parent
+                executor.submit(read, parent_stream_config)
+
+            parent_streams_to_read = len(self.parent_stream_configs)
+            while parent_streams_to_read:
+                try:
+                    item = queue.get(timeout=self._QUEUE_TIMEOUT_IN_SECONDS)
+                except Empty:
+                    continue
+                if isinstance(item, _ParentStreamRead):
+                    parent_streams_to_read -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=True)
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         """
@@ -17,7 +17,7 @@ from airbyte_cdk.sources.declarative.requesters.request_options.interpolated_req
 )
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod, Requester
 from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
-from airbyte_cdk.sources.streams.http import HttpClient
+from airbyte_cdk.sources.streams.http import AdaptiveConcurrencyLimiter, HttpClient
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler
 from airbyte_cdk.sources.types import Config, StreamSlice, StreamState
 from airbyte_cdk.utils.mapping_helpers import combine_mappings
@@ -39,6 +39,7 @@ class HttpRequester(Requester):
         backoff_strategies (Optional[List[BackoffStrategy]]): List of backoff strategies to use when retrying requests
         config (Config): The user-provided configuration as specified by the source's spec
         use_cache (bool): Indicates that data should be cached for this stream
+        concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Limits the number of requests in flight across the requesters sharing it
     """
 
     name: str
@@ -53,6 +54,7 @@ class HttpRequester(Requester):
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
     use_cache: bool = False
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._url_base = InterpolatedString.create(self.url_base, parameters=parameters)
@@ -83,6 +85,7 @@ class HttpRequester(Requester):
             backoff_strategy=backoff_strategies,
             disable_retries=self.disable_retries,
             message_respository=self.message_repository,
+            concurrency_limiter=self.concurrency_limiter,
         )
 
     def get_authenticator(self) -> DeclarativeAuthenticator:
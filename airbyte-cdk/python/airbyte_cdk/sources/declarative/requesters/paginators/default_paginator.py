@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Mapping, MutableMapping, Optional, Union
+from typing import Any, List, Mapping, MutableMapping, Optional, Union
 
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
@@ -110,6 +110,23 @@ class DefaultPaginator(Paginator):
         else:
             return None
 
+    @property
+    def next_page_token_depends_on_records(self) -> bool:
+        return self.pagination_strategy.next_page_token_depends_on_records
+
+    def get_remaining_page_tokens(self, response: requests.Response) -> Optional[List[Mapping[str, Any]]]:
+        """
+        Called after `next_page_token` returned a token for the page following `response`.
+
+        :return: The next page tokens of all the pages after the current one if the pagination strategy knows the number of pages from the
+        response. Returns None if the pages can't be requested concurrently
+        """
+        if isinstance(self.page_token_option, RequestPath):
+            # The path of the request is based on the state of the paginator which only reflects the last page token
+            return None
+        tokens = self.pagination_strategy.get_remaining_page_tokens(response)
+        return [{"next_page_token": token} for token in tokens] if tokens is not None else None
+
     def path(self) -> Optional[str]:
         if self._token and self.page_token_option and isinstance(self.page_token_option, RequestPath):
             # Replace url base to only return the path
@@ -124,7 +141,7 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> MutableMapping[str, Any]:
-        return self._get_request_options(RequestOptionType.request_parameter)
+        return self._get_request_options(RequestOptionType.request_parameter, next_page_token)
 
     def get_request_headers(
         self,
@@ -133,7 +150,7 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, str]:
-        return self._get_request_options(RequestOptionType.header)
+        return self._get_request_options(RequestOptionType.header, next_page_token)
 
     def get_request_body_data(
         self,
@@ -142,7 +159,7 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_options(RequestOptionType.body_data)
+        return self._get_request_options(RequestOptionType.body_data, next_page_token)
 
     def get_request_body_json(
         self,
@@ -151,7 +168,7 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_options(RequestOptionType.body_json)
+        return self._get_request_options(RequestOptionType.body_json, next_page_token)
 
     def reset(self, reset_value: Optional[Any] = None) -> None:
         if reset_value:
@@ -160,16 +177,20 @@ class DefaultPaginator(Paginator):
             self.pagination_strategy.reset()
         self._token = self.pagination_strategy.initial_token
 
-    def _get_request_options(self, option_type: RequestOptionType) -> MutableMapping[str, Any]:
+    def _get_request_options(
+        self, option_type: RequestOptionType, next_page_token: Optional[Mapping[str, Any]] = None
+    ) -> MutableMapping[str, Any]:
         options = {}
 
+        # The token of the request is used over the state of the paginator so that pages can be requested concurrently
+        token = next_page_token["next_page_token"] if next_page_token and "next_page_token" in next_page_token else self._token
         if (
             self.page_token_option
-            and self._token is not None
+            and token is not None
             and isinstance(self.page_token_option, RequestOption)
             and self.page_token_option.inject_into == option_type
         ):
-            options[self.page_token_option.field_name.eval(config=self.config)] = self._token  # type: ignore # field_name is always cast to an interpolated string
+            options[self.page_token_option.field_name.eval(config=self.config)] = token  # type: ignore # field_name is always cast to an interpolated string
         if self.page_size_option and self.pagination_strategy.get_page_size() and self.page_size_option.inject_into == option_type:
             options[self.page_size_option.field_name.eval(config=self.config)] = self.pagination_strategy.get_page_size()  # type: ignore # field_name is always cast to an interpolated string
         return options
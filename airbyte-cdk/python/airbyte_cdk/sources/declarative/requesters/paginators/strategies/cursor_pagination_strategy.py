@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import re
 from dataclasses import InitVar, dataclass, field
 from typing import Any, Dict, Mapping, Optional, Union
 
@@ -13,6 +14,8 @@ from airbyte_cdk.sources.declarative.interpolation.interpolated_string import In
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
 from airbyte_cdk.sources.types import Config, Record
 
+_RECORDS_INTERPOLATION_VARIABLES = re.compile(r"\b(last_record|last_page_size)\b")
+
 
 @dataclass
 class CursorPaginationStrategy(PaginationStrategy):
@@ -75,6 +78,13 @@ class CursorPaginationStrategy(PaginationStrategy):
         )
         return token if token else None
 
+    @property
+    def next_page_token_depends_on_records(self) -> bool:
+        templates = [self._cursor_value.string]
+        if self._stop_condition:
+            templates.append(str(self._stop_condition.condition))
+        return any(_RECORDS_INTERPOLATION_VARIABLES.search(template) for template in templates)
+
     def reset(self, reset_value: Optional[Any] = None) -> None:
         self._initial_cursor = reset_value
 
@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Mapping, Optional, Union
+from typing import Any, List, Mapping, Optional, Union
 
 import requests
 from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder
@@ -32,8 +32,15 @@ class OffsetIncrement(PaginationStrategy):
           type: OffsetIncrement
           page_size: "{{ parameters['items_per_page'] }}"
 
+        # all the pages after the first one can be requested concurrently when the response holds the total number of records
+        pagination_strategy:
+          type: OffsetIncrement
+          page_size: 100
+          total_records: "{{ response['meta']['total'] }}"
+
     Attributes:
         page_size (InterpolatedString): the number of records to request
+        total_records (Optional[InterpolatedString]): the total number of records across all pages, evaluated on the responses
     """
 
     config: Config
@@ -41,6 +48,7 @@ class OffsetIncrement(PaginationStrategy):
     parameters: InitVar[Mapping[str, Any]]
     decoder: Decoder = field(default_factory=lambda: JsonDecoder(parameters={}))
     inject_on_first_request: bool = False
+    total_records: Optional[Union[InterpolatedString, str]] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._offset = 0
@@ -49,6 +57,7 @@ class OffsetIncrement(PaginationStrategy):
             self._page_size: Optional[InterpolatedString] = InterpolatedString(page_size, parameters=parameters)
         else:
             self._page_size = None
+        self._total_records = InterpolatedString.create(self.total_records, parameters=parameters) if self.total_records else None
 
     @property
     def initial_token(self) -> Optional[Any]:
@@ -66,6 +75,16 @@ class OffsetIncrement(PaginationStrategy):
             self._offset += last_page_size
             return self._offset
 
+    def get_remaining_page_tokens(self, response: requests.Response) -> Optional[List[Any]]:
+        if not self._total_records or not self._page_size:
+            return None
+        decoded_response = self.decoder.decode(response)
+        total_records = self._total_records.eval(self.config, response=decoded_response)
+        if total_records is None or total_records == "":
+            return None
+        page_size = int(self._page_size.eval(self.config, response=decoded_response))
+        return list(range(self._offset, int(total_records), page_size))
+
     def reset(self, reset_value: Optional[Any] = 0) -> None:
         if not isinstance(reset_value, int):
             raise ValueError(f"Reset value {reset_value} for OffsetIncrement pagination strategy was not an integer")
@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from dataclasses import InitVar, dataclass, field
+from typing import Any, List, Mapping, Optional, Union
 
 import requests
+from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
 from airbyte_cdk.sources.types import Config, Record
@@ -19,6 +20,9 @@ class PageIncrement(PaginationStrategy):
     Attributes:
         page_size (int): the number of records to request
         start_from_page (int): number of the initial page
+        total_pages (Optional[InterpolatedString]): the total number of pages, evaluated on the responses. When set, all the pages after
+            the first one can be requested concurrently
+        decoder (Decoder): decoder to decode the response
     """
 
     config: Config
@@ -26,9 +30,12 @@ class PageIncrement(PaginationStrategy):
     parameters: InitVar[Mapping[str, Any]]
     start_from_page: int = 0
     inject_on_first_request: bool = False
+    total_pages: Optional[Union[InterpolatedString, str]] = None
+    decoder: Decoder = field(default_factory=lambda: JsonDecoder(parameters={}))
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._page = self.start_from_page
+        self._total_pages = InterpolatedString.create(self.total_pages, parameters=parameters) if self.total_pages else None
         if isinstance(self.page_size, int) or (self.page_size is None):
             self._page_size = self.page_size
         else:
@@ -51,6 +58,14 @@ class PageIncrement(PaginationStrategy):
             self._page += 1
             return self._page
 
+    def get_remaining_page_tokens(self, response: requests.Response) -> Optional[List[Any]]:
+        if not self._total_pages:
+            return None
+        total_pages = self._total_pages.eval(self.config, response=self.decoder.decode(response))
+        if total_pages is None or total_pages == "":
+            return None
+        return list(range(self._page, self.start_from_page + int(total_pages)))
+
     def reset(self, reset_value: Optional[Any] = None) -> None:
         if reset_value is None:
             self._page = self.start_from_page
@@ -4,7 +4,7 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import requests
 from airbyte_cdk.sources.types import Record
@@ -33,6 +33,24 @@ class PaginationStrategy:
         """
         pass
 
+    @property
+    def next_page_token_depends_on_records(self) -> bool:
+        """
+        :return: True if the next page token might depend on the records of the page i.e. on `last_page_size` or `last_record`. If False,
+        the next page token can be computed as soon as the response is received without waiting for its records to be processed
+        """
+        return True
+
+    def get_remaining_page_tokens(self, response: requests.Response) -> Optional[List[Any]]:
+        """
+        Called after `next_page_token` returned a token for the page following `response`.
+
+        :param response: response of the current page
+        :return: The tokens of all the pages after the current one, starting with the token returned by `next_page_token`, if the number
+        of pages is known from the response. Those pages can then be requested concurrently. Returns None if the number of pages is unknown
+        """
+        return None
+
     @abstractmethod
     def reset(self, reset_value: Optional[Any] = None) -> None:
         """
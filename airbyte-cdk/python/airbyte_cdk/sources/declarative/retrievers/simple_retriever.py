@@ -2,10 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from functools import partial
 from itertools import islice
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
+from queue import Queue
+from threading import Event, Semaphore
+from typing import Any, Callable, Deque, Generator, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 import requests
 from airbyte_cdk.models import AirbyteMessage
@@ -14,6 +18,7 @@ from airbyte_cdk.sources.declarative.incremental import ResumableFullRefreshCurs
 from airbyte_cdk.sources.declarative.incremental.declarative_cursor import DeclarativeCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.partition_routers.single_partition_router import SinglePartitionRouter
+from airbyte_cdk.sources.declarative.requesters.paginators.default_paginator import DefaultPaginator
 from airbyte_cdk.sources.declarative.requesters.paginators.no_pagination import NoPagination
 from airbyte_cdk.sources.declarative.requesters.paginators.paginator import Paginator
 from airbyte_cdk.sources.declarative.requesters.requester import Requester
@@ -27,6 +32,10 @@ from airbyte_cdk.utils.mapping_helpers import combine_mappings
 FULL_REFRESH_SYNC_COMPLETE_KEY = "__ab_full_refresh_sync_complete"
 
 
+class _PrefetchCancelled(Exception):
+    pass
+
+
 @dataclass
 class SimpleRetriever(Retriever):
     """
@@ -49,6 +58,11 @@ class SimpleRetriever(Retriever):
         stream_slicer (Optional[StreamSlicer]): The stream slicer
         cursor (Optional[cursor]): The cursor
         parameters (Mapping[str, Any]): Additional runtime parameters to be used for string interpolation
+        page_prefetch_depth (int): The number of pages fetched in a background thread while the records of the current page are processed.
+            Pages are only prefetched for DefaultPaginators whose next page token does not depend on the records of the page
+        concurrent_page_requests (int): The number of pages requested concurrently when the pagination strategy of a DefaultPaginator
+            knows the number of pages from the first response. When the stream is read as a resumable full refresh, the state is
+            checkpointed after each batch of `concurrent_page_requests` pages
     """
 
     requester: Requester
@@ -63,6 +77,10 @@ class SimpleRetriever(Retriever):
     stream_slicer: StreamSlicer = field(default_factory=lambda: SinglePartitionRouter(parameters={}))
     cursor: Optional[DeclarativeCursor] = None
     ignore_stream_slicer_parameters_on_paginated_requests: bool = False
+    page_prefetch_depth: int = 0
+    concurrent_page_requests: int = 1
+
+    _PREFETCH_TIMEOUT_IN_SECONDS = 0.1
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._paginator = self.paginator or NoPagination(parameters=parameters)
@@ -292,6 +310,10 @@ class SimpleRetriever(Retriever):
         stream_state: Mapping[str, Any],
         stream_slice: StreamSlice,
     ) -> Iterable[StreamData]:
+        if self._can_prefetch_pages():
+            yield from self._read_prefetched_pages(records_generator_fn, stream_state, stream_slice)
+            return
+
         pagination_complete = False
         next_page_token = None
         while not pagination_complete:
@@ -302,12 +324,139 @@ class SimpleRetriever(Retriever):
                 pagination_complete = True
             else:
                 next_page_token = self._next_page_token(response)
+                if next_page_token and self._can_fetch_pages_concurrently():
+                    next_page_token = yield from self._read_pages_concurrently(
+                        records_generator_fn, stream_state, stream_slice, response, next_page_token
+                    )
                 if not next_page_token:
                     pagination_complete = True
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    def _can_fetch_pages_concurrently(self) -> bool:
+        return self.concurrent_page_requests > 1 and isinstance(self._paginator, DefaultPaginator)
+
+    def _read_pages_concurrently(
+        self,
+        records_generator_fn: Callable[[Optional[requests.Response]], Iterable[StreamData]],
+        stream_state: Mapping[str, Any],
+        stream_slice: StreamSlice,
+        response: requests.Response,
+        next_page_token: Mapping[str, Any],
+        maximum_number_of_pages: Optional[int] = None,
+    ) -> Generator[StreamData, None, Optional[Mapping[str, Any]]]:
+        """
+        Request the pages following `response` concurrently if the paginator knows how many pages there are and yield their records in
+        the order of the pages.
+
+        :param response: The response of the page whose next page token was just computed
+        :param next_page_token: The token of the page following `response`
+        :param maximum_number_of_pages: The maximum number of pages to read. All the remaining pages are read if None
+        :return: The token of the page following the last page read or None if there are no more pages
+        """
+        page_tokens = self._paginator.get_remaining_page_tokens(response)  # type: ignore # only called for DefaultPaginator
+        if not page_tokens:
+            return next_page_token
+
+        last_page_token, last_response = next_page_token, response
+        for last_page_token, last_response in self._fetch_pages_concurrently(
+            stream_state, stream_slice, page_tokens[:maximum_number_of_pages]
+        ):
+            yield from records_generator_fn(last_response)
+            if not last_response:
+                return None
+
+        # Pages might have been added since the number of pages was evaluated so the pagination goes on from the last page read
+        self._paginator.reset(reset_value=last_page_token["next_page_token"])
+        return self._next_page_token(last_response)  # type: ignore # last_response can't be None at this point
+
+    def _fetch_pages_concurrently(
+        self, stream_state: Mapping[str, Any], stream_slice: StreamSlice, page_tokens: List[Mapping[str, Any]]
+    ) -> Iterable[Tuple[Mapping[str, Any], Optional[requests.Response]]]:
+        """
+        Yield the responses of the pages in the order of the tokens while keeping up to `concurrent_page_requests` requests in flight.
+        """
+        remaining_page_tokens = iter(page_tokens)
+        pending_pages: Deque[Tuple[Mapping[str, Any], "Future[Optional[requests.Response]]"]] = deque()
+        with ThreadPoolExecutor(max_workers=self.concurrent_page_requests, thread_name_prefix=f"{self.name}_page_request") as executor:
+
+            def submit_next_page() -> None:
+                for page_token in islice(remaining_page_tokens, 1):
+                    pending_pages.append((page_token, executor.submit(self._fetch_next_page, stream_state, stream_slice, page_token)))
+
+            try:
+                for _ in range(self.concurrent_page_requests):
+                    submit_next_page()
+                while pending_pages:
+                    page_token, page = pending_pages.popleft()
+                    response = page.result()
+                    submit_next_page()
+                    yield page_token, response
+            finally:
+                for _, page in pending_pages:
+                    page.cancel()
+
+    def _can_prefetch_pages(self) -> bool:
+        return (
+            self.page_prefetch_depth > 0
+            and isinstance(self._paginator, DefaultPaginator)
+            and not self._paginator.next_page_token_depends_on_records
+        )
+
+    def _read_prefetched_pages(
+        self,
+        records_generator_fn: Callable[[Optional[requests.Response]], Iterable[StreamData]],
+        stream_state: Mapping[str, Any],
+        stream_slice: StreamSlice,
+    ) -> Iterable[StreamData]:
+        """
+        Fetch the pages in a background thread while the records of the previous pages are processed. As the next page token does not
+        depend on the records, it is computed as soon as a response is received and the next request is sent right away as long as there
+        are less than `page_prefetch_depth` pages waiting to be processed. The paginator is only used by the background thread.
+        """
+        pages: Queue[Any] = Queue()
+        free_slots = Semaphore(self.page_prefetch_depth)
+        cancelled = Event()
+
+        def fetch_pages() -> None:
+            try:
+                next_page_token = None
+                while True:
+                    while not free_slots.acquire(timeout=self._PREFETCH_TIMEOUT_IN_SECONDS):
+                        if cancelled.is_set():
+                            raise _PrefetchCancelled()
+                    if cancelled.is_set():
+                        raise _PrefetchCancelled()
+                    response = self._fetch_next_page(stream_state, stream_slice, next_page_token)
+                    next_page_token = self._next_page_token(response) if response else None
+                    pages.put((response, not next_page_token))
+                    if not next_page_token:
+                        return
+            except _PrefetchCancelled:
+                pass
+            except Exception as exception:
+                # The exception is raised from the thread processing the records as exceptions from the executor are never checked
+                pages.put(exception)
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}_page_prefetch")
+        try:
+            executor.submit(fetch_pages)
+            pagination_complete = False
+            while not pagination_complete:
+                page = pages.get()
+                if isinstance(page, Exception):
+                    raise page
+                response, pagination_complete = page
+                free_slots.release()
+                yield from records_generator_fn(response)
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=True)
+
+        # Always return an empty generator just in case no records were ever yielded
+        yield from []
+
     def _read_page(
         self,
         records_generator_fn: Callable[[Optional[requests.Response]], Iterable[StreamData]],
@@ -320,7 +469,18 @@ class SimpleRetriever(Retriever):
         if not response:
             next_page_token: Mapping[str, Any] = {FULL_REFRESH_SYNC_COMPLETE_KEY: True}
         else:
-            next_page_token = self._next_page_token(response) or {FULL_REFRESH_SYNC_COMPLETE_KEY: True}
+            page_token = self._next_page_token(response)
+            if page_token and self._can_fetch_pages_concurrently():
+                # The state is only checkpointed once the records of the whole batch of pages are read
+                page_token = yield from self._read_pages_concurrently(
+                    records_generator_fn,
+                    stream_state,
+                    stream_slice,
+                    response,
+                    page_token,
+                    maximum_number_of_pages=self.concurrent_page_requests,
+                )
+            next_page_token = page_token or {FULL_REFRESH_SYNC_COMPLETE_KEY: True}
 
         if self.cursor:
             self.cursor.close_slice(StreamSlice(cursor_slice=next_page_token, partition=stream_slice.partition))
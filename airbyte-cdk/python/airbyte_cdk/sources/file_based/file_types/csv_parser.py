@@ -9,7 +9,8 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from functools import partial
 from io import IOBase
-from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 from uuid import uuid4
 
 from airbyte_cdk.models import FailureType
@@ -194,6 +195,7 @@ class CsvParser(FileTypeParser):
         discovered_schema: Optional[Mapping[str, SchemaType]],
     ) -> Iterable[Dict[str, Any]]:
         line_no = 0
+        cast_plan: Optional[_CastPlan] = None
         try:
             config_format = _extract_format(config)
             if discovered_schema:
@@ -201,32 +203,35 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
-            cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
+            cast_plan = CsvParser._get_cast_plan(deduped_property_types, config_format, config.schemaless)
             data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
             for row in data_generator:
                 line_no += 1
                 yield CsvParser._to_nullable(
-                    cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null
+                    cast_plan.cast(row) if cast_plan is not None else row,
+                    deduped_property_types,
+                    config_format.null_values,
+                    config_format.strings_can_be_null,
                 )
         except RecordParseError as parse_err:
             raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no) from parse_err
         finally:
             data_generator.close()
+            if cast_plan is not None:
+                cast_plan.log_invalid_values(logger)
 
     @property
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ
 
     @staticmethod
-    def _get_cast_function(
-        deduped_property_types: Mapping[str, str], config_format: CsvFormat, logger: logging.Logger, schemaless: bool
-    ) -> Callable[[Mapping[str, str]], Mapping[str, str]]:
+    def _get_cast_plan(deduped_property_types: Mapping[str, str], config_format: CsvFormat, schemaless: bool) -> Optional["_CastPlan"]:
         # Only cast values if the schema is provided
         if deduped_property_types and not schemaless:
-            return partial(CsvParser._cast_types, deduped_property_types=deduped_property_types, config_format=config_format, logger=logger)
+            return _CastPlan(deduped_property_types, config_format)
         else:
             # If no schema is provided, yield the rows as they are
-            return _no_cast
+            return None
 
     @staticmethod
     def _to_nullable(
@@ -283,54 +288,90 @@ class CsvParser(FileTypeParser):
 
         If any errors are encountered, the value will be emitted as a string.
         """
-        warnings = []
-        result = {}
-
-        for key, value in row.items():
-            prop_type = deduped_property_types.get(key)
-            cast_value: Any = value
-
-            if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
-                _, python_type = TYPE_PYTHON_MAPPING[prop_type]
-
-                if python_type is None:
-                    if value == "":
-                        cast_value = None
-                    else:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == bool:
-                    try:
-                        cast_value = _value_to_bool(value, config_format.true_values, config_format.false_values)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == dict:
-                    try:
-                        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
-                        cast_value = json.loads(value)
-                    except json.JSONDecodeError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type == list:
-                    try:
-                        cast_value = _value_to_list(value)
-                    except (ValueError, json.JSONDecodeError):
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                elif python_type:
-                    try:
-                        cast_value = _value_to_python_type(value, python_type)
-                    except ValueError:
-                        warnings.append(_format_warning(key, value, prop_type))
-
-                result[key] = cast_value
-
-        if warnings:
+        cast_plan = _CastPlan(deduped_property_types, config_format)
+        result = cast_plan.cast(row)
+        cast_plan.log_invalid_values(logger)
+        return result
+
+
+class _CastPlan:
+    """
+    Casts the values of the rows of a file according to the types defined in the JSON schema.
+
+    The converter of a column only depends on its type so the converters are resolved once per file. The rows of a file all have the same
+    columns in the same order so the values are cast by position and only then zipped with the column names to build the record. Values which
+    can't be cast are counted per column and logged once per column by `log_invalid_values` instead of once per row.
+    """
+
+    def __init__(self, deduped_property_types: Mapping[str, str], config_format: CsvFormat) -> None:
+        self._property_types = deduped_property_types
+        self._converters_by_column = {
+            column: _get_converter(prop_type, config_format)
+            for column, prop_type in deduped_property_types.items()
+            if prop_type in TYPE_PYTHON_MAPPING
+        }
+        self._columns: Optional[List[Any]] = None
+        self._output_columns: Tuple[str, ...] = ()
+        self._select_values: Optional[Callable[[Sequence[Any]], Tuple[Any, ...]]] = None
+        self._converters: Tuple[Optional[Callable[[str], Any]], ...] = ()
+        self._invalid_values_by_column: Dict[str, List[Any]] = {}
+
+    def cast(self, row: Mapping[str, str]) -> Dict[str, Any]:
+        if self._columns is None or len(row) != len(self._columns):
+            # The plan is built on the first row. Rows which do not have the same number of columns are malformed, we build a new plan
+            # for them which will be used until the rows are well-formed again
+            self._build(list(row.keys()))
+
+        values: Iterable[Any] = row.values() if self._select_values is None else self._select_values(tuple(row.values()))
+        try:
+            cast_values = [value if converter is None else converter(value) for converter, value in zip(self._converters, values)]
+        except ValueError:
+            cast_values = self._cast_values_one_by_one(values)
+        return dict(zip(self._output_columns, cast_values))
+
+    def _cast_values_one_by_one(self, values: Iterable[Any]) -> List[Any]:
+        """
+        Slow path used when at least one of the values of the row can't be cast. Values which can't be cast are emitted as is.
+        """
+        cast_values = []
+        for position, (converter, value) in enumerate(zip(self._converters, values)):
+            if converter is None:
+                cast_values.append(value)
+                continue
+            try:
+                cast_values.append(converter(value))
+            except ValueError:
+                self._add_invalid_value(position, value)
+                cast_values.append(value)
+        return cast_values
+
+    def log_invalid_values(self, logger: logging.Logger) -> None:
+        for column, (first_invalid_value, invalid_values_count) in self._invalid_values_by_column.items():
             logger.warning(
-                f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join([w for w in warnings])}",
+                f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: "
+                f"{_format_warning(column, first_invalid_value, self._property_types[column])},n_invalid_values={invalid_values_count}"
             )
-        return result
+        self._invalid_values_by_column = {}
+
+    def _build(self, columns: List[Any]) -> None:
+        self._columns = columns
+        positions = [position for position, column in enumerate(columns) if column in self._converters_by_column]
+        self._output_columns = tuple(columns[position] for position in positions)
+        self._converters = tuple(self._converters_by_column[column] for column in self._output_columns)
+        if len(positions) == len(columns):
+            self._select_values = None
+        elif len(positions) <= 1:
+            self._select_values = lambda values: tuple(values[position] for position in positions)
+        else:
+            self._select_values = itemgetter(*positions)  # type: ignore  # itemgetter returns a tuple when given many positions
+
+    def _add_invalid_value(self, output_position: int, value: Any) -> None:
+        column = self._output_columns[output_position]
+        invalid_values = self._invalid_values_by_column.get(column)
+        if invalid_values is None:
+            self._invalid_values_by_column[column] = [value, 1]
+        else:
+            invalid_values[1] += 1
 
 
 class _TypeInferrer(ABC):
@@ -442,12 +483,34 @@ def _value_to_python_type(value: str, python_type: type) -> Any:
     return python_type(value)
 
 
-def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
-    return f"{key}: value={value},expected_type={expected_type}"
+def _get_converter(prop_type: str, config_format: CsvFormat) -> Optional[Callable[[str], Any]]:
+    """
+    Return the function casting a CSV value to the Python type of `prop_type` or None if the value is emitted as is. The function raises a
+    ValueError if the value can't be cast.
+    """
+    _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+    if python_type is None:
+        return _value_to_none
+    elif python_type == bool:
+        return partial(_value_to_bool, true_values=config_format.true_values, false_values=config_format.false_values)
+    elif python_type == dict:
+        # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
+        return json.loads
+    elif python_type == list:
+        return _value_to_list
+    elif python_type == str:
+        return None
+    return python_type
+
+
+def _value_to_none(value: str) -> None:
+    if value == "":
+        return None
+    raise ValueError(f"Value {value} is not a valid null value")
 
 
-def _no_cast(row: Mapping[str, str]) -> Mapping[str, str]:
-    return row
+def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
+    return f"{key}: value={value},expected_type={expected_type}"
 
 
 def _extract_format(config: FileBasedStreamConfig) -> CsvFormat:
@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -22,6 +23,14 @@ from pyarrow import DictionaryArray, Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    DEFAULT_RECORD_BATCH_SIZE = 10_000
+
+    def __init__(self, record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE) -> None:
+        """
+        :param record_batch_size: The maximum number of rows read from the file and converted to records at once. Row groups are read in
+        batches of this size which bounds the memory used when parsing files with huge row groups
+        """
+        self._record_batch_size = record_batch_size
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -70,21 +79,22 @@ class ParquetParser(FileTypeParser):
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 reader = pq.ParquetFile(fp)
                 partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-                for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
+                # The conversion of the values only depends on the type of the column so the converters are selected once per file
+                converters = [ParquetParser._get_value_converter(field.type, parquet_format) for field in reader.schema_arrow]
+                for batch in reader.iter_batches(batch_size=self._record_batch_size):
+                    column_names = batch.schema.names
+                    columns = [
+                        ParquetParser._column_to_python_values(column, converter) for column, converter in zip(batch.columns, converters)
+                    ]
+                    rows = zip(*columns) if columns else itertools.repeat((), batch.num_rows)
+                    for row in rows:
                         line_no += 1
                         yield {
-                            **{
-                                column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                                for column in batch.column_names
-                            },
+                            **dict(zip(column_names, row)),
                             **partition_columns,
                         }
         except Exception as exc:
-            raise RecordParseError(
-                FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{row_group=}, {line_no=}"
-            ) from exc
+            raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{line_no=}") from exc
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -109,49 +119,65 @@ class ParquetParser(FileTypeParser):
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        if parquet_value.as_py() is None:
+        python_value = parquet_value.as_py()
+        if python_value is None:
             return None
+        converter = ParquetParser._get_value_converter(parquet_value.type, parquet_format)
+        return converter(python_value) if converter else python_value
+
+    @staticmethod
+    def _column_to_python_values(column: pa.Array, converter: Optional[Callable[[Any], Any]]) -> List[Any]:
+        """
+        Convert a whole pyarrow column to values that can be output by the source. This is a lot faster than converting each scalar of
+        the column as the conversion to Python objects is done by pyarrow.
+        """
+        python_values = column.to_pylist()
+        if converter is None:
+            return python_values
+        return [None if value is None else converter(value) for value in python_values]
 
+    @staticmethod
+    def _get_value_converter(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the non-null Python values of a pyarrow type to values that can be output by the source or None if
+        the Python values can be output as is.
+        """
         # Convert date and datetime objects to isoformat strings
-        if pa.types.is_time(parquet_value.type) or pa.types.is_timestamp(parquet_value.type) or pa.types.is_date(parquet_value.type):
-            return parquet_value.as_py().isoformat()
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return lambda value: value.isoformat()
 
         # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
 
         # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
 
-        if pa.types.is_decimal(parquet_value.type):
+        if pa.types.is_decimal(parquet_type):
             if parquet_format.decimal_as_float:
-                return parquet_value.as_py()
+                return None
             else:
-                return str(parquet_value.as_py())
+                return str
 
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
-
-        if pa.types.is_null(parquet_value.type):
-            return None
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            if parquet_type.unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif parquet_type.unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif parquet_type.unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif parquet_type.unit == "ns":
+                return lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
-        else:
-            return parquet_value.as_py()
+                raise ValueError(f"Unknown duration unit: {parquet_type.unit}")
+
+        # Null values are never converted so pa.null() values do not need a converter either
+        return None
 
     @staticmethod
     def _dictionary_array_to_python_value(parquet_value: DictionaryArray) -> Dict[str, Any]:
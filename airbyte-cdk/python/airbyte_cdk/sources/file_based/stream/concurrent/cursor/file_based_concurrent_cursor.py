@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import heapq
 import logging
+import time
 from datetime import datetime, timedelta
 from threading import RLock
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, MutableMapping, Optional, Tuple
@@ -29,6 +31,8 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
     CURSOR_FIELD = "_ab_source_file_last_modified"
     DEFAULT_DAYS_TO_SYNC_IF_HISTORY_IS_FULL = DefaultFileBasedCursor.DEFAULT_DAYS_TO_SYNC_IF_HISTORY_IS_FULL
     DEFAULT_MAX_HISTORY_SIZE = 10_000
+    DEFAULT_STATE_EMISSION_INTERVAL = timedelta(seconds=5)
+    DEFAULT_FILES_BETWEEN_STATE_EMISSIONS = 1_000
     DATE_TIME_FORMAT = DefaultFileBasedCursor.DATE_TIME_FORMAT
     zero_value = datetime.min
     zero_cursor_value = f"0001-01-01T00:00:00.000000Z_{_NULL_FILE}"
@@ -42,7 +46,17 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
         message_repository: MessageRepository,
         connector_state_manager: ConnectorStateManager,
         cursor_field: CursorField,
+        state_emission_interval: Optional[timedelta] = DEFAULT_STATE_EMISSION_INTERVAL,
+        files_between_state_emissions: Optional[int] = DEFAULT_FILES_BETWEEN_STATE_EMISSIONS,
     ) -> None:
+        """
+        Each state message holds the whole history so emitting one after every synced file is costly when syncing many small files. A
+        state message is emitted after a file is added if either the state emission interval elapsed or the number of files added reached
+        files_between_state_emissions since the last state message. The state is always emitted when the stream is done.
+
+        :param state_emission_interval: The time after which the state is emitted. None disables the time based emission
+        :param files_between_state_emissions: The number of files after which the state is emitted. None disables the count based emission
+        """
         super().__init__()
         self._stream_name = stream_name
         self._stream_namespace = stream_namespace
@@ -57,6 +71,14 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
         self._pending_files_lock = RLock()
         self._pending_files: Optional[Dict[str, RemoteFile]] = None
         self._file_to_datetime_history = stream_state.get("history", {}) if stream_state else {}
+        # Min-heap of (last_modified, uri) used to find the earliest file of the history without scanning it. Entries of files which have
+        # since been updated or removed from the history are stale and skipped lazily
+        self._history_heap: List[Tuple[str, str]] = [(last_modified, uri) for uri, last_modified in self._file_to_datetime_history.items()]
+        heapq.heapify(self._history_heap)
+        self._state_emission_interval_in_seconds = state_emission_interval.total_seconds() if state_emission_interval is not None else None
+        self._files_between_state_emissions = files_between_state_emissions
+        self._files_added_since_last_state_emission = 0
+        self._last_state_emission_time = time.monotonic()
         self._prev_cursor_value = self._compute_prev_sync_cursor(stream_state)
         self._sync_start = self._compute_start_time()
 
@@ -108,12 +130,30 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def _compute_earliest_file_in_history(self) -> Optional[RemoteFile]:
         with self._state_lock:
-            if self._file_to_datetime_history:
-                filename, last_modified = min(self._file_to_datetime_history.items(), key=lambda f: (f[1], f[0]))
+            self._discard_stale_history_heap_entries()
+            if self._history_heap:
+                last_modified, filename = self._history_heap[0]
                 return RemoteFile(uri=filename, last_modified=datetime.strptime(last_modified, self.DATE_TIME_FORMAT))
             else:
                 return None
 
+    def _discard_stale_history_heap_entries(self) -> None:
+        while self._history_heap:
+            last_modified, filename = self._history_heap[0]
+            if self._file_to_datetime_history.get(filename) == last_modified:
+                return
+            heapq.heappop(self._history_heap)
+
+    def _add_to_history(self, filename: str, last_modified: str) -> None:
+        if self._file_to_datetime_history.get(filename) == last_modified:
+            return
+        self._file_to_datetime_history[filename] = last_modified
+        heapq.heappush(self._history_heap, (last_modified, filename))
+        if len(self._history_heap) > 2 * self.DEFAULT_MAX_HISTORY_SIZE:
+            # Files re-synced because they were modified leave stale entries behind. Rebuilding the heap bounds its size
+            self._history_heap = [(last_modified, uri) for uri, last_modified in self._file_to_datetime_history.items()]
+            heapq.heapify(self._history_heap)
+
     def add_file(self, file: RemoteFile) -> None:
         """
         Add a file to the cursor. This method is called when a file is processed by the stream.
@@ -135,7 +175,7 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                     )
                 else:
                     self._pending_files.pop(file.uri)
-                self._file_to_datetime_history[file.uri] = file.last_modified.strftime(self.DATE_TIME_FORMAT)
+                self._add_to_history(file.uri, file.last_modified.strftime(self.DATE_TIME_FORMAT))
                 if len(self._file_to_datetime_history) > self.DEFAULT_MAX_HISTORY_SIZE:
                     # Get the earliest file based on its last modified date and its uri
                     oldest_file = self._compute_earliest_file_in_history()
@@ -145,7 +185,20 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                         raise Exception(
                             "The history is full but there is no files in the history. This should never happen and might be indicative of a bug in the CDK."
                         )
-                self.emit_state_message()
+                self._files_added_since_last_state_emission += 1
+                if self._should_emit_state():
+                    self.emit_state_message()
+
+    def _should_emit_state(self) -> bool:
+        if (
+            self._files_between_state_emissions is not None
+            and self._files_added_since_last_state_emission >= self._files_between_state_emissions
+        ):
+            return True
+        return (
+            self._state_emission_interval_in_seconds is not None
+            and time.monotonic() - self._last_state_emission_time >= self._state_emission_interval_in_seconds
+        )
 
     def emit_state_message(self) -> None:
         with self._state_lock:
@@ -157,6 +210,8 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
             )
             state_message = self._connector_state_manager.create_state_message(self._stream_name, self._stream_namespace)
             self._message_repository.emit_message(state_message)
+            self._files_added_since_last_state_emission = 0
+            self._last_state_emission_time = time.monotonic()
 
     def _get_new_cursor_value(self) -> str:
         with self._pending_files_lock:
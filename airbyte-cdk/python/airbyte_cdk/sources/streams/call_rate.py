@@ -6,15 +6,17 @@ import abc
 import dataclasses
 import datetime
 import logging
+import os
+import sqlite3
 import time
 from datetime import timedelta
 from threading import RLock
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, List, Mapping, Optional
 from urllib import parse
 
 import requests
 import requests_cache
-from pyrate_limiter import InMemoryBucket, Limiter
+from pyrate_limiter import AbstractBucket, InMemoryBucket, Limiter
 from pyrate_limiter import Rate as PyRateRate
 from pyrate_limiter import RateItem, TimeClock
 from pyrate_limiter.exceptions import BucketFullException
@@ -339,6 +341,132 @@ class MovingWindowCallRatePolicy(BaseCallRatePolicy):
         #     ts = call_reset_ts.timestamp()
 
 
+class SharedSQLiteBucket(AbstractBucket):
+    """
+    PyRateLimiter bucket which items are stored in a SQLite database so that several processes using the same database file and bucket
+    name share the same call budget.
+
+    Checking the available space and adding the item is done in a single write transaction so that processes can't both take the last
+    call. Items are stored one row per unit of weight with the timestamp from the clock of the limiter which is the wall clock by default.
+    """
+
+    _BUSY_TIMEOUT_IN_SECONDS = 60
+
+    def __init__(self, rates: List[PyRateRate], database_path: str, bucket_name: str):
+        """
+        :param rates: list of rates, the order is important and must be ascending
+        :param database_path: path of the SQLite database file shared by the processes
+        :param bucket_name: name identifying the budget in the database as one database can hold several budgets
+        """
+        self.rates = rates
+        self._database_path = database_path
+        self._bucket_name = bucket_name
+        self._lock = RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+    def put(self, item: RateItem) -> bool:
+        with self._lock:
+            connection = self._get_connection()
+            # BEGIN IMMEDIATE takes the database write lock so that the count and the insert are atomic across processes
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for rate in self.rates:
+                    (count,) = connection.execute(
+                        "SELECT COUNT(*) FROM call_rate_items WHERE bucket_name = ? AND item_timestamp > ?",
+                        (self._bucket_name, item.timestamp - rate.interval),
+                    ).fetchone()
+                    if rate.limit - count < item.weight:
+                        self.failing_rate = rate
+                        connection.execute("ROLLBACK")
+                        return False
+                connection.executemany(
+                    "INSERT INTO call_rate_items (bucket_name, item_timestamp) VALUES (?, ?)",
+                    [(self._bucket_name, item.timestamp)] * item.weight,
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            self.failing_rate = None
+            return True
+
+    def leak(self, current_timestamp: Optional[int] = None) -> int:
+        assert current_timestamp is not None
+        with self._lock:
+            cursor = self._get_connection().execute(
+                "DELETE FROM call_rate_items WHERE bucket_name = ? AND item_timestamp <= ?",
+                (self._bucket_name, current_timestamp - self.rates[-1].interval),
+            )
+            return cursor.rowcount
+
+    def flush(self) -> None:
+        with self._lock:
+            self._get_connection().execute("DELETE FROM call_rate_items WHERE bucket_name = ?", (self._bucket_name,))
+            self.failing_rate = None
+
+    def count(self) -> int:
+        with self._lock:
+            (count,) = (
+                self._get_connection()
+                .execute("SELECT COUNT(*) FROM call_rate_items WHERE bucket_name = ?", (self._bucket_name,))
+                .fetchone()
+            )
+            return int(count)
+
+    def peek(self, index: int) -> Optional[RateItem]:
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT item_timestamp FROM call_rate_items WHERE bucket_name = ? ORDER BY item_timestamp DESC LIMIT 1 OFFSET ?",
+                    (self._bucket_name, index),
+                )
+                .fetchone()
+            )
+            return RateItem(self._bucket_name, row[0]) if row else None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # SQLite connections must not be used across a fork so a forked process opens its own connection
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self._database_path, timeout=self._BUSY_TIMEOUT_IN_SECONDS, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS call_rate_items (bucket_name TEXT NOT NULL, item_timestamp INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS call_rate_items_bucket_name_item_timestamp ON call_rate_items (bucket_name, item_timestamp)"
+            )
+            self._connection_pid = os.getpid()
+        return self._connection
+
+
+class SharedMovingWindowCallRatePolicy(MovingWindowCallRatePolicy):
+    """
+    MovingWindowCallRatePolicy which calls are counted in a SQLite database instead of the process memory. All the processes using the
+    same database file and bucket name share the budget, for example several syncs of the same account running on the same host.
+    """
+
+    def __init__(self, rates: list[Rate], matchers: list[RequestMatcher], database_path: str, bucket_name: str):
+        """Constructor
+
+        :param rates: list of rates, the order is important and must be ascending
+        :param matchers:
+        :param database_path: path of the SQLite database file shared by the processes
+        :param bucket_name: name identifying the budget in the database
+        """
+        if not rates:
+            raise ValueError("The list of rates can not be empty")
+        pyrate_rates = [PyRateRate(limit=rate.limit, interval=int(rate.interval.total_seconds() * 1000)) for rate in rates]
+        self._bucket = SharedSQLiteBucket(pyrate_rates, database_path, bucket_name)
+        # Limiter will create the background task that clears old requests in the bucket
+        self._limiter = Limiter(self._bucket)
+        # MovingWindowCallRatePolicy.__init__ is not called as it would create an in-memory bucket with its own cleaning task
+        BaseCallRatePolicy.__init__(self, matchers=matchers)
+
+
 class AbstractAPIBudget(abc.ABC):
     """Interface to some API where a client allowed to have N calls per T interval.
 
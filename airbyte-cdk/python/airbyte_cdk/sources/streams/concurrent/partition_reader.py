@@ -1,10 +1,13 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import sys
 from queue import Queue
+from typing import Any, List, Mapping, Optional
 
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 
 
@@ -15,11 +18,19 @@ class PartitionReader:
 
     _IS_SUCCESSFUL = True
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(self, queue: Queue[QueueItem], max_records_per_batch: int = 1, max_bytes_per_batch: Optional[int] = None) -> None:
         """
         :param queue: The queue to put the records in.
+        :param max_records_per_batch: The maximum number of records put in the queue as a single RecordBatch. When set to 1 and no byte
+        limit is set, records are put in the queue one by one.
+        :param max_bytes_per_batch: The approximate maximum size of a RecordBatch in bytes. A batch is flushed as soon as either limit is
+        reached.
         """
+        if max_records_per_batch < 1:
+            raise ValueError(f"max_records_per_batch must be greater than 0 but was {max_records_per_batch}")
         self._queue = queue
+        self._max_records_per_batch = max_records_per_batch
+        self._max_bytes_per_batch = max_bytes_per_batch
 
     def process_partition(self, partition: Partition) -> None:
         """
@@ -34,9 +45,46 @@ class PartitionReader:
         :return: None
         """
         try:
-            for record in partition.read():
-                self._queue.put(record)
+            if self._is_batching():
+                self._process_partition_in_batches(partition)
+            else:
+                for record in partition.read():
+                    self._queue.put(record)
             self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
         except Exception as e:
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _is_batching(self) -> bool:
+        return self._max_records_per_batch > 1 or self._max_bytes_per_batch is not None
+
+    def _process_partition_in_batches(self, partition: Partition) -> None:
+        """
+        Records read before an exception is raised are still flushed to the queue so that the main thread sees the same records it would
+        have seen without batching.
+        """
+        stream_name = partition.stream_name()
+        batch: List[Record] = []
+        batch_size_in_bytes = 0
+        try:
+            for record in partition.read():
+                batch.append(record)
+                if self._max_bytes_per_batch is not None:
+                    batch_size_in_bytes += self._estimate_size_in_bytes(record.data)
+                if len(batch) >= self._max_records_per_batch or (
+                    self._max_bytes_per_batch is not None and batch_size_in_bytes >= self._max_bytes_per_batch
+                ):
+                    self._queue.put(RecordBatch(batch, stream_name))
+                    batch = []
+                    batch_size_in_bytes = 0
+        finally:
+            if batch:
+                self._queue.put(RecordBatch(batch, stream_name))
+
+    @staticmethod
+    def _estimate_size_in_bytes(data: Mapping[str, Any]) -> int:
+        """
+        Shallow estimation of the memory used by a record. Nested values are not traversed as the goal is to bound the memory held by a
+        batch, not to compute an exact size.
+        """
+        return sys.getsizeof(data) + sum(sys.getsizeof(value) for value in data.values())
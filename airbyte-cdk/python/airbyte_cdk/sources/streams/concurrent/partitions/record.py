@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Mapping
+from typing import Any, List, Mapping
 
 
 class Record:
@@ -21,3 +21,24 @@ class Record:
 
     def __repr__(self) -> str:
         return f"Record(data={self.data}, stream_name={self.stream_name})"
+
+
+class RecordBatch:
+    """
+    Represents records read from a single partition that are handed over to the main thread as one queue item.
+    """
+
+    def __init__(self, records: List[Record], stream_name: str):
+        self.records = records
+        self.stream_name = stream_name
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RecordBatch):
+            return False
+        return self.records == other.records and self.stream_name == other.stream_name
+
+    def __repr__(self) -> str:
+        return f"RecordBatch(records={self.records}, stream_name={self.stream_name})"
@@ -4,8 +4,10 @@
 
 import inspect
 import logging
+import time
 import typing
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
@@ -160,6 +162,11 @@ class Stream(ABC):
             logger=logger, cursor_field=cursor_field, sync_mode=sync_mode, stream_state=stream_state
         )
 
+        checkpoint_interval = self.state_checkpoint_interval
+        checkpoint_time_interval = self.state_checkpoint_time_interval
+        checkpoint_time_interval_in_seconds = checkpoint_time_interval.total_seconds() if checkpoint_time_interval is not None else None
+        last_checkpoint_time = time.monotonic()
+
         next_slice = checkpoint_reader.next()
         record_counter = 0
         while next_slice is not None:
@@ -191,11 +198,21 @@ class Stream(ABC):
                         self._observe_state(checkpoint_reader, self.get_updated_state(stream_state, record_data))
                     record_counter += 1
 
-                    checkpoint_interval = self.state_checkpoint_interval
-                    checkpoint = checkpoint_reader.get_checkpoint()
-                    if checkpoint_interval and record_counter % checkpoint_interval == 0 and checkpoint is not None:
-                        airbyte_state_message = self._checkpoint_state(checkpoint, state_manager=state_manager)
-                        yield airbyte_state_message
+                    # The checkpoint is only computed when a state message might be emitted as computing it can be expensive e.g. for
+                    # cursors with many partitions
+                    if (
+                        checkpoint_interval
+                        and record_counter % checkpoint_interval == 0
+                        and (
+                            checkpoint_time_interval_in_seconds is None
+                            or time.monotonic() - last_checkpoint_time >= checkpoint_time_interval_in_seconds
+                        )
+                    ):
+                        checkpoint = checkpoint_reader.get_checkpoint()
+                        if checkpoint is not None:
+                            airbyte_state_message = self._checkpoint_state(checkpoint, state_manager=state_manager)
+                            yield airbyte_state_message
+                            last_checkpoint_time = time.monotonic()
 
                     if internal_config.is_limit_reached(record_counter):
                         break
@@ -204,6 +221,7 @@ class Stream(ABC):
             if checkpoint_state is not None:
                 airbyte_state_message = self._checkpoint_state(checkpoint_state, state_manager=state_manager)
                 yield airbyte_state_message
+                last_checkpoint_time = time.monotonic()
 
             next_slice = checkpoint_reader.next()
 
@@ -371,6 +389,17 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def state_checkpoint_time_interval(self) -> Optional[timedelta]:
+        """
+        The minimum time between two STATE messages emitted because `state_checkpoint_interval` records were read. When it is not
+        elapsed, the state is not checkpointed until the next multiple of `state_checkpoint_interval` records is reached. The state
+        is still checkpointed at the end of every slice.
+
+        return None to checkpoint the state every `state_checkpoint_interval` records regardless of the time elapsed.
+        """
+        return None
+
     @deprecated(version="0.1.49", reason="You should use explicit state property instead, see IncrementalMixin docs.")
     def get_updated_state(
         self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]
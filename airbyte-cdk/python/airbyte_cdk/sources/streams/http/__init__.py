@@ -3,8 +3,9 @@
 #
 
 # Initialize Streams Package
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
 from .http_client import HttpClient
 from .http import HttpStream, HttpSubStream
 from .exceptions import UserDefinedBackoffException
 
-__all__ = ["HttpClient", "HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
+__all__ = ["AdaptiveConcurrencyLimiter", "HttpClient", "HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
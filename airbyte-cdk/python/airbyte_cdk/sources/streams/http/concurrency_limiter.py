@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import email.utils
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import requests
+
+logger = logging.getLogger("airbyte")
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimiterStats:
+    """
+    Snapshot of the counters of an AdaptiveConcurrencyLimiter
+    """
+
+    concurrency_limit: int
+    in_flight_requests: int
+    requests: int
+    throttled_responses: int
+    concurrency_decreases: int
+    concurrency_increases: int
+    seconds_waiting_for_slot: float
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of requests in flight across all the threads sharing this limiter using additive increase/multiplicative decrease
+    (AIMD):
+    * When a response is throttled (HTTP 429 or an error with a Retry-After header), the concurrency limit is multiplied by
+      `decrease_factor`. Requests that were already in flight when the limit was decreased do not decrease it again as they were sent
+      under the previous limit.
+    * Once as many responses as the current limit succeeded in a row, the limit is increased by one up to `max_concurrency`.
+    * When a response has a Retry-After header, no request is sent by any thread until the delay is over instead of only the thread which
+      got the response waiting while the others keep sending requests.
+
+    This is meant to be shared by the HttpClients of all the streams reading from the same API.
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1, decrease_factor: float = 0.5) -> None:
+        """
+        :param max_concurrency: The maximum number of requests in flight, which is also the initial limit
+        :param min_concurrency: The number of requests in flight the limit never goes below
+        :param decrease_factor: The factor the limit is multiplied by when a response is throttled
+        """
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError(f"Expected 1 <= min_concurrency <= max_concurrency but got {min_concurrency} and {max_concurrency}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be between 0 and 1 exclusively but was {decrease_factor}")
+        self._max_concurrency = max_concurrency
+        self._min_concurrency = min_concurrency
+        self._decrease_factor = decrease_factor
+        self._condition = threading.Condition()
+        self._concurrency_limit = max_concurrency
+        self._in_flight_requests = 0
+        self._successes_since_last_change = 0
+        self._limit_generation = 0
+        self._paused_until = 0.0
+        self._requests = 0
+        self._throttled_responses = 0
+        self._concurrency_decreases = 0
+        self._concurrency_increases = 0
+        self._seconds_waiting_for_slot = 0.0
+
+    def acquire(self) -> int:
+        """
+        Block until a request can be sent.
+
+        :return: A token to pass to `release` once the response is received
+        """
+        with self._condition:
+            start = time.monotonic()
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self._in_flight_requests >= self._concurrency_limit:
+                    self._condition.wait()
+                else:
+                    break
+            self._seconds_waiting_for_slot += time.monotonic() - start
+            self._in_flight_requests += 1
+            self._requests += 1
+            return self._limit_generation
+
+    def release(self, token: int, response: Optional[requests.Response]) -> None:
+        """
+        :param token: The token returned by `acquire`
+        :param response: The response received or None if the request failed without a response
+        """
+        throttled, retry_after = self._is_throttled(response)
+        with self._condition:
+            self._in_flight_requests -= 1
+            if throttled:
+                self._on_throttled(token, retry_after)
+            elif response is not None and response.ok:
+                self._on_success()
+            self._condition.notify_all()
+
+    def stats(self) -> ConcurrencyLimiterStats:
+        with self._condition:
+            return ConcurrencyLimiterStats(
+                concurrency_limit=self._concurrency_limit,
+                in_flight_requests=self._in_flight_requests,
+                requests=self._requests,
+                throttled_responses=self._throttled_responses,
+                concurrency_decreases=self._concurrency_decreases,
+                concurrency_increases=self._concurrency_increases,
+                seconds_waiting_for_slot=self._seconds_waiting_for_slot,
+            )
+
+    def _on_throttled(self, token: int, retry_after: Optional[float]) -> None:
+        self._throttled_responses += 1
+        self._successes_since_last_change = 0
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        if token == self._limit_generation and self._concurrency_limit > self._min_concurrency:
+            previous_limit = self._concurrency_limit
+            self._concurrency_limit = max(self._min_concurrency, int(self._concurrency_limit * self._decrease_factor))
+            self._limit_generation += 1
+            self._concurrency_decreases += 1
+            logger.info(
+                f"Requests are throttled, decreasing the number of concurrent requests from {previous_limit} to {self._concurrency_limit}"
+            )
+
+    def _on_success(self) -> None:
+        self._successes_since_last_change += 1
+        if self._successes_since_last_change >= self._concurrency_limit and self._concurrency_limit < self._max_concurrency:
+            self._concurrency_limit += 1
+            self._successes_since_last_change = 0
+            self._concurrency_increases += 1
+
+    @staticmethod
+    def _is_throttled(response: Optional[requests.Response]) -> Tuple[bool, Optional[float]]:
+        if response is None or response.ok:
+            return False, None
+        retry_after = AdaptiveConcurrencyLimiter._parse_retry_after(response.headers.get("Retry-After"))
+        return response.status_code == 429 or retry_after is not None, retry_after
+
+    @staticmethod
+    def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """
+        Retry-After is either a number of seconds or an HTTP date
+        """
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
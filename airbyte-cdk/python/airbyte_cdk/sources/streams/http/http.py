@@ -19,6 +19,7 @@ from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrate
 from airbyte_cdk.sources.streams.call_rate import APIBudget, CachedLimiterSession, LimiterSession
 from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
+from airbyte_cdk.sources.streams.http.concurrency_limiter import AdaptiveConcurrencyLimiter
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from requests.auth import AuthBase
@@ -38,8 +39,20 @@ class HttpStream(Stream, ABC):
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
 
-    def __init__(self, authenticator: Optional[AuthBase] = None, api_budget: Optional[APIBudget] = None):
+    def __init__(
+        self,
+        authenticator: Optional[AuthBase] = None,
+        api_budget: Optional[APIBudget] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
+        """
+        :param authenticator: The authenticator of the requests
+        :param api_budget: The call rate limits of the API
+        :param concurrency_limiter: Limits the number of requests in flight. Share the same limiter between the streams reading from the
+        same API so that they back off together when the API throttles them
+        """
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
+        self._concurrency_limiter = concurrency_limiter
         self._session = self.request_session()
         self._session.mount(
             "https://", requests.adapters.HTTPAdapter(pool_connections=MAX_CONNECTION_POOL_SIZE, pool_maxsize=MAX_CONNECTION_POOL_SIZE)
@@ -345,7 +358,13 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request, **request_kwargs)
+        response: Optional[requests.Response] = None
+        concurrency_token = self._concurrency_limiter.acquire() if self._concurrency_limiter else None
+        try:
+            response = self._session.send(request, **request_kwargs)
+        finally:
+            if self._concurrency_limiter:
+                self._concurrency_limiter.release(concurrency_token, response)  # type: ignore # the token is always set when there is a limiter
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
@@ -5,8 +5,9 @@
 import logging
 import os
 import urllib
+import weakref
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import requests
 import requests_cache
@@ -14,6 +15,7 @@ from airbyte_cdk.models import Level
 from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.call_rate import APIBudget, CachedLimiterSession, LimiterSession
+from airbyte_cdk.sources.streams.http.concurrency_limiter import AdaptiveConcurrencyLimiter
 from airbyte_cdk.sources.streams.http.error_handlers import (
     BackoffStrategy,
     DefaultBackoffStrategy,
@@ -68,6 +70,7 @@ class HttpClient:
         error_message_parser: Optional[ErrorMessageParser] = None,
         disable_retries: bool = False,
         message_respository: Optional[MessageRepository] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ):
         self._name = name
         self._api_budget: APIBudget = api_budget or APIBudget(policies=[])
@@ -91,9 +94,11 @@ class HttpClient:
         else:
             self._backoff_strategies = [DefaultBackoffStrategy()]
         self._error_message_parser = error_message_parser or JsonErrorMessageParser()
-        self._request_attempt_count: Dict[requests.PreparedRequest, int] = {}
+        # The requests are weakly referenced so that the attempt count of a request is forgotten once the request is not used anymore
+        self._request_attempt_count: MutableMapping[requests.PreparedRequest, int] = weakref.WeakKeyDictionary()
         self._disable_retries = disable_retries
         self._message_repository = message_respository
+        self._concurrency_limiter = concurrency_limiter
 
     @property
     def cache_filename(self) -> str:
@@ -217,10 +222,7 @@ class HttpClient:
         log_formatter: Optional[Callable[[requests.Response], Any]] = None,
     ) -> requests.Response:
 
-        if request not in self._request_attempt_count:
-            self._request_attempt_count[request] = 1
-        else:
-            self._request_attempt_count[request] += 1
+        self._request_attempt_count[request] = self._request_attempt_count.get(request, 0) + 1
 
         self._logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
@@ -229,10 +231,14 @@ class HttpClient:
         response: Optional[requests.Response] = None
         exc: Optional[requests.RequestException] = None
 
+        concurrency_token = self._concurrency_limiter.acquire() if self._concurrency_limiter else None
         try:
             response = self._session.send(request, **request_kwargs)
         except requests.RequestException as e:
             exc = e
+        finally:
+            if self._concurrency_limiter:
+                self._concurrency_limiter.release(concurrency_token, response)  # type: ignore # the token is always set when there is a limiter
 
         error_resolution: ErrorResolution = self._error_handler.interpret_response(response if response is not None else exc)
 
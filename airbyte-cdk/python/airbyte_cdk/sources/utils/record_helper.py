@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import datetime
-from typing import Any, Mapping
+import os
+import threading
+import time
+from typing import Any, Mapping, Optional
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteTraceMessage
 from airbyte_cdk.models import Type as MessageType
@@ -11,25 +13,101 @@ from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 
+class EmittedAtClock:
+    """
+    Wall clock in milliseconds for the emitted_at value of the records. Reading the time for every record is measurable when millions of
+    records are emitted, so the time is read at most once per tick: a daemon thread marks the value as stale every tick and only the first
+    read after that reads the time again. The thread needs the GIL to tick so the value can lag by a few milliseconds when the interpreter
+    is busy. The thread only ticks again once the value was read, so it does not wake up while no record is emitted.
+    """
+
+    def __init__(self, tick_in_seconds: float = 0.001) -> None:
+        self._tick_in_seconds = tick_in_seconds
+        self._now_ms = 0
+        self._stale = True
+        self._time_function = time.time
+        self._read = threading.Event()
+        self._ticker: Optional[threading.Thread] = None
+        self._ticker_lock = threading.Lock()
+
+    def now_ms(self) -> int:
+        # The time function is compared so that the clock follows when the time is patched, in tests for example
+        if self._stale or time.time is not self._time_function:
+            # The value is marked as fresh before reading the time so that a tick happening during the read is not lost
+            self._stale = False
+            self._time_function = time.time
+            self._now_ms = int(self._time_function() * 1000)
+            self._read.set()
+            if self._ticker is None:
+                self._start_ticker()
+        return self._now_ms
+
+    def reset_after_fork(self) -> None:
+        # Threads do not survive a fork so the ticker of the parent process would never mark the value as stale in the child process
+        self._stale = True
+        self._read = threading.Event()
+        self._ticker = None
+        self._ticker_lock = threading.Lock()
+
+    def _start_ticker(self) -> None:
+        with self._ticker_lock:
+            if self._ticker is None:
+                self._ticker = threading.Thread(target=self._tick, name="emitted-at-clock", daemon=True)
+                self._ticker.start()
+
+    def _tick(self) -> None:
+        sleeper = threading.Event()
+        while True:
+            self._read.wait()
+            self._read.clear()
+            # Event.wait is used instead of time.sleep which is often patched in tests
+            sleeper.wait(self._tick_in_seconds)
+            self._stale = True
+
+
+_EMITTED_AT_CLOCK = EmittedAtClock()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_EMITTED_AT_CLOCK.reset_after_fork)
+
+
+def current_emitted_at() -> int:
+    """
+    :return: The current time in milliseconds, read at most once per millisecond tick by all the callers
+    """
+    return _EMITTED_AT_CLOCK.now_ms()
+
+
 def stream_data_to_airbyte_message(
     stream_name: str,
     data_or_message: StreamData,
     transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform),
     schema: Mapping[str, Any] = None,
+    emitted_at: Optional[int] = None,
 ) -> AirbyteMessage:
+    """
+    :param emitted_at: The emitted_at value of the record in milliseconds. Callers converting many records at once can provide it to
+    avoid reading the clock for every record. Defaults to the time of the shared clock, see `current_emitted_at`
+    """
     if schema is None:
         schema = {}
 
     if isinstance(data_or_message, Mapping):
-        data = dict(data_or_message)
-        now_millis = int(datetime.datetime.now().timestamp() * 1000)
-        # Transform object fields according to config. Most likely you will
-        # need it to normalize values against json schema. By default no action
-        # taken unless configured. See
-        # docs/connector-development/cdk-python/schemas.md for details.
-        transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        if transformer.is_enabled():
+            data = dict(data_or_message)
+            # Transform object fields according to config. Most likely you will
+            # need it to normalize values against json schema. By default no action
+            # taken unless configured. See
+            # docs/connector-development/cdk-python/schemas.md for details.
+            transformer.transform(data, schema)  # type: ignore
+        else:
+            # Without transformation, the record does not need to be copied. Non-dict mappings are still converted as they can't be
+            # serialized
+            data = data_or_message if type(data_or_message) is dict else dict(data_or_message)
+        if emitted_at is None:
+            emitted_at = _EMITTED_AT_CLOCK.now_ms()
+        # The record is built from values we control, so the validation done by the protocol models is skipped
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=emitted_at)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)  # type: ignore [no-any-return]
     elif isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
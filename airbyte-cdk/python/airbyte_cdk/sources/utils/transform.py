@@ -58,6 +58,12 @@ class TypeTransformer:
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
 
+    def is_enabled(self) -> bool:
+        """
+        :return: False if the transformer is configured with TransformConfig.NoTransform in which case `transform` leaves records as is.
+        """
+        return TransformConfig.NoTransform not in self._config
+
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
         Register custom normalization callback.
@@ -0,0 +1,134 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import sys
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Any, List, Mapping, Optional, TextIO, Type
+
+from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.models import Type as MessageType
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:  # orjson is not a dependency of the CDK. The standard library is used when the connector does not install it
+    orjson = None  # type: ignore [assignment]
+
+_RECORD_MESSAGE_FIELDS = ("namespace", "stream", "data", "emitted_at")
+_FAST_PATH_RECORD_MESSAGE_FIELDS = frozenset(_RECORD_MESSAGE_FIELDS)
+_FAST_PATH_MESSAGE_FIELDS = frozenset(("type", "record"))
+
+
+class AirbyteMessageSerializer(ABC):
+    """
+    Converts an AirbyteMessage to the string written on a single line of the connector output.
+    """
+
+    @abstractmethod
+    def serialize(self, message: AirbyteMessage) -> str:
+        """
+        :param message: The message to serialize
+        :return: The JSON representation of the message without the trailing line break
+        """
+
+
+class PydanticAirbyteMessageSerializer(AirbyteMessageSerializer):
+    """
+    Serializes messages using the protocol models. This is the historical behavior of the entrypoint.
+    """
+
+    def serialize(self, message: AirbyteMessage) -> str:
+        return message.json(exclude_unset=True)  # type: ignore [no-any-return]
+
+
+class FastRecordAirbyteMessageSerializer(AirbyteMessageSerializer):
+    """
+    Serializes RECORD messages straight from the record data instead of going through the protocol models. orjson is used if it is
+    installed, else the standard library json module is used. The standard library output is the string of the protocol models. The
+    orjson output is not: it has no space after separators and writes NaN and infinite floats as null where the protocol models write NaN
+    and Infinity.
+
+    Messages which are not RECORD or records with fields other than namespace, stream, data and emitted_at set are serialized using the
+    protocol models.
+    """
+
+    def __init__(self) -> None:
+        self._fallback = PydanticAirbyteMessageSerializer()
+
+    def serialize(self, message: AirbyteMessage) -> str:
+        if message.type == MessageType.RECORD and message.__fields_set__ <= _FAST_PATH_MESSAGE_FIELDS:
+            record = message.record
+            fields_set = record.__fields_set__
+            if fields_set <= _FAST_PATH_RECORD_MESSAGE_FIELDS:
+                return _dumps(
+                    {
+                        "type": MessageType.RECORD.value,
+                        "record": {field: getattr(record, field) for field in _RECORD_MESSAGE_FIELDS if field in fields_set},
+                    }
+                )
+        return self._fallback.serialize(message)
+
+
+def _dumps(payload: Mapping[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson does not support some values the standard library supports like integers that do not fit on 64 bits
+            pass
+    return json.dumps(payload, default=pydantic_encoder)
+
+
+class AirbyteMessageWriter:
+    """
+    Writes AirbyteMessages to the connector output, one message per line.
+
+    When `record_buffer_size` is greater than 0, RECORD messages are buffered until the buffer holds at least that many characters. Any
+    other message flushes the buffer and is written immediately so that a STATE message is never delayed nor written before the records
+    it checkpoints.
+    """
+
+    def __init__(
+        self,
+        serializer: Optional[AirbyteMessageSerializer] = None,
+        output: Optional[TextIO] = None,
+        record_buffer_size: int = 0,
+    ) -> None:
+        """
+        :param serializer: The serializer used to convert messages to strings. Defaults to PydanticAirbyteMessageSerializer
+        :param output: The stream the messages are written to. Defaults to sys.stdout
+        :param record_buffer_size: The number of characters of RECORD messages buffered before they are written. 0 disables buffering
+        """
+        self._serializer = serializer or PydanticAirbyteMessageSerializer()
+        self._output = output or sys.stdout
+        self._record_buffer_size = record_buffer_size
+        self._buffer: List[str] = []
+        self._buffered_size = 0
+
+    def write(self, message: AirbyteMessage) -> None:
+        # Adding `\n` to the message ensures that both are written at the same time which is important for the concurrent CDK
+        line = f"{self._serializer.serialize(message)}\n"
+        self._buffer.append(line)
+        if message.type == MessageType.RECORD and self._record_buffer_size > 0:
+            self._buffered_size += len(line)
+            if self._buffered_size < self._record_buffer_size:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._output.write("".join(self._buffer))
+            self._buffer = []
+            self._buffered_size = 0
+        self._output.flush()
+
+    def __enter__(self) -> "AirbyteMessageWriter":
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException], traceback: Optional[TracebackType]
+    ) -> None:
+        self.flush()
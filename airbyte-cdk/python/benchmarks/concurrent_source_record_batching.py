@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+"""
+Compares the records/s of a ConcurrentSource reading in-memory partitions when records are put in the queue one by one and when they
+are handed over to the main thread in batches.
+"""
+
+import argparse
+import logging
+import time
+import warnings
+from typing import Any, Iterable, List, Mapping, Optional
+
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import AbstractAvailabilityStrategy, StreamAvailability, StreamAvailable
+from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.default_stream import DefaultStream
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+
+_STREAM_NAME = "benchmark"
+_LOGGER = logging.getLogger("airbyte.benchmark")
+
+
+class _AlwaysAvailable(AbstractAvailabilityStrategy):
+    def check_availability(self, logger: logging.Logger) -> StreamAvailability:
+        return StreamAvailable()
+
+
+class _InMemoryPartition(Partition):
+    def __init__(self, partition_id: int, number_of_records: int) -> None:
+        self._partition_id = partition_id
+        self._number_of_records = number_of_records
+        self._is_closed = False
+
+    def read(self) -> Iterable[Record]:
+        for record_id in range(self._number_of_records):
+            yield Record({"id": record_id, "partition": self._partition_id, "name": "a name", "value": 1.5}, _STREAM_NAME)
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return {"partition": self._partition_id}
+
+    def stream_name(self) -> str:
+        return _STREAM_NAME
+
+    def close(self) -> None:
+        self._is_closed = True
+
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def __hash__(self) -> int:
+        return self._partition_id
+
+
+class _InMemoryPartitionGenerator(PartitionGenerator):
+    def __init__(self, number_of_partitions: int, records_per_partition: int) -> None:
+        self._number_of_partitions = number_of_partitions
+        self._records_per_partition = records_per_partition
+
+    def generate(self) -> Iterable[Partition]:
+        for partition_id in range(self._number_of_partitions):
+            yield _InMemoryPartition(partition_id, self._records_per_partition)
+
+
+def _create_stream(number_of_partitions: int, records_per_partition: int, message_repository: InMemoryMessageRepository) -> DefaultStream:
+    return DefaultStream(
+        _InMemoryPartitionGenerator(number_of_partitions, records_per_partition),
+        _STREAM_NAME,
+        {},
+        _AlwaysAvailable(),
+        [],
+        None,
+        _LOGGER,
+        FinalStateCursor(_STREAM_NAME, None, message_repository),
+    )
+
+
+def _measure_records_per_second(
+    number_of_workers: int, number_of_partitions: int, records_per_partition: int, record_batch_size: int
+) -> float:
+    message_repository = InMemoryMessageRepository()
+    source = ConcurrentSource.create(
+        number_of_workers, 1, _LOGGER, DebugSliceLogger(), message_repository, record_batch_size=record_batch_size
+    )
+    streams: List[Any] = [_create_stream(number_of_partitions, records_per_partition, message_repository)]
+
+    start = time.perf_counter()
+    number_of_records = sum(1 for message in source.read(streams) if message.type == MessageType.RECORD)
+    elapsed = time.perf_counter() - start
+
+    assert number_of_records == number_of_partitions * records_per_partition
+    return number_of_records / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--partitions", type=int, default=20)
+    parser.add_argument("--records-per-partition", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    args = parser.parse_args()
+    _LOGGER.setLevel(logging.WARNING)
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    for record_batch_size in (1, args.batch_size):
+        records_per_second = _measure_records_per_second(args.workers, args.partitions, args.records_per_partition, record_batch_size)
+        print(f"record_batch_size={record_batch_size:>6}: {records_per_second:>12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
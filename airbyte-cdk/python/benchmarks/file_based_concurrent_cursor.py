@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+"""
+Compares the files/s and the size of the state written by a FileBasedConcurrentCursor when a state message is emitted after every synced
+file and when the state emission is throttled. The history is filled up to its maximum size so that every new file evicts the earliest
+file of the history.
+
+Emitting the state after every file is quadratic in the size of the history so it is measured on fewer files by default.
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+from unittest.mock import MagicMock
+
+from airbyte_cdk.models import AirbyteMessage, Level
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.concurrent.cursor import FileBasedConcurrentCursor
+from airbyte_cdk.sources.message import LogMessage, MessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
+
+_STREAM_NAME = "benchmark"
+
+
+class _SerializingMessageRepository(MessageRepository):
+    """
+    Serializes the messages like the entrypoint would and only keeps track of the number of bytes written.
+    """
+
+    def __init__(self) -> None:
+        self.number_of_messages = 0
+        self.number_of_bytes = 0
+
+    def emit_message(self, message: AirbyteMessage) -> None:
+        self.number_of_messages += 1
+        self.number_of_bytes += len(message.json(exclude_unset=True))
+
+    def log_message(self, level: Level, message_provider: Callable[[], LogMessage]) -> None:
+        pass
+
+    def consume_queue(self) -> Iterable[AirbyteMessage]:
+        return []
+
+
+def _create_cursor(
+    history: Dict[str, str],
+    message_repository: MessageRepository,
+    state_emission_interval: Optional[timedelta],
+    files_between_state_emissions: Optional[int],
+) -> FileBasedConcurrentCursor:
+    stream = MagicMock()
+    stream.name = _STREAM_NAME
+    stream.namespace = None
+    stream_config = MagicMock()
+    stream_config.days_to_sync_if_history_is_full = None
+    return FileBasedConcurrentCursor(
+        stream_config,
+        _STREAM_NAME,
+        None,
+        {"history": history},
+        message_repository,
+        ConnectorStateManager(stream_instance_map={_STREAM_NAME: stream}),
+        CursorField(FileBasedConcurrentCursor.CURSOR_FIELD),
+        state_emission_interval,
+        files_between_state_emissions,
+    )
+
+
+def _create_files(number_of_files: int) -> List[RemoteFile]:
+    start = datetime(2024, 1, 1)
+    return [
+        RemoteFile(uri=f"bucket/prefix/{file_id:09d}.csv", last_modified=start + timedelta(seconds=file_id))
+        for file_id in range(number_of_files)
+    ]
+
+
+def _measure(number_of_files: int, state_emission_interval: Optional[timedelta], files_between_state_emissions: Optional[int]) -> None:
+    history_size = FileBasedConcurrentCursor.DEFAULT_MAX_HISTORY_SIZE
+    files = _create_files(history_size + number_of_files)
+    history = {file.uri: file.last_modified.strftime(FileBasedConcurrentCursor.DATE_TIME_FORMAT) for file in files[:history_size]}
+    files_to_sync = files[history_size:]
+    message_repository = _SerializingMessageRepository()
+    cursor = _create_cursor(history, message_repository, state_emission_interval, files_between_state_emissions)
+    cursor._pending_files = {file.uri: file for file in files_to_sync}
+
+    start = time.perf_counter()
+    for file in files_to_sync:
+        cursor.add_file(file)
+    cursor.ensure_at_least_one_state_emitted()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"state_emission_interval={state_emission_interval}, files_between_state_emissions={files_between_state_emissions}: "
+        f"{number_of_files / elapsed:>10,.0f} files/s, {message_repository.number_of_messages:>7,} state messages, "
+        f"{message_repository.number_of_bytes / number_of_files:>10,.0f} bytes of state per file"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--files-when-emitting-after-every-file", type=int, default=500)
+    args = parser.parse_args()
+
+    _measure(args.files_when_emitting_after_every_file, None, 1)
+    _measure(
+        args.files,
+        FileBasedConcurrentCursor.DEFAULT_STATE_EMISSION_INTERVAL,
+        FileBasedConcurrentCursor.DEFAULT_FILES_BETWEEN_STATE_EMISSIONS,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+"""
+Compares the messages/s the entrypoint writes when serializing with the protocol models and flushing every message against the fast
+record serializer with a buffered writer.
+"""
+
+import argparse
+import os
+import time
+from typing import List
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from airbyte_cdk.utils import message_serializer
+from airbyte_cdk.utils.message_serializer import AirbyteMessageWriter, FastRecordAirbyteMessageSerializer, PydanticAirbyteMessageSerializer
+
+
+def _create_messages(number_of_messages: int) -> List[AirbyteMessage]:
+    return [
+        AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(
+                stream="benchmark",
+                data={"id": i, "name": f"name {i}", "email": f"user{i}@example.com", "score": i / 3, "tags": ["a", "b"], "active": True},
+                emitted_at=1704067200000,
+            ),
+        )
+        for i in range(number_of_messages)
+    ]
+
+
+def _measure_messages_per_second(messages: List[AirbyteMessage], writer: AirbyteMessageWriter) -> float:
+    start = time.perf_counter()
+    with writer:
+        for message in messages:
+            writer.write(message)
+    return len(messages) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--record-buffer-size", type=int, default=1024 * 1024)
+    args = parser.parse_args()
+
+    messages = _create_messages(args.messages)
+    with open(os.devnull, "w") as output:
+        pydantic_rate = _measure_messages_per_second(messages, AirbyteMessageWriter(PydanticAirbyteMessageSerializer(), output))
+        fast_rate = _measure_messages_per_second(
+            messages, AirbyteMessageWriter(FastRecordAirbyteMessageSerializer(), output, args.record_buffer_size)
+        )
+
+    print(f"protocol models, flush per message: {pydantic_rate:>12,.0f} messages/s")
+    json_library = "orjson" if message_serializer.orjson is not None else "json"
+    print(f"fast record serializer ({json_library}), buffered: {fast_rate:>12,.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+"""
+Compares the records/s of Stream.read for a stream using a PerPartitionCursor holding the state of many partitions when the checkpoint is
+computed after every record, which is what Stream.read used to do, and when it is only computed once a state message is emitted.
+
+Computing the checkpoint after every record rebuilds the state of every partition for every record so it is measured on fewer records
+by default.
+"""
+
+import argparse
+import logging
+import time
+from datetime import timedelta
+from itertools import islice
+from typing import Any, Iterable, List, Mapping, Optional, Union
+from unittest.mock import MagicMock
+
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
+from airbyte_cdk.sources.declarative.incremental import CursorFactory, DatetimeBasedCursor, PerPartitionCursor
+from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.checkpoint import Cursor
+from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.utils.schema_helpers import InternalConfig
+
+_STREAM_NAME = "benchmark"
+_CURSOR_FIELD = "updated_at"
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _create_child_cursor() -> DatetimeBasedCursor:
+    return DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime(datetime="2024-01-01T00:00:00Z", datetime_format=_DATETIME_FORMAT, parameters={}),
+        end_datetime=MinMaxDatetime(datetime="2024-01-02T00:00:00Z", datetime_format=_DATETIME_FORMAT, parameters={}),
+        datetime_format=_DATETIME_FORMAT,
+        cursor_field=_CURSOR_FIELD,
+        config={},
+        parameters={},
+    )
+
+
+def _create_cursor(number_of_partitions: int) -> PerPartitionCursor:
+    partition_ids = [str(partition_id) for partition_id in range(number_of_partitions)]
+    cursor = PerPartitionCursor(
+        cursor_factory=CursorFactory(_create_child_cursor),
+        partition_router=ListPartitionRouter(values=partition_ids, cursor_field="partition_id", config={}, parameters={}),
+    )
+    cursor.set_initial_state(
+        {
+            "states": [
+                {"partition": {"partition_id": partition_id}, "cursor": {_CURSOR_FIELD: "2024-01-01T00:00:00Z"}}
+                for partition_id in partition_ids
+            ]
+        }
+    )
+    return cursor
+
+
+class _BenchmarkStream(Stream):
+    def __init__(
+        self,
+        cursor: PerPartitionCursor,
+        number_of_slices: int,
+        records_per_slice: int,
+        checkpoint_time_interval: Optional[timedelta],
+        compute_checkpoint_after_every_record: bool,
+    ) -> None:
+        self._cursor = cursor
+        self._number_of_slices = number_of_slices
+        self._records_per_slice = records_per_slice
+        self._checkpoint_time_interval = checkpoint_time_interval
+        self._compute_checkpoint_after_every_record = compute_checkpoint_after_every_record
+        self._checkpoint_reader: Any = None
+
+    @property
+    def name(self) -> str:
+        return _STREAM_NAME
+
+    @property
+    def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
+        return None
+
+    @property
+    def state_checkpoint_interval(self) -> Optional[int]:
+        return 1_000
+
+    @property
+    def state_checkpoint_time_interval(self) -> Optional[timedelta]:
+        return self._checkpoint_time_interval
+
+    def get_cursor(self) -> Optional[Cursor]:
+        return self._cursor
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+    def stream_slices(
+        self, *, sync_mode: SyncMode, cursor_field: Optional[List[str]] = None, stream_state: Optional[Mapping[str, Any]] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        return islice(self._cursor.stream_slices(), self._number_of_slices)
+
+    def _get_checkpoint_reader(self, *args: Any, **kwargs: Any) -> Any:
+        self._checkpoint_reader = super()._get_checkpoint_reader(*args, **kwargs)
+        return self._checkpoint_reader
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: Optional[List[str]] = None,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> Iterable[StreamData]:
+        for record_id in range(self._records_per_slice):
+            yield {"id": record_id, _CURSOR_FIELD: "2024-01-01T12:00:00Z"}
+            if self._compute_checkpoint_after_every_record:
+                # Stream.read used to compute the checkpoint after every record, whether a state message was emitted or not
+                self._checkpoint_reader.get_checkpoint()
+
+
+def _measure(
+    number_of_partitions: int,
+    number_of_slices: int,
+    records_per_slice: int,
+    checkpoint_time_interval: Optional[timedelta],
+    compute_checkpoint_after_every_record: bool,
+) -> None:
+    stream = _BenchmarkStream(
+        _create_cursor(number_of_partitions),
+        number_of_slices,
+        records_per_slice,
+        checkpoint_time_interval,
+        compute_checkpoint_after_every_record,
+    )
+    configured_stream = ConfiguredAirbyteStream(
+        stream=AirbyteStream(name=_STREAM_NAME, json_schema={}, supported_sync_modes=[SyncMode.full_refresh, SyncMode.incremental]),
+        sync_mode=SyncMode.incremental,
+        destination_sync_mode=DestinationSyncMode.append,
+    )
+    state_manager = ConnectorStateManager(stream_instance_map={_STREAM_NAME: stream})
+
+    number_of_records = 0
+    number_of_states = 0
+    start = time.perf_counter()
+    for message in stream.read(configured_stream, logging.getLogger("airbyte"), MagicMock(), {}, state_manager, InternalConfig()):
+        if isinstance(message, Mapping):
+            number_of_records += 1
+        elif message.type == MessageType.STATE:
+            number_of_states += 1
+    elapsed = time.perf_counter() - start
+
+    mode = "checkpoint computed after every record" if compute_checkpoint_after_every_record else "checkpoint computed on emission"
+    print(
+        f"{mode}, state_checkpoint_time_interval={checkpoint_time_interval}: {number_of_records / elapsed:>10,.0f} records/s, "
+        f"{number_of_states:>5,} state messages"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--partitions", type=int, default=10_000)
+    parser.add_argument("--slices", type=int, default=4)
+    parser.add_argument("--records-per-slice", type=int, default=5_000)
+    parser.add_argument("--records-per-slice-when-computing-checkpoint-after-every-record", type=int, default=5)
+    parser.add_argument("--checkpoint-time-interval-in-seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    _measure(args.partitions, args.slices, args.records_per_slice_when_computing_checkpoint_after_every_record, None, True)
+    _measure(args.partitions, args.slices, args.records_per_slice, None, False)
+    _measure(args.partitions, args.slices, args.records_per_slice, timedelta(seconds=args.checkpoint_time_interval_in_seconds), False)
+
+
+if __name__ == "__main__":
+    main()
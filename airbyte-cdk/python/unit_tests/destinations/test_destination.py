@@ -272,3 +272,87 @@ class TestRun:
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
             list(destination.run_cmd(parsed_args=argparse.Namespace(**args)))
+
+
+_INPUT_LINES = [
+    '{"type": "RECORD", "record": {"stream": "s1", "data": {"id": 1, "big": 123456789012345678901234567890}, "emitted_at": 1}}',
+    '{"type": "RECORD", "record": {"namespace": "n1", "stream": "s1", "data": {"nested": {"a": [1, "2"]}}, "emitted_at": 2}}',
+    '{"type": "RECORD", "record": {"stream": "s1", "data": {"id": 3}, "emitted_at": "3"}}',
+    '{"type": "RECORD", "record": {"stream": "s1", "data": {"id": 4}, "emitted_at": 4, "meta": {"changes": []}}}',
+    '{"type": "STATE", "state": {"data": {"cursor": "é"}}}',
+    "",
+    " add this non-serializable string to verify the destination does not break on malformed input",
+    '{"type": "RECORD", "record": {"stream": "s1", "emitted_at": 5}}',
+    '{"type": "LOG", "log": {"level": "INFO", "message": "a log"}}',
+]
+
+
+class TestFastInputDecoding:
+    @pytest.mark.parametrize(
+        "input_block_size", [pytest.param(1024 * 1024, id="lines within a block"), pytest.param(7, id="lines spanning blocks")]
+    )
+    def test_fast_decoding_produces_the_same_messages_as_the_protocol_models(self, destination: Destination, input_block_size: int):
+        input_bytes = "\n".join(_INPUT_LINES).encode("utf-8")
+        expected_messages = list(destination._parse_input_stream(io.TextIOWrapper(io.BytesIO(input_bytes), encoding="utf-8")))
+
+        destination.fast_input_decoding = True
+        destination.INPUT_BLOCK_SIZE = input_block_size
+        messages = list(destination._parse_input_stream(io.TextIOWrapper(io.BytesIO(input_bytes), encoding="utf-8")))
+
+        assert len(messages) == 6
+        assert messages == expected_messages
+        assert [message.json(exclude_unset=True) for message in messages] == [
+            message.json(exclude_unset=True) for message in expected_messages
+        ]
+        assert messages[0].record.data["big"] == 123456789012345678901234567890
+
+    def test_given_input_arriving_in_short_reads_when_fast_decoding_then_emit_messages_without_waiting_for_a_full_block(
+        self, destination: Destination
+    ):
+        class _ShortReadsStream(io.RawIOBase):
+            def __init__(self, chunks: List[bytes]) -> None:
+                self.chunks = chunks
+                self.reads = 0
+
+            def readable(self) -> bool:
+                return True
+
+            def readinto(self, buffer: Any) -> int:
+                self.reads += 1
+                chunk = self.chunks.pop(0) if self.chunks else b""
+                buffer[: len(chunk)] = chunk
+                return len(chunk)
+
+        state_line = b'{"type": "STATE", "state": {"data": {"cursor": 1}}}\n'
+        raw_stream = _ShortReadsStream([state_line, state_line])
+        destination.fast_input_decoding = True
+
+        messages = destination._parse_input_stream(io.TextIOWrapper(io.BufferedReader(raw_stream), encoding="utf-8"))
+
+        assert next(messages).type == Type.STATE
+        # the second state was not read yet, as it would be the case if it was not sent yet
+        assert raw_stream.reads == 1
+        assert [message.type for message in messages] == [Type.STATE]
+
+    def test_given_text_stream_without_buffer_when_fast_decoding_then_decode_lines(self, destination: Destination):
+        expected_messages = list(destination._parse_input_stream(io.StringIO("\n".join(_INPUT_LINES))))
+        destination.fast_input_decoding = True
+
+        messages = list(destination._parse_input_stream(io.StringIO("\n".join(_INPUT_LINES))))
+
+        assert messages == expected_messages
+        assert [message.type for message in messages] == [Type.RECORD] * 4 + [Type.STATE, Type.LOG]
+
+    def test_only_records_with_protocol_types_skip_validation(self, destination: Destination):
+        destination.fast_input_decoding = True
+
+        messages = list(destination._parse_input_stream(io.StringIO("\n".join(_INPUT_LINES[:4]))))
+
+        assert [message.record.__fields_set__ for message in messages] == [
+            {"stream", "data", "emitted_at"},
+            {"namespace", "stream", "data", "emitted_at"},
+            {"stream", "data", "emitted_at"},
+            {"stream", "data", "emitted_at", "meta"},
+        ]
+        assert messages[2].record.emitted_at == 3
+        assert messages[3].record.meta.changes == []
@@ -17,6 +17,7 @@ from airbyte_cdk.destinations.vector_db_based.embedder import (
     COHERE_VECTOR_SIZE,
     OPEN_AI_VECTOR_SIZE,
     AzureOpenAIEmbedder,
+    CachedEmbedder,
     CohereEmbedder,
     Document,
     FakeEmbedder,
@@ -121,3 +122,49 @@ def test_openai_chunking():
     chunks = [Document(page_content="a", record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0)) for _ in range(1005)]
     assert embedder.embed_documents(chunks) == [[0] * OPEN_AI_VECTOR_SIZE] * 1005
     mock_embedding_instance.embed_documents.assert_has_calls([call(["a"] * 1000), call(["a"] * 5)])
+
+
+def _document(text: str) -> Document:
+    return Document(page_content=text, record=AirbyteRecordMessage(stream="mystream", data={}, emitted_at=0))
+
+
+def _embed_by_length(documents):
+    return [[float(len(document.page_content)), 0.5] if document.page_content else None for document in documents]
+
+
+def test_cached_embedder_only_embeds_texts_which_were_not_embedded_before():
+    wrapped_embedder = MagicMock()
+    wrapped_embedder.embed_documents.side_effect = _embed_by_length
+    embedder = CachedEmbedder(wrapped_embedder)
+
+    assert embedder.embed_documents([_document("a"), _document("bb"), _document("a")]) == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert embedder.embed_documents([_document("bb"), _document("ccc"), _document("")]) == [[2.0, 0.5], [3.0, 0.5], None]
+
+    assert [[document.page_content for document in call_args[0][0]] for call_args in wrapped_embedder.embed_documents.call_args_list] == [
+        ["a", "bb"],
+        ["ccc", ""],
+    ]
+    assert (embedder.hits, embedder.misses) == (1, 4)
+
+
+def test_cached_embedder_does_not_call_the_embedder_when_every_text_is_cached():
+    wrapped_embedder = MagicMock()
+    wrapped_embedder.embed_documents.side_effect = _embed_by_length
+    embedder = CachedEmbedder(wrapped_embedder)
+    embedder.embed_documents([_document("a")])
+
+    assert embedder.embed_documents([_document("a"), _document("a")]) == [[1.0, 0.5], [1.0, 0.5]]
+    assert wrapped_embedder.embed_documents.call_count == 1
+
+
+def test_cached_embedder_keeps_embeddings_in_database_across_instances(tmp_path):
+    database_path = str(tmp_path / "embeddings.sqlite")
+    first_embedder = MagicMock()
+    first_embedder.embed_documents.side_effect = _embed_by_length
+    CachedEmbedder(first_embedder, database_path).embed_documents([_document("a")])
+
+    second_embedder = MagicMock()
+    second_embedder.embed_documents.side_effect = _embed_by_length
+    assert CachedEmbedder(second_embedder, database_path).embed_documents([_document("a"), _document("bb")]) == [[1.0, 0.5], [2.0, 0.5]]
+    second_embedder.embed_documents.assert_called_once()
+    assert [document.page_content for document in second_embedder.embed_documents.call_args[0][0]] == ["bb"]
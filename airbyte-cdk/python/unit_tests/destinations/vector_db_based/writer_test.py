@@ -3,10 +3,11 @@
 #
 
 from typing import Optional
-from unittest.mock import ANY, MagicMock, call
+import threading
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
-from airbyte_cdk.destinations.vector_db_based import ProcessingConfigModel, Writer
+from airbyte_cdk.destinations.vector_db_based import Chunk, ProcessingConfigModel, Writer
 from airbyte_cdk.models.airbyte_protocol import (
     AirbyteLogMessage,
     AirbyteMessage,
@@ -115,7 +116,8 @@ def test_write(omit_raw_text: bool):
     mock_indexer.post_sync.assert_called()
 
 
-def test_write_stream_namespace_split():
+@pytest.mark.parametrize("pipeline_queue_size", [pytest.param(0, id="synchronous"), pytest.param(2, id="pipelined")])
+def test_write_stream_namespace_split(pipeline_queue_size: int):
     """
     Test separate handling of streams and namespaces in the writer
 
@@ -148,7 +150,7 @@ def test_write_stream_namespace_split():
     mock_indexer.post_sync.return_value = []
 
     # Create the DestinationLangchain instance
-    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False)
+    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False, pipeline_queue_size)
 
     output_messages = writer.write(configured_catalog, input_messages)
     next(output_messages)
@@ -170,3 +172,69 @@ def test_write_stream_namespace_split():
         ]
     )
     assert mock_embedder.embed_documents.call_count == 4
+
+
+def _mock_processor_creation():
+    """
+    Creates one chunk per record holding the id of the record without splitting the text
+    """
+    processor = MagicMock()
+    processor.process.side_effect = lambda record: (
+        [Chunk(page_content=record.data["column_name"], metadata={"id": record.data["id"]}, record=record)],
+        str(record.data["id"]),
+    )
+    return patch("airbyte_cdk.destinations.vector_db_based.writer.DocumentProcessor", return_value=processor)
+
+
+def test_given_pipeline_when_write_then_state_is_only_emitted_once_the_previous_records_are_indexed():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages = [_generate_record_message(i) for i in range(3 * BATCH_SIZE)] + [state_message]
+    input_messages.extend([_generate_record_message(i) for i in range(3 * BATCH_SIZE, 4 * BATCH_SIZE)])
+
+    indexing_can_proceed = threading.Event()
+    indexed_ids = []
+
+    def _index(chunks, namespace, stream):
+        indexing_can_proceed.wait()
+        indexed_ids.extend(chunk.metadata["id"] for chunk in chunks)
+
+    mock_indexer = MagicMock()
+    mock_indexer.index.side_effect = _index
+    mock_indexer.post_sync.return_value = []
+
+    with _mock_processor_creation():
+        writer = Writer(config_model, mock_indexer, generate_mock_embedder(), BATCH_SIZE, False, pipeline_queue_size=4)
+        output_messages = writer.write(configured_catalog, input_messages)
+        threading.Timer(0.2, indexing_can_proceed.set).start()
+        assert next(output_messages) == state_message
+        # the following records might already be indexed as well as the state is only checked when the next message is read
+        assert indexed_ids[: 3 * BATCH_SIZE] == list(range(3 * BATCH_SIZE))
+
+        assert list(output_messages) == []
+    assert indexed_ids == list(range(4 * BATCH_SIZE))
+    assert mock_indexer.delete.call_args_list == [
+        call([str(i) for i in range(batch * BATCH_SIZE, (batch + 1) * BATCH_SIZE)], None, "example_stream") for batch in range(4)
+    ]
+
+
+@pytest.mark.parametrize("failing_component, error_message", [("embedder", "embedding failed"), ("indexer", "indexing failed")])
+def test_given_pipeline_when_stage_fails_then_write_raises_the_exception(failing_component: str, error_message: str):
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(10 * BATCH_SIZE)]
+
+    mock_embedder = generate_mock_embedder()
+    mock_indexer = MagicMock()
+    if failing_component == "embedder":
+        mock_embedder.embed_documents.side_effect = ValueError(error_message)
+    else:
+        mock_indexer.index.side_effect = ValueError(error_message)
+
+    with _mock_processor_creation():
+        writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False, pipeline_queue_size=1)
+        with pytest.raises(ValueError, match=error_message):
+            list(writer.write(configured_catalog, input_messages))
+
+    mock_indexer.post_sync.assert_not_called()
@@ -526,3 +526,142 @@ def test_given_invalid_state_when_set_initial_state_then_raise_config_error(mock
         cursor.set_initial_state({"invalid_state": 1})
 
     assert exception.value.failure_type == FailureType.config_error
+
+
+def _stateful_cursor_factory():
+    """
+    Cursors created by this factory keep the state they are initialized with, have one slice and compare states using CURSOR_STATE_KEY
+    """
+
+    def _create():
+        cursor = Mock(spec=DeclarativeCursor)
+        cursor.set_initial_state.side_effect = lambda state: cursor.get_stream_state.configure_mock(return_value=dict(state))
+        cursor.get_stream_state.return_value = {}
+        cursor.stream_slices.return_value = [{CURSOR_SLICE_FIELD: "a cursor slice"}]
+        cursor.is_greater_than_or_equal.side_effect = lambda first, second: first[CURSOR_STATE_KEY] >= second[CURSOR_STATE_KEY]
+        return cursor
+
+    cursor_factory = Mock()
+    cursor_factory.create.side_effect = _create
+    return cursor_factory
+
+
+def _partitions(number_of_partitions):
+    return [StreamSlice(partition={"partition_field": f"partition {i}"}, cursor_slice={}) for i in range(number_of_partitions)]
+
+
+def test_given_max_cursors_in_memory_when_set_initial_state_then_cursors_are_spilled_and_state_is_preserved(mocked_partition_router):
+    mocked_partition_router.get_stream_state.return_value = None
+    cursor_factory = _stateful_cursor_factory()
+    cursor = PerPartitionCursor(cursor_factory, mocked_partition_router, max_cursors_in_memory=2)
+    states = [
+        {"partition": partition.partition, "cursor": {CURSOR_STATE_KEY: f"2024-01-0{i + 1}"}} for i, partition in enumerate(_partitions(5))
+    ]
+
+    cursor.set_initial_state({"states": states})
+
+    assert cursor_factory.create.call_count == 2
+    assert sorted(cursor.get_stream_state()["states"], key=lambda state: state["partition"]["partition_field"]) == states
+
+
+def test_given_spilled_cursor_when_stream_slices_then_cursor_is_recreated_from_spilled_state(mocked_partition_router):
+    mocked_partition_router.get_stream_state.return_value = None
+    partitions = _partitions(3)
+    mocked_partition_router.stream_slices.return_value = partitions
+    cursor = PerPartitionCursor(_stateful_cursor_factory(), mocked_partition_router, max_cursors_in_memory=1)
+    cursor.set_initial_state(
+        {"states": [{"partition": partition.partition, "cursor": {CURSOR_STATE_KEY: "2024-01-01"}} for partition in partitions]}
+    )
+
+    for stream_slice in cursor.stream_slices():
+        cursor.close_slice(stream_slice)
+        assert cursor.select_state(stream_slice) == {CURSOR_STATE_KEY: "2024-01-01"}
+
+    assert len(cursor.get_stream_state()["states"]) == 3
+
+
+def test_given_repeated_partitions_in_state_and_max_cursors_in_memory_when_set_initial_state_then_last_state_of_partition_is_kept(
+    mocked_partition_router,
+):
+    mocked_partition_router.get_stream_state.return_value = None
+    cursor = PerPartitionCursor(_stateful_cursor_factory(), mocked_partition_router, max_cursors_in_memory=1)
+    first_partition, second_partition = _partitions(2)
+    states = [
+        {"partition": first_partition.partition, "cursor": {CURSOR_STATE_KEY: "2024-01-01"}},
+        {"partition": second_partition.partition, "cursor": {CURSOR_STATE_KEY: "2024-01-01"}},
+        {"partition": second_partition.partition, "cursor": {CURSOR_STATE_KEY: "2024-01-02"}},
+        {"partition": first_partition.partition, "cursor": {CURSOR_STATE_KEY: "2024-01-02"}},
+    ]
+
+    cursor.set_initial_state({"states": states})
+
+    assert cursor.get_stream_state()["states"] == [
+        {"partition": first_partition.partition, "cursor": {CURSOR_STATE_KEY: "2024-01-02"}},
+        {"partition": second_partition.partition, "cursor": {CURSOR_STATE_KEY: "2024-01-02"}},
+    ]
+
+
+def test_given_max_partitions_in_state_when_stream_slices_then_state_size_is_bounded_and_global_state_is_the_lowest_compacted_state(
+    mocked_partition_router,
+):
+    mocked_partition_router.get_stream_state.return_value = None
+    partitions = _partitions(10)
+    mocked_partition_router.stream_slices.return_value = partitions
+    cursor = PerPartitionCursor(_stateful_cursor_factory(), mocked_partition_router, max_cursors_in_memory=2, max_partitions_in_state=3)
+    cursor.set_initial_state(
+        {
+            "states": [
+                {"partition": partition.partition, "cursor": {CURSOR_STATE_KEY: f"2024-01-{i + 10}"}}
+                for i, partition in enumerate(partitions)
+            ]
+        }
+    )
+
+    for stream_slice in cursor.stream_slices():
+        cursor.close_slice(stream_slice)
+        assert len(cursor.get_stream_state()["states"]) <= 3
+
+    state = cursor.get_stream_state()
+    assert len(state["states"]) == 3
+    assert state["state"] == {CURSOR_STATE_KEY: "2024-01-10"}
+    assert all(partition_state["cursor"][CURSOR_STATE_KEY] >= "2024-01-10" for partition_state in state["states"])
+
+
+def test_given_global_state_when_stream_slices_then_partitions_without_state_start_from_global_state(mocked_partition_router):
+    mocked_partition_router.get_stream_state.return_value = None
+    mocked_partition_router.stream_slices.return_value = _partitions(2)
+    cursor = PerPartitionCursor(_stateful_cursor_factory(), mocked_partition_router, max_partitions_in_state=10)
+    cursor.set_initial_state(
+        {
+            "states": [{"partition": _partitions(1)[0].partition, "cursor": {CURSOR_STATE_KEY: "2024-02-01"}}],
+            "state": {CURSOR_STATE_KEY: "2024-01-01"},
+        }
+    )
+
+    slices = list(cursor.stream_slices())
+
+    assert cursor.select_state(slices[0]) == {CURSOR_STATE_KEY: "2024-02-01"}
+    assert cursor.select_state(slices[1]) == {CURSOR_STATE_KEY: "2024-01-01"}
+    assert cursor.get_stream_state()["state"] == {CURSOR_STATE_KEY: "2024-01-01"}
+
+
+def test_given_compaction_during_sync_when_all_partitions_generated_then_global_state_of_previous_sync_is_dropped(mocked_partition_router):
+    mocked_partition_router.get_stream_state.return_value = None
+    partitions = _partitions(3)
+    mocked_partition_router.stream_slices.return_value = partitions
+    cursor = PerPartitionCursor(_stateful_cursor_factory(), mocked_partition_router, max_partitions_in_state=1)
+    cursor.set_initial_state(
+        {
+            "states": [{"partition": partitions[0].partition, "cursor": {CURSOR_STATE_KEY: "2024-03-01"}}],
+            "state": {CURSOR_STATE_KEY: "2024-01-01"},
+        }
+    )
+
+    slices = cursor.stream_slices()
+    next(slices)
+    next(slices)
+    assert cursor.get_stream_state()["state"] == {CURSOR_STATE_KEY: "2024-01-01"}
+
+    list(slices)
+    # the partitions created from the global state still hold it
+    assert cursor.get_stream_state()["state"] == {CURSOR_STATE_KEY: "2024-01-01"}
@@ -3,10 +3,12 @@
 #
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk import StreamSlice
-from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
+from airbyte_cdk.sources.declarative.interpolation.jinja import CompiledTemplateCache, JinjaInterpolation
 from freezegun import freeze_time
 from jinja2.exceptions import TemplateSyntaxError
 
@@ -274,3 +276,64 @@ def test_interpolation_private_partition_attribute():
     actual_output = JinjaInterpolation().eval(template, {}, **{"stream_slice": stream_slice})
 
     assert actual_output == expected_output
+
+
+def test_given_same_template_when_eval_then_compile_once():
+    cache = CompiledTemplateCache(max_size=10)
+    template = "{{ config['cache_key'] }}"
+
+    with patch.object(JinjaInterpolation, "TEMPLATE_CACHE", cache):
+        assert interpolation.eval(template, {"cache_key": "first"}) == "first"
+        assert interpolation.eval(template, {"cache_key": "second"}) == "second"
+
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_given_cached_template_when_eval_with_missing_variable_then_raise():
+    cache = CompiledTemplateCache(max_size=10)
+
+    with patch.object(JinjaInterpolation, "TEMPLATE_CACHE", cache):
+        interpolation.eval("{{ a_variable }}", {}, a_variable="value")
+        with pytest.raises(ValueError):
+            interpolation.eval("{{ a_variable }}", {})
+
+
+@pytest.mark.parametrize("static_string", ["a static string", "https://api.example.com/v1"])
+def test_given_static_string_when_eval_then_do_not_use_jinja(static_string):
+    cache = CompiledTemplateCache(max_size=10)
+
+    with patch.object(JinjaInterpolation, "TEMPLATE_CACHE", cache):
+        assert interpolation.eval(static_string, {}) == static_string
+
+    assert cache.hits == cache.misses == 0
+
+
+@pytest.mark.parametrize("string_with_line_breaks", ["a line\n", "a line\r\nanother line"])
+def test_given_static_string_with_line_breaks_when_eval_then_normalize_like_jinja(string_with_line_breaks):
+    expected = JinjaInterpolation()._environment.from_string(string_with_line_breaks).render()
+
+    assert interpolation.eval(string_with_line_breaks, {}) == expected
+
+
+def test_given_cache_is_full_when_compile_then_evict_least_recently_used_template():
+    cache = CompiledTemplateCache(max_size=2)
+
+    with patch.object(JinjaInterpolation, "TEMPLATE_CACHE", cache):
+        for template in ["{{ 1 }}", "{{ 2 }}", "{{ 3 }}", "{{ 1 }}"]:
+            interpolation.eval(template, {})
+
+    assert len(cache) == 2
+    assert cache.misses == 4
+
+
+def test_given_concurrent_evaluations_when_eval_then_render_each_context():
+    cache = CompiledTemplateCache(max_size=10)
+
+    with patch.object(JinjaInterpolation, "TEMPLATE_CACHE", cache):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda value: interpolation.eval("{{ config['value'] }}", {"value": f"value {value}"}), range(100)))
+
+    assert results == [f"value {value}" for value in range(100)]
+    assert cache.hits + cache.misses == 100
@@ -79,6 +79,7 @@ from airbyte_cdk.sources.declarative.spec import Spec
 from airbyte_cdk.sources.declarative.transformations import AddFields, RemoveFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+from airbyte_cdk.sources.streams.http import AdaptiveConcurrencyLimiter
 from airbyte_cdk.sources.streams.http.error_handlers.response_models import ResponseAction
 from airbyte_cdk.sources.streams.http.requests_native_auth.oauth import SingleUseRefreshTokenOauth2Authenticator
 from unit_tests.sources.declarative.parsers.testing_components import TestingCustomSubstreamPartitionRouter, TestingSomeComponent
@@ -481,6 +482,8 @@ def test_create_substream_partition_router():
         - stream: "#/stream_B"
           parent_key: someid
           partition_field: word_id
+      stream_parent_records: true
+      parent_read_concurrency: 2
     """
     parsed_manifest = YamlDeclarativeSource._parse(content)
     resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
@@ -504,6 +507,8 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].parent_key.eval({}) == "someid"
     assert partition_router.parent_stream_configs[1].partition_field.eval({}) == "word_id"
     assert partition_router.parent_stream_configs[1].request_option is None
+    assert partition_router.stream_parent_records
+    assert partition_router.parent_read_concurrency == 2
 
 
 def test_datetime_based_cursor():
@@ -664,6 +669,50 @@ list_stream:
     assert list_stream_slicer._cursor_field.string == "a_key"
 
 
+def test_stream_with_incremental_with_partition_limits_and_retriever_with_partition_router(tmp_path):
+    content = f"""
+list_stream:
+  type: DeclarativeStream
+  incremental_sync:
+    type: DatetimeBasedCursor
+    datetime_format: "%Y-%m-%d"
+    start_datetime: "{{{{ config['start_time'] }}}}"
+    cursor_field: "created"
+    max_cursors_in_memory: 100
+    max_partitions_in_state: 1000
+    spill_directory: "{tmp_path}"
+  retriever:
+    type: SimpleRetriever
+    partition_router:
+      type: ListPartitionRouter
+      values: "{{{{config['repos']}}}}"
+      cursor_field: a_key
+    requester:
+      type: HttpRequester
+      url_base: "https://api.sendgrid.com/v3/"
+      path: "/lists"
+    record_selector:
+      type: RecordSelector
+      extractor:
+        type: DpathExtractor
+        field_path: []
+  $parameters:
+    name: "lists"
+    """
+
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    stream_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["list_stream"], {})
+
+    stream = factory.create_component(model_type=DeclarativeStreamModel, component_definition=stream_manifest, config=input_config)
+
+    assert isinstance(stream.retriever.stream_slicer, PerPartitionCursor)
+    cursor_store = stream.retriever.stream_slicer._cursor_per_partition
+    assert cursor_store._max_cursors_in_memory == 100
+    assert cursor_store._max_partitions_in_state == 1000
+    assert cursor_store._spill_directory == str(tmp_path)
+
+
 def test_resumable_full_refresh_stream():
     content = """
 decoder:
@@ -1279,6 +1328,19 @@ authenticator:
     assert isinstance(authenticator, expected_authenticator_class)
 
 
+def test_given_concurrency_limiter_when_create_requesters_then_limiter_is_shared_by_requesters():
+    concurrency_limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+    limited_factory = ModelToComponentFactory(concurrency_limiter=concurrency_limiter)
+    requester_manifest = {"type": "HttpRequester", "url_base": "https://api.sendgrid.com/v3/", "path": "/lists"}
+
+    requesters = [
+        limited_factory.create_component(model_type=HttpRequesterModel, component_definition=requester_manifest, config=input_config, name=name)
+        for name in ["lists", "campaigns"]
+    ]
+
+    assert all(requester._http_client._concurrency_limiter is concurrency_limiter for requester in requesters)
+
+
 def test_create_composite_error_handler():
     content = """
         error_handler:
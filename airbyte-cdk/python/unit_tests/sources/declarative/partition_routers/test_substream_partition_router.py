@@ -230,6 +230,113 @@ def test_substream_slicer(parent_stream_configs, expected_slices):
     assert slices == expected_slices
 
 
+@pytest.mark.parametrize("parent_read_concurrency", [1, 4])
+@pytest.mark.parametrize("stream_parent_records", [False, True])
+def test_given_streaming_or_concurrent_read_when_stream_slices_then_return_all_slices(stream_parent_records, parent_read_concurrency):
+    parent_stream_configs = [
+        ParentStreamConfig(
+            stream=MockStream(parent_slices, data_first_parent_slice + data_second_parent_slice, "first_stream"),
+            parent_key="id",
+            partition_field="first_stream_id",
+            parameters={},
+            config={},
+        ),
+        ParentStreamConfig(
+            stream=MockStream(second_parent_stream_slice, more_records, "second_stream"),
+            parent_key="id",
+            partition_field="second_stream_id",
+            parameters={},
+            config={},
+        ),
+    ]
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=parent_stream_configs,
+        parameters={},
+        config={},
+    )
+    partition_router.stream_parent_records = stream_parent_records
+    partition_router.parent_read_concurrency = parent_read_concurrency
+
+    slices = list(partition_router.stream_slices())
+
+    first_stream_slices = [s for s in slices if "first_stream_id" in s]
+    second_stream_slices = [s for s in slices if "second_stream_id" in s]
+    assert first_stream_slices == [
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+        {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+        {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
+    ]
+    assert second_stream_slices == [
+        {"parent_slice": {"slice": "second_parent"}, "second_stream_id": 10},
+        {"parent_slice": {"slice": "second_parent"}, "second_stream_id": 20},
+    ]
+
+
+@pytest.mark.parametrize("parent_read_concurrency", [1, 4])
+def test_given_stream_parent_records_when_stream_slices_then_parent_state_is_updated_once_slices_of_parent_slice_are_emitted(
+    parent_read_concurrency,
+):
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=MockStream(parent_slices, all_parent_data_with_cursor, "first_stream", cursor_field="cursor"),
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+                incremental_dependency=True,
+            )
+        ],
+        parameters={},
+        config={},
+    )
+    partition_router.stream_parent_records = True
+    partition_router.parent_read_concurrency = parent_read_concurrency
+
+    slices = iter(partition_router.stream_slices())
+    next(slices)
+    next(slices)
+    assert partition_router.get_stream_state() == {}
+
+    next(slices)
+    assert partition_router.get_stream_state() == {"first_stream": {"states": [{"cursor": "first_cursor_1", "partition": "first"}]}}
+
+    list(slices)
+    assert partition_router.get_stream_state() == {
+        "first_stream": {
+            "states": [{"cursor": "first_cursor_1", "partition": "first"}, {"cursor": "second_cursor_2", "partition": "second"}]
+        }
+    }
+
+
+def test_given_parent_stream_raises_when_reading_in_background_then_raise_from_stream_slices():
+    class FailingStream(MockStream):
+        def read_records(self, *args, **kwargs):
+            yield {"id": 0, "slice": "first"}
+            raise ValueError("parent stream failure")
+
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=FailingStream(parent_slices, [], "first_stream"),
+                parent_key="id",
+                partition_field="first_stream_id",
+                parameters={},
+                config={},
+            )
+        ],
+        parameters={},
+        config={},
+    )
+    partition_router.stream_parent_records = True
+    partition_router.parent_read_concurrency = 2
+
+    slices = iter(partition_router.stream_slices())
+    assert next(slices) == {"parent_slice": {"slice": "first"}, "first_stream_id": 0}
+    with pytest.raises(ValueError, match="parent stream failure"):
+        next(slices)
+
+
 @pytest.mark.parametrize(
     "parent_stream_request_parameters, expected_req_params, expected_headers, expected_body_json, expected_body_data",
     [
@@ -105,3 +105,20 @@ def test_reset_with_initial_token():
     strategy.reset("https://for-all-mankind.nasa.com/api/v1/astronauts")
 
     assert strategy.initial_token == "https://for-all-mankind.nasa.com/api/v1/astronauts"
+
+
+@pytest.mark.parametrize(
+    "cursor_value, stop_condition, expected_depends_on_records",
+    [
+        pytest.param("{{ response.next_page }}", None, False, id="test_token_from_response"),
+        pytest.param(
+            "{{ headers.link.next.url }}", "{{ not headers.link.next.url }}", False, id="test_token_and_stop_condition_from_headers"
+        ),
+        pytest.param("{{ last_record.id }}", None, True, id="test_token_from_last_record"),
+        pytest.param("{{ response.next_page }}", "{{ last_page_size < 10 }}", True, id="test_stop_condition_from_last_page_size"),
+    ],
+)
+def test_next_page_token_depends_on_records(cursor_value, stop_condition, expected_depends_on_records):
+    strategy = CursorPaginationStrategy(cursor_value=cursor_value, stop_condition=stop_condition, config={}, parameters={})
+
+    assert strategy.next_page_token_depends_on_records == expected_depends_on_records
@@ -311,3 +311,34 @@ def test_paginator_with_page_option_no_page_size():
             url_base=MagicMock(),
             parameters={},
         ),
+
+
+def test_given_next_page_token_when_get_request_params_then_use_token_over_state_of_paginator():
+    page_token_request_option = RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={})
+    strategy = OffsetIncrement(config={}, page_size=2, parameters={}, inject_on_first_request=True)
+    paginator = DefaultPaginator(strategy, {}, "https://airbyte.io", parameters={}, page_token_option=page_token_request_option)
+
+    assert paginator.get_request_params(next_page_token={"next_page_token": 6}) == {"offset": 6}
+    assert paginator.get_request_params() == {"offset": 0}
+
+
+@pytest.mark.parametrize(
+    "page_token_option, expected_remaining_page_tokens",
+    [
+        pytest.param(
+            RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={}),
+            [{"next_page_token": 2}, {"next_page_token": 4}],
+            id="test_request_option",
+        ),
+        pytest.param(RequestPath(parameters={}), None, id="test_request_path"),
+    ],
+)
+def test_get_remaining_page_tokens(page_token_option, expected_remaining_page_tokens):
+    strategy = OffsetIncrement(config={}, page_size=2, parameters={}, total_records="{{ response.total }}")
+    paginator = DefaultPaginator(strategy, {}, "https://airbyte.io", parameters={}, page_token_option=page_token_option)
+    response = requests.Response()
+    response._content = json.dumps({"total": 5}).encode("utf-8")
+
+    paginator.next_page_token(response, 2, None)
+
+    assert paginator.get_remaining_page_tokens(response) == expected_remaining_page_tokens
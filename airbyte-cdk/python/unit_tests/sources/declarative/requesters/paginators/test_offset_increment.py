@@ -78,3 +78,22 @@ def test_offset_increment_reset(reset_value, expected_initial_token, expected_er
         else:
             paginator_strategy.reset(reset_value=reset_value)
         assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "total_records, response_body, expected_remaining_page_tokens",
+    [
+        pytest.param("{{ response.total }}", {"total": 95}, [20, 40, 60, 80], id="test_total_from_response"),
+        pytest.param("{{ response.total }}", {"total": 40}, [20], id="test_total_is_multiple_of_page_size"),
+        pytest.param("{{ response.total }}", {"total": 20}, [], id="test_no_page_left"),
+        pytest.param("{{ response.total }}", {}, None, id="test_total_missing_from_response"),
+        pytest.param(None, {"total": 95}, None, id="test_without_total_records"),
+    ],
+)
+def test_offset_increment_remaining_page_tokens(total_records, response_body, expected_remaining_page_tokens):
+    paginator_strategy = OffsetIncrement(page_size=20, parameters={}, config={}, total_records=total_records)
+    response = requests.Response()
+    response._content = json.dumps(response_body).encode("utf-8")
+
+    assert paginator_strategy.next_page_token(response, 20, None) == 20
+    assert paginator_strategy.get_remaining_page_tokens(response) == expected_remaining_page_tokens
@@ -87,3 +87,22 @@ def test_offset_increment_reset(reset_value, expected_initial_token, expected_er
     else:
         paginator_strategy.reset(reset_value=reset_value)
         assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "start_from_page, total_pages, response_body, expected_remaining_page_tokens",
+    [
+        pytest.param(0, "{{ response.total_pages }}", {"total_pages": 4}, [1, 2, 3], id="test_start_from_page_0"),
+        pytest.param(1, "{{ response.total_pages }}", {"total_pages": 4}, [2, 3, 4], id="test_start_from_page_1"),
+        pytest.param(1, "{{ response.total_pages }}", {"total_pages": 1}, [], id="test_no_page_left"),
+        pytest.param(1, "{{ response.total_pages }}", {}, None, id="test_total_missing_from_response"),
+        pytest.param(1, None, {"total_pages": 4}, None, id="test_without_total_pages"),
+    ],
+)
+def test_page_increment_remaining_page_tokens(start_from_page, total_pages, response_body, expected_remaining_page_tokens):
+    paginator_strategy = PageIncrement(page_size=2, parameters={}, config={}, start_from_page=start_from_page, total_pages=total_pages)
+    response = requests.Response()
+    response._content = json.dumps(response_body).encode("utf-8")
+
+    assert paginator_strategy.next_page_token(response, 2, None) == start_from_page + 1
+    assert paginator_strategy.get_remaining_page_tokens(response) == expected_remaining_page_tokens
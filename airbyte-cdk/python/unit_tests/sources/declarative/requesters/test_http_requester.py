@@ -17,6 +17,7 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.error_handler imp
 from airbyte_cdk.sources.declarative.requesters.http_requester import HttpMethod, HttpRequester
 from airbyte_cdk.sources.declarative.requesters.request_options import InterpolatedRequestOptionsProvider
 from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.http import AdaptiveConcurrencyLimiter
 from airbyte_cdk.sources.streams.http.exceptions import RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.types import Config
 from requests import PreparedRequest
@@ -195,6 +196,26 @@ def test_basic_send_request():
     assert sent_request.body is None
 
 
+def test_given_concurrency_limiter_when_send_request_then_request_goes_through_limiter():
+    concurrency_limiter = AdaptiveConcurrencyLimiter(max_concurrency=2)
+    requester = HttpRequester(
+        name="name",
+        url_base="https://example.com",
+        path="deals",
+        config={},
+        parameters={},
+        concurrency_limiter=concurrency_limiter,
+    )
+    response = requests.Response()
+    response.status_code = 200
+    requester._http_client._session.send = MagicMock(return_value=response)
+
+    requester.send_request()
+
+    assert concurrency_limiter.stats().requests == 1
+    assert concurrency_limiter.stats().in_flight_requests == 0
+
+
 @pytest.mark.parametrize(
     "provider_data, provider_json, param_data, param_json, authenticator_data, authenticator_json, expected_exception, expected_body",
     [
@@ -3,6 +3,8 @@
 #
 
 import json
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -12,11 +14,11 @@ from airbyte_cdk.sources.declarative.auth.declarative_authenticator import NoAut
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor, DeclarativeCursor, ResumableFullRefreshCursor
 from airbyte_cdk.sources.declarative.partition_routers import SinglePartitionRouter
 from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
-from airbyte_cdk.sources.declarative.requesters.paginators.strategies import CursorPaginationStrategy, PageIncrement
-from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies import CursorPaginationStrategy, OffsetIncrement, PageIncrement
+from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever, SimpleRetrieverTestReadDecorator
-from airbyte_cdk.sources.types import Record
+from airbyte_cdk.sources.types import Record, StreamSlice
 
 A_SLICE_STATE = {"slice_state": "slice state value"}
 A_STREAM_SLICE = {"stream slice": "slice value"}
@@ -723,3 +725,205 @@ def test_emit_log_request_response_messages(mocker):
 
     assert requester.send_request.call_args_list[0][1]["log_formatter"] is not None
     assert requester.send_request.call_args_list[0][1]["log_formatter"](response) == format_http_message_mock.return_value
+
+
+def _paginated_response(records_of_page, next_page):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({"data": records_of_page, "next_page": next_page}).encode("utf-8")
+    return response
+
+
+def _create_retriever_with_page_prefetch(requester, cursor_value, page_prefetch_depth):
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda response, **kwargs: [
+        Record(data, associated_slice=None) for data in response.json()["data"]
+    ]
+    paginator = DefaultPaginator(
+        config={},
+        pagination_strategy=CursorPaginationStrategy(cursor_value=cursor_value, config={}, parameters={}),
+        url_base="https://airbyte.io",
+        parameters={},
+    )
+    return SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        page_prefetch_depth=page_prefetch_depth,
+        parameters={},
+        config={},
+    )
+
+
+def test_given_page_prefetch_when_read_records_then_fetch_next_page_while_records_are_processed():
+    responses = [
+        _paginated_response([{"id": 1}, {"id": 2}], "page_2"),
+        _paginated_response([{"id": 3}], "page_3"),
+        _paginated_response([{"id": 4}], None),
+    ]
+    second_page_requested = threading.Event()
+
+    def send_request(**kwargs):
+        if kwargs["next_page_token"] == {"next_page_token": "page_2"}:
+            second_page_requested.set()
+        return responses.pop(0)
+
+    requester = MagicMock()
+    requester.send_request.side_effect = send_request
+    retriever = _create_retriever_with_page_prefetch(requester, "{{ response.next_page }}", page_prefetch_depth=1)
+
+    records_read = retriever.read_records(records_schema={}, stream_slice=StreamSlice(partition={}, cursor_slice={}))
+    first_record = next(records_read)
+
+    assert second_page_requested.wait(timeout=5)
+    assert [first_record.data] + [record.data for record in records_read] == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+    assert [call.kwargs["next_page_token"] for call in requester.send_request.call_args_list] == [
+        None,
+        {"next_page_token": "page_2"},
+        {"next_page_token": "page_3"},
+    ]
+
+
+def test_given_next_page_token_depends_on_records_when_read_records_then_do_not_prefetch_pages():
+    responses = [
+        _paginated_response([{"id": 1}, {"id": 2}], "has_next_page"),
+        _paginated_response([{"id": 3}], "has_next_page"),
+        _paginated_response([], None),
+    ]
+    requesting_threads = []
+
+    def send_request(**kwargs):
+        requesting_threads.append(threading.current_thread())
+        return responses.pop(0)
+
+    requester = MagicMock()
+    requester.send_request.side_effect = send_request
+    retriever = _create_retriever_with_page_prefetch(requester, "{{ response.next_page and last_record.id }}", page_prefetch_depth=2)
+
+    records_read = list(retriever.read_records(records_schema={}, stream_slice=StreamSlice(partition={}, cursor_slice={})))
+
+    assert [record.data for record in records_read] == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert [call.kwargs["next_page_token"] for call in requester.send_request.call_args_list] == [
+        None,
+        {"next_page_token": 2},
+        {"next_page_token": 3},
+    ]
+    assert requesting_threads == [threading.current_thread()] * 3
+
+
+def test_given_page_prefetch_when_request_fails_then_raise_exception_after_records_of_previous_pages():
+    requester = MagicMock()
+    requester.send_request.side_effect = [_paginated_response([{"id": 1}], "page_2"), ValueError("request failed")]
+    retriever = _create_retriever_with_page_prefetch(requester, "{{ response.next_page }}", page_prefetch_depth=1)
+
+    records_read = retriever.read_records(records_schema={}, stream_slice=StreamSlice(partition={}, cursor_slice={}))
+
+    assert next(records_read).data == {"id": 1}
+    with pytest.raises(ValueError):
+        next(records_read)
+
+
+def test_given_page_prefetch_when_stop_reading_then_stop_fetching_pages():
+    requester = MagicMock()
+    requester.send_request.side_effect = lambda **kwargs: _paginated_response([{"id": 1}], "next_page")
+    retriever = _create_retriever_with_page_prefetch(requester, "{{ response.next_page }}", page_prefetch_depth=2)
+
+    records_read = retriever.read_records(records_schema={}, stream_slice=StreamSlice(partition={}, cursor_slice={}))
+    next(records_read)
+    records_read.close()
+    number_of_requests = requester.send_request.call_count
+
+    assert number_of_requests <= 3
+    assert requester.send_request.call_count == number_of_requests
+
+
+def _create_retriever_with_concurrent_page_requests(requester, concurrent_page_requests, cursor=None):
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda response, **kwargs: [
+        Record(data, associated_slice=None) for data in response.json()["data"]
+    ]
+    paginator = DefaultPaginator(
+        config={},
+        pagination_strategy=OffsetIncrement(config={}, page_size=2, parameters={}, total_records="{{ response.total }}"),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={}),
+        url_base="https://airbyte.io",
+        parameters={},
+    )
+    return SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        stream_slicer=cursor or SinglePartitionRouter(parameters={}),
+        cursor=cursor,
+        concurrent_page_requests=concurrent_page_requests,
+        parameters={},
+        config={},
+    )
+
+
+def _create_offset_requester(number_of_records, total_records):
+    """
+    Return a requester returning pages of 2 records out of `number_of_records` records with a total of `total_records` in the response
+    """
+    requester = MagicMock()
+    lock = threading.Lock()
+    requests_in_flight = [0]
+    requester.max_requests_in_flight = 0
+
+    def send_request(**kwargs):
+        offset = kwargs["request_params"].get("offset", 0)
+        with lock:
+            requests_in_flight[0] += 1
+            requester.max_requests_in_flight = max(requester.max_requests_in_flight, requests_in_flight[0])
+        # The first pages are the slowest so that the responses are received out of order
+        time.sleep(0.05 if offset == 2 else 0.01)
+        with lock:
+            requests_in_flight[0] -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {"data": [{"id": record_id} for record_id in range(offset, min(offset + 2, number_of_records))], "total": total_records}
+        ).encode("utf-8")
+        return response
+
+    requester.send_request.side_effect = send_request
+    return requester
+
+
+def test_given_total_records_when_read_records_then_request_pages_concurrently_and_emit_records_in_page_order():
+    requester = _create_offset_requester(number_of_records=9, total_records=9)
+    retriever = _create_retriever_with_concurrent_page_requests(requester, concurrent_page_requests=3)
+
+    records_read = list(retriever.read_records(records_schema={}, stream_slice=StreamSlice(partition={}, cursor_slice={})))
+
+    assert [record["id"] for record in records_read] == list(range(9))
+    assert sorted(call.kwargs["request_params"].get("offset", 0) for call in requester.send_request.call_args_list) == [0, 2, 4, 6, 8]
+    assert requester.max_requests_in_flight > 1
+
+
+def test_given_total_records_lower_than_actual_number_of_records_when_read_records_then_read_remaining_pages_serially():
+    requester = _create_offset_requester(number_of_records=9, total_records=4)
+    retriever = _create_retriever_with_concurrent_page_requests(requester, concurrent_page_requests=3)
+
+    records_read = list(retriever.read_records(records_schema={}, stream_slice=StreamSlice(partition={}, cursor_slice={})))
+
+    assert [record["id"] for record in records_read] == list(range(9))
+
+
+def test_given_resumable_full_refresh_when_request_pages_concurrently_then_checkpoint_after_each_batch_of_pages():
+    requester = _create_offset_requester(number_of_records=9, total_records=9)
+    cursor = ResumableFullRefreshCursor(parameters={})
+    retriever = _create_retriever_with_concurrent_page_requests(requester, concurrent_page_requests=2, cursor=cursor)
+    stream_slice = list(cursor.stream_slices())[0]
+
+    first_records_read = list(retriever.read_records(records_schema={}, stream_slice=stream_slice))
+    assert [record["id"] for record in first_records_read] == list(range(6))
+    assert retriever.state == {"next_page_token": 6}
+
+    second_records_read = list(retriever.read_records(records_schema={}, stream_slice=list(cursor.stream_slices())[0]))
+    assert [record["id"] for record in second_records_read] == [6, 7, 8]
+    assert retriever.state == {"__ab_full_refresh_sync_complete": True}
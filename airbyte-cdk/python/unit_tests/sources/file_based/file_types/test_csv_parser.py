@@ -25,7 +25,7 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CastPlan, _CsvReader
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -117,6 +117,41 @@ def test_cast_to_python_type(row: Dict[str, str], true_values: Set[str], false_v
     assert CsvParser._cast_types(row, PROPERTY_TYPES, csv_format, logger) == expected_output
 
 
+def test_given_many_rows_when_cast_then_cast_by_position_and_ignore_columns_not_in_schema() -> None:
+    cast_plan = _CastPlan({"col2": "boolean", "col3": "integer", "col5": "string"}, CsvFormat())
+
+    rows = [cast_plan.cast({"col11": "x", "col2": "true", "col3": str(i), "col5": "asdf"}) for i in range(3)]
+
+    assert rows == [{"col2": True, "col3": i, "col5": "asdf"} for i in range(3)]
+
+
+def test_given_row_with_different_columns_when_cast_then_cast_using_column_names() -> None:
+    cast_plan = _CastPlan({"col2": "boolean", "col3": "integer"}, CsvFormat())
+    cast_plan.cast({"col2": "true", "col3": "1"})
+
+    assert cast_plan.cast({"col3": "2", "col2": "false", None: ["extra value"]}) == {"col3": 2, "col2": False}
+    assert cast_plan.cast({"col2": "true", "col3": "3"}) == {"col2": True, "col3": 3}
+
+
+def test_given_invalid_values_when_log_invalid_values_then_log_once_per_column() -> None:
+    cast_plan = _CastPlan({"col2": "boolean", "col3": "integer", "col4": "number"}, CsvFormat())
+    for row in [
+        {"col2": "10", "col3": "1.1", "col4": "1.1"},
+        {"col2": "true", "col3": "a", "col4": "1"},
+        {"col2": "20", "col3": "b", "col4": "2"},
+    ]:
+        cast_plan.cast(row)
+    logger = Mock(spec=logging.Logger)
+
+    cast_plan.log_invalid_values(logger)
+    cast_plan.log_invalid_values(logger)
+
+    assert logger.warning.call_args_list == [
+        mock.call("Could not cast the value to the expected type.: col2: value=10,expected_type=boolean,n_invalid_values=2"),
+        mock.call("Could not cast the value to the expected type.: col3: value=1.1,expected_type=integer,n_invalid_values=3"),
+    ]
+
+
 @pytest.mark.parametrize(
     "row, strings_can_be_null, expected_output",
     [
@@ -9,6 +9,7 @@ from typing import Any, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -272,3 +273,36 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     logger = Mock()
     with pytest.raises(ValueError):
         asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+
+
+@pytest.mark.parametrize("record_batch_size", [pytest.param(2, id="multiple_batches"), pytest.param(10_000, id="single_batch")])
+def test_parse_records_converts_columns_like_scalars(record_batch_size: int) -> None:
+    table = pa.table(
+        {
+            "id": pa.array([1, 2, None], type=pa.int64()),
+            "updated_at": pa.array([datetime.datetime(2023, 7, 7, 10, 11, 12), None, datetime.datetime(2024, 1, 1)], type=pa.timestamp("s")),
+            "amount": pa.array([12, None, 13], type=pa.decimal128(5, 3)),
+            "payload": pa.array([b"a", b"b", None], type=pa.binary()),
+            "elapsed": pa.array([12345, 1, None], type=pa.duration("ms")),
+            "attributes": pa.array([{"hello": 1}, None, {"world": 2}], type=pa.map_(pa.string(), pa.int32())),
+            "category": pa.DictionaryArray.from_arrays(pa.array([0, 1, 0], type=pa.int8()), ["apple", "banana"]),
+        }
+    )
+    output = pa.BufferOutputStream()
+    pq.write_table(table, output, row_group_size=3)
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=pa.BufferReader(output.getvalue()))
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    config = FileBasedStreamConfig(name="test", format=_default_parquet_format, validation_policy=ValidationPolicy.emit_record)
+    file = RemoteFile(uri="s3://mybucket/year=2023/test.parquet", last_modified=datetime.datetime.now())
+
+    records = list(ParquetParser(record_batch_size=record_batch_size).parse_records(config, file, stream_reader, Mock(), None))
+
+    expected_records = [
+        {
+            **{column: ParquetParser._to_output_value(table.column(column)[row], _default_parquet_format) for column in table.column_names},
+            "year": "2023",
+        }
+        for row in range(table.num_rows)
+    ]
+    assert records == expected_records
@@ -220,11 +220,7 @@ single_stream_user_input_schema_scenario_skip_nonconforming_records = (
                 },
                 {
                     "level": "WARN",
-                    "message": "Could not cast the value to the expected type.: col1: value=val11,expected_type=integer",
-                },
-                {
-                    "level": "WARN",
-                    "message": "Could not cast the value to the expected type.: col1: value=val21,expected_type=integer",
+                    "message": "Could not cast the value to the expected type.: col1: value=val11,expected_type=integer,n_invalid_values=2",
                 },
             ]
         }
@@ -604,11 +600,7 @@ multi_stream_user_input_schema_scenario_emit_nonconforming_records = (
             "read": [
                 {
                     "level": "WARN",
-                    "message": "Could not cast the value to the expected type.: col2: value=val12b,expected_type=integer",
-                },
-                {
-                    "level": "WARN",
-                    "message": "Could not cast the value to the expected type.: col2: value=val22b,expected_type=integer",
+                    "message": "Could not cast the value to the expected type.: col2: value=val12b,expected_type=integer,n_invalid_values=2",
                 },
             ]
         }
@@ -746,11 +738,7 @@ multi_stream_user_input_schema_scenario_skip_nonconforming_records = (
                 },
                 {
                     "level": "WARN",
-                    "message": "Could not cast the value to the expected type.: col2: value=val12b,expected_type=integer",
-                },
-                {
-                    "level": "WARN",
-                    "message": "Could not cast the value to the expected type.: col2: value=val22b,expected_type=integer",
+                    "message": "Could not cast the value to the expected type.: col2: value=val12b,expected_type=integer,n_invalid_values=2",
                 },
             ]
         }
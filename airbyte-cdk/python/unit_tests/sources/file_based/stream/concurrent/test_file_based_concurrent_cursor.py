@@ -1,9 +1,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, MutableMapping, Optional, Tuple
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from airbyte_cdk.models import AirbyteStateMessage, SyncMode
@@ -18,7 +18,11 @@ DATE_TIME_FORMAT = FileBasedConcurrentCursor.DATE_TIME_FORMAT
 MOCK_DAYS_TO_SYNC_IF_HISTORY_IS_FULL = 3
 
 
-def _make_cursor(input_state: Optional[MutableMapping[str, Any]]) -> FileBasedConcurrentCursor:
+def _make_cursor(
+    input_state: Optional[MutableMapping[str, Any]],
+    state_emission_interval: Optional[timedelta] = FileBasedConcurrentCursor.DEFAULT_STATE_EMISSION_INTERVAL,
+    files_between_state_emissions: Optional[int] = FileBasedConcurrentCursor.DEFAULT_FILES_BETWEEN_STATE_EMISSIONS,
+) -> FileBasedConcurrentCursor:
     stream = MagicMock()
     stream.name = "test"
     stream.namespace = None
@@ -35,6 +39,8 @@ def _make_cursor(input_state: Optional[MutableMapping[str, Any]]) -> FileBasedCo
             state=[AirbyteStateMessage.parse_obj(input_state)] if input_state is not None else None,
         ),
         CursorField(FileBasedConcurrentCursor.CURSOR_FIELD),
+        state_emission_interval,
+        files_between_state_emissions,
     )
     return cursor
 
@@ -155,7 +161,7 @@ def test_add_file(
     expected_pending_files: List[Tuple[str, str]],
     expected_cursor_value: str,
 ):
-    cursor = _make_cursor(initial_state)
+    cursor = _make_cursor(initial_state, files_between_state_emissions=1)
     mock_message_repository = MagicMock()
     cursor._message_repository = mock_message_repository
     stream = MagicMock()
@@ -218,7 +224,7 @@ def test_add_file_invalid(
     expected_pending_files: List[Tuple[str, str]],
     expected_cursor_value: str,
 ):
-    cursor = _make_cursor(initial_state)
+    cursor = _make_cursor(initial_state, files_between_state_emissions=1)
     cursor._pending_files = {
         uri: RemoteFile(uri=uri, last_modified=datetime.strptime(timestamp, DATE_TIME_FORMAT)) for uri, timestamp in pending_files
     }
@@ -456,3 +462,74 @@ def test_compute_start_time(input_history, is_history_full, expected_start_time,
     cursor._file_to_datetime_history = input_history
     cursor._is_history_full = MagicMock(return_value=is_history_full)
     assert cursor._compute_start_time() == expected_start_time
+
+
+def _add_files(cursor: FileBasedConcurrentCursor, files: List[Tuple[str, str]]) -> None:
+    remote_files = [RemoteFile(uri=uri, last_modified=datetime.strptime(timestamp, DATE_TIME_FORMAT)) for uri, timestamp in files]
+    cursor._pending_files = {file.uri: file for file in remote_files}
+    for file in remote_files:
+        cursor.add_file(file)
+
+
+def test_given_files_between_state_emissions_when_add_file_then_only_emit_state_every_n_files():
+    cursor = _make_cursor({}, state_emission_interval=None, files_between_state_emissions=2)
+    cursor._message_repository = MagicMock()
+
+    _add_files(cursor, [(f"file{i}.csv", f"2021-01-0{i}T00:00:00.000000Z") for i in range(1, 6)])
+
+    states = [call.args[0].state.stream.stream_state for call in cursor._message_repository.emit_message.call_args_list]
+    assert [state._ab_source_file_last_modified for state in states] == [
+        "2021-01-03T00:00:00.000000Z_file3.csv",
+        "2021-01-05T00:00:00.000000Z_file5.csv",
+    ]
+
+
+def test_given_state_emission_interval_when_add_file_then_emit_state_once_interval_elapsed():
+    cursor = _make_cursor({}, state_emission_interval=timedelta(seconds=10), files_between_state_emissions=None)
+    cursor._message_repository = MagicMock()
+
+    with patch("airbyte_cdk.sources.file_based.stream.concurrent.cursor.file_based_concurrent_cursor.time.monotonic") as monotonic:
+        monotonic.return_value = cursor._last_state_emission_time + 5
+        _add_files(cursor, [("file1.csv", "2021-01-01T00:00:00.000000Z")])
+        assert cursor._message_repository.emit_message.call_count == 0
+
+        monotonic.return_value = cursor._last_state_emission_time + 10
+        _add_files(cursor, [("file2.csv", "2021-01-02T00:00:00.000000Z")])
+        assert cursor._message_repository.emit_message.call_count == 1
+
+
+def test_given_throttled_state_when_ensure_at_least_one_state_emitted_then_emit_final_state():
+    cursor = _make_cursor({}, state_emission_interval=None, files_between_state_emissions=None)
+    cursor._message_repository = MagicMock()
+    _add_files(cursor, [(f"file{i}.csv", f"2021-01-0{i}T00:00:00.000000Z") for i in range(1, 4)])
+    assert cursor._message_repository.emit_message.call_count == 0
+
+    cursor.ensure_at_least_one_state_emitted()
+
+    state = cursor._message_repository.emit_message.call_args_list[-1].args[0].state.stream.stream_state
+    assert state._ab_source_file_last_modified == "2021-01-03T00:00:00.000000Z_file3.csv"
+    assert len(state.history) == 3
+
+
+def test_given_history_is_full_when_add_file_then_evict_earliest_file_skipping_files_updated_since():
+    cursor = _make_cursor(
+        {
+            "history": {
+                "a.csv": "2021-01-01T00:00:00.000000Z",
+                "b.csv": "2021-01-02T00:00:00.000000Z",
+                "c.csv": "2021-01-03T00:00:00.000000Z",
+            }
+        }
+    )
+    cursor.DEFAULT_MAX_HISTORY_SIZE = 3
+
+    _add_files(cursor, [("a.csv", "2021-01-05T00:00:00.000000Z"), ("d.csv", "2021-01-04T00:00:00.000000Z")])
+
+    assert cursor._file_to_datetime_history == {
+        "a.csv": "2021-01-05T00:00:00.000000Z",
+        "c.csv": "2021-01-03T00:00:00.000000Z",
+        "d.csv": "2021-01-04T00:00:00.000000Z",
+    }
+    assert cursor._compute_earliest_file_in_history() == RemoteFile(
+        uri="c.csv", last_modified=datetime.strptime("2021-01-03T00:00:00.000000Z", DATE_TIME_FORMAT)
+    )
@@ -79,16 +79,21 @@ def _verify_read_output(output: EntrypointOutput, scenario: TestScenario[Abstrac
 
     expected_records = [r for r in scenario.expected_records] if scenario.expected_records else []
 
+    # the stream is part of the key as streams can be read concurrently and have records with the same data
     sorted_expected_records = sorted(
         filter(lambda e: "data" in e, expected_records),
-        key=lambda record: ",".join(
-            f"{k}={v}" for k, v in sorted(record["data"].items(), key=lambda items: (items[0], items[1])) if k != "emitted_at"
+        key=lambda record: (
+            record["stream"],
+            ",".join(f"{k}={v}" for k, v in sorted(record["data"].items(), key=lambda items: (items[0], items[1])) if k != "emitted_at"),
         ),
     )
     sorted_records = sorted(
         filter(lambda r: r.record, records_and_state_messages),
-        key=lambda record: ",".join(
-            f"{k}={v}" for k, v in sorted(record.record.data.items(), key=lambda items: (items[0], items[1])) if k != "emitted_at"
+        key=lambda record: (
+            record.record.stream,
+            ",".join(
+                f"{k}={v}" for k, v in sorted(record.record.data.items(), key=lambda items: (items[0], items[1])) if k != "emitted_at"
+            ),
         ),
     )
 
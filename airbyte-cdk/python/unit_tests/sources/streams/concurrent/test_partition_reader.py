@@ -10,7 +10,7 @@ import pytest
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record, RecordBatch
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 
 _RECORDS = [
@@ -50,6 +50,54 @@ class PartitionReaderTest(unittest.TestCase):
 
         assert queue_content == _RECORDS + [StreamThreadException(exception, partition.stream_name()), PartitionCompleteSentinel(partition)]
 
+    def test_given_batching_when_process_partition_then_queue_record_batches_and_sentinel(self):
+        partition = self._a_partition(_RECORDS + [Record({"id": 3, "name": "Jane"}, "stream")])
+        partition.stream_name.return_value = "stream"
+
+        PartitionReader(self._queue, max_records_per_batch=2).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(_RECORDS, "stream"),
+            RecordBatch([Record({"id": 3, "name": "Jane"}, "stream")], "stream"),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_byte_limit_reached_when_process_partition_then_flush_batch_before_record_count_limit(self):
+        partition = self._a_partition(_RECORDS)
+        partition.stream_name.return_value = "stream"
+
+        PartitionReader(self._queue, max_records_per_batch=100, max_bytes_per_batch=1).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch([_RECORDS[0]], "stream"),
+            RecordBatch([_RECORDS[1]], "stream"),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_batching_and_exception_when_process_partition_then_flush_records_before_exception(self):
+        partition = Mock()
+        partition.stream_name.return_value = "stream"
+        exception = ValueError()
+        partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
+
+        PartitionReader(self._queue, max_records_per_batch=100).process_partition(partition)
+
+        queue_content = self._consume_queue()
+
+        assert queue_content == [
+            RecordBatch(_RECORDS, "stream"),
+            StreamThreadException(exception, "stream"),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_invalid_batch_size_when_init_then_raise(self):
+        with pytest.raises(ValueError):
+            PartitionReader(self._queue, max_records_per_batch=0)
+
     def _a_partition(self, records: List[Record]) -> Partition:
         partition = Mock(spec=Partition)
         partition.read.return_value = iter(records)
@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import threading
+import time
+from email.utils import formatdate
+from typing import Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+
+def _response(status_code: int, headers: Optional[Mapping[str, str]] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.mark.parametrize(
+    "min_concurrency, max_concurrency, decrease_factor",
+    [
+        pytest.param(0, 4, 0.5, id="min concurrency lower than 1"),
+        pytest.param(4, 2, 0.5, id="max concurrency lower than min concurrency"),
+        pytest.param(1, 4, 1, id="decrease factor not lower than 1"),
+    ],
+)
+def test_given_invalid_parameters_when_init_then_raise_value_error(min_concurrency, max_concurrency, decrease_factor):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(max_concurrency=max_concurrency, min_concurrency=min_concurrency, decrease_factor=decrease_factor)
+
+
+def test_given_throttled_response_when_release_then_decrease_concurrency_once_for_requests_in_flight():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8)
+    tokens = [limiter.acquire() for _ in range(3)]
+
+    for token in tokens:
+        limiter.release(token, _response(429))
+
+    stats = limiter.stats()
+    assert stats.concurrency_limit == 4
+    assert stats.throttled_responses == 3
+    assert stats.concurrency_decreases == 1
+    assert stats.in_flight_requests == 0
+
+    limiter.release(limiter.acquire(), _response(429))
+    assert limiter.stats().concurrency_limit == 2
+
+
+def test_given_throttled_responses_when_release_then_never_go_below_min_concurrency():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4, min_concurrency=2)
+
+    for _ in range(5):
+        limiter.release(limiter.acquire(), _response(429))
+
+    assert limiter.stats().concurrency_limit == 2
+
+
+def test_given_successful_responses_when_release_then_increase_concurrency_up_to_max_concurrency():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=3)
+    limiter.release(limiter.acquire(), _response(429))
+    assert limiter.stats().concurrency_limit == 1
+
+    limiter.release(limiter.acquire(), _response(200))
+    assert limiter.stats().concurrency_limit == 2
+    limiter.release(limiter.acquire(), _response(200))
+    assert limiter.stats().concurrency_limit == 2
+    limiter.release(limiter.acquire(), _response(200))
+    assert limiter.stats().concurrency_limit == 3
+
+    for _ in range(10):
+        limiter.release(limiter.acquire(), _response(200))
+    assert limiter.stats().concurrency_limit == 3
+    assert limiter.stats().concurrency_increases == 2
+
+
+def test_given_error_without_throttling_when_release_then_concurrency_is_unchanged():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+
+    limiter.release(limiter.acquire(), _response(500))
+    limiter.release(limiter.acquire(), None)
+
+    assert limiter.stats().concurrency_limit == 4
+    assert limiter.stats().throttled_responses == 0
+
+
+def test_given_limit_reached_when_acquire_then_block_until_a_request_is_released():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=1)
+    token = limiter.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+
+    assert not acquired.wait(0.1)
+    limiter.release(token, _response(200))
+    assert acquired.wait(1)
+    thread.join()
+    assert limiter.stats().seconds_waiting_for_slot > 0
+
+
+@pytest.mark.parametrize(
+    "retry_after",
+    [
+        pytest.param(lambda: "1", id="delay in seconds"),
+        pytest.param(lambda: formatdate(time.time() + 2, usegmt=True), id="HTTP date"),
+    ],
+)
+def test_given_retry_after_when_release_then_no_request_is_sent_until_the_delay_is_over(retry_after):
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+    limiter.release(limiter.acquire(), _response(503, {"Retry-After": retry_after()}))
+
+    start = time.monotonic()
+    limiter.acquire()
+
+    assert time.monotonic() - start >= 0.5
+    assert limiter.stats().throttled_responses == 1
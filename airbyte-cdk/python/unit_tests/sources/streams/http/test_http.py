@@ -11,7 +11,7 @@ from unittest.mock import ANY, MagicMock, patch
 import pytest
 import requests
 from airbyte_cdk.models import SyncMode
-from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
+from airbyte_cdk.sources.streams.http import AdaptiveConcurrencyLimiter, HttpStream, HttpSubStream
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
 
@@ -147,6 +147,25 @@ def test_stub_custom_backoff_http_stream(mocker):
     # TODO(davin): Figure out how to assert calls.
 
 
+def test_given_concurrency_limiter_when_read_records_then_limiter_is_released_with_each_response(mocker):
+    mocker.patch("time.sleep", lambda x: None)
+    concurrency_limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+    stream = StubCustomBackoffHttpStream(concurrency_limiter=concurrency_limiter)
+    throttled_response = requests.Response()
+    throttled_response.status_code = 429
+    valid_response = requests.Response()
+    valid_response.status_code = 200
+    mocker.patch.object(requests.Session, "send", side_effect=[throttled_response, valid_response])
+
+    list(stream.read_records(SyncMode.full_refresh))
+
+    stats = concurrency_limiter.stats()
+    assert stats.requests == 2
+    assert stats.throttled_responses == 1
+    assert stats.concurrency_limit == 2
+    assert stats.in_flight_requests == 0
+
+
 @pytest.mark.parametrize("retries", [-20, -1, 0, 1, 2, 10])
 def test_stub_custom_backoff_http_stream_retries(mocker, retries):
     mocker.patch("time.sleep", lambda x: None)
@@ -1,5 +1,6 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
+import gc
 import logging
 from datetime import timedelta
 from unittest.mock import MagicMock, patch
@@ -8,7 +9,7 @@ import pytest
 import requests
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.streams.call_rate import CachedLimiterSession, LimiterSession
-from airbyte_cdk.sources.streams.http import HttpClient
+from airbyte_cdk.sources.streams.http import AdaptiveConcurrencyLimiter, HttpClient
 from airbyte_cdk.sources.streams.http.error_handlers import BackoffStrategy, ErrorResolution, HttpStatusErrorHandler, ResponseAction
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
@@ -300,6 +301,32 @@ def test_send_request_given_retry_response_action_retries_and_returns_valid_resp
     assert returned_response == valid_response
 
 
+def test_given_concurrency_limiter_when_send_request_then_limiter_is_released_with_each_response():
+    mocked_session = MagicMock(spec=requests.Session)
+    throttled_response = requests.Response()
+    throttled_response.status_code = 429
+    valid_response = requests.Response()
+    valid_response.status_code = 200
+    mocked_session.send.side_effect = [throttled_response, valid_response]
+    concurrency_limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+    http_client = HttpClient(
+        name="test",
+        logger=MagicMock(),
+        session=mocked_session,
+        backoff_strategy=MagicMock(spec=BackoffStrategy, backoff_time=MagicMock(return_value=0.001)),
+        concurrency_limiter=concurrency_limiter,
+    )
+
+    returned_response = http_client._send_with_retry(requests.PreparedRequest(), request_kwargs={})
+
+    assert returned_response == valid_response
+    stats = concurrency_limiter.stats()
+    assert stats.requests == 2
+    assert stats.throttled_responses == 1
+    assert stats.concurrency_limit == 2
+    assert stats.in_flight_requests == 0
+
+
 def test_session_request_exception_raises_backoff_exception():
     error_handler = HttpStatusErrorHandler(logger=MagicMock(), error_mapping={requests.exceptions.RequestException: ErrorResolution(ResponseAction.RETRY, FailureType.system_error, "test retry message")})
     mocked_session = MagicMock(spec=requests.Session)
@@ -478,3 +505,29 @@ def test_backoff_strategy_max_time():
         with pytest.raises(UserDefinedBackoffException):
             http_client.send_request(http_method="get", url="https://test_base_url.com/v1/endpoint", request_kwargs={})
         assert mocked_send.call_count == 2
+
+
+def test_given_many_requests_when_send_then_memory_used_by_request_attempt_count_is_constant():
+    response = requests.Response()
+    response.status_code = 200
+    session = requests.Session()
+    session.send = lambda request, **kwargs: response
+    http_client = HttpClient(name="test", logger=logging.getLogger("test_http_client"), session=session)
+
+    def send_requests(number_of_requests: int) -> None:
+        for _ in range(number_of_requests):
+            prepared_request = requests.PreparedRequest()
+            prepared_request.method = "GET"
+            prepared_request.url = "https://test_base_url.com/v1/endpoint"
+            http_client._send(prepared_request, {})
+
+    send_requests(1_000)
+    gc.collect()
+    number_of_objects_after_warm_up = len(gc.get_objects())
+
+    # 20,000 requests keep the test fast while an attempt count kept per request would add at least 20,000 objects
+    send_requests(20_000)
+    gc.collect()
+
+    assert len(http_client._request_attempt_count) == 0
+    assert len(gc.get_objects()) - number_of_objects_after_warm_up < 1_000
@@ -1,6 +1,7 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import multiprocessing
 import os
 import tempfile
 import time
@@ -13,9 +14,11 @@ from airbyte_cdk.sources.streams.call_rate import (
     APIBudget,
     CallRateLimitHit,
     FixedWindowCallRatePolicy,
+    HttpAPIBudget,
     HttpRequestMatcher,
     MovingWindowCallRatePolicy,
     Rate,
+    SharedMovingWindowCallRatePolicy,
     UnlimitedCallRatePolicy,
 )
 from airbyte_cdk.sources.streams.http import HttpStream
@@ -246,6 +249,82 @@ class TestMovingWindowCallRatePolicy:
         assert str(excinfo.value) == "Bucket for item=call with Rate limit=2/1.0h is already full"
 
 
+def _acquire_calls_until_deadline(database_path: str, deadline: float, call_timestamps: "multiprocessing.Queue[list[float]]") -> None:
+    policy = SharedMovingWindowCallRatePolicy(
+        rates=[Rate(10, timedelta(seconds=1))], matchers=[], database_path=database_path, bucket_name="shared_budget"
+    )
+    budget = HttpAPIBudget(policies=[policy])
+    timestamps = []
+    while time.time() < deadline:
+        budget.acquire_call(Request("GET", "https://example.com"))
+        timestamps.append(time.time())
+    call_timestamps.put([timestamp for timestamp in timestamps if timestamp < deadline])
+
+
+class TestSharedMovingWindowCallRatePolicy:
+    def test_given_policies_on_same_bucket_when_try_acquire_then_share_the_budget(self, tmp_path):
+        database_path = str(tmp_path / "budget.sqlite")
+        first_policy = SharedMovingWindowCallRatePolicy(
+            rates=[Rate(2, timedelta(minutes=1))], matchers=[], database_path=database_path, bucket_name="shared_budget"
+        )
+        second_policy = SharedMovingWindowCallRatePolicy(
+            rates=[Rate(2, timedelta(minutes=1))], matchers=[], database_path=database_path, bucket_name="shared_budget"
+        )
+
+        first_policy.try_acquire("call", weight=1)
+        second_policy.try_acquire("call", weight=1)
+
+        with pytest.raises(CallRateLimitHit) as excinfo:
+            first_policy.try_acquire("call", weight=1)
+        assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(60, 0.1)
+
+    def test_given_different_bucket_names_when_try_acquire_then_budgets_are_independent(self, tmp_path):
+        database_path = str(tmp_path / "budget.sqlite")
+        first_policy = SharedMovingWindowCallRatePolicy(
+            rates=[Rate(1, timedelta(minutes=1))], matchers=[], database_path=database_path, bucket_name="first_budget"
+        )
+        second_policy = SharedMovingWindowCallRatePolicy(
+            rates=[Rate(1, timedelta(minutes=1))], matchers=[], database_path=database_path, bucket_name="second_budget"
+        )
+
+        first_policy.try_acquire("call", weight=1)
+        second_policy.try_acquire("call", weight=1)
+
+    def test_given_rate_limit_hit_response_when_update_from_response_then_other_policies_on_same_bucket_are_limited(self, tmp_path):
+        database_path = str(tmp_path / "budget.sqlite")
+        first_policy = SharedMovingWindowCallRatePolicy(
+            rates=[Rate(1, timedelta(minutes=1))], matchers=[], database_path=database_path, bucket_name="shared_budget"
+        )
+        second_policy = SharedMovingWindowCallRatePolicy(
+            rates=[Rate(1, timedelta(minutes=1))], matchers=[], database_path=database_path, bucket_name="shared_budget"
+        )
+
+        first_policy.update(available_calls=0, call_reset_ts=None)
+
+        with pytest.raises(CallRateLimitHit):
+            second_policy.try_acquire("call", weight=1)
+
+    def test_given_several_processes_when_acquire_calls_then_aggregate_rate_stays_at_the_limit(self, tmp_path):
+        """Each process would make ~10 calls per second on its own, together they must not go over the shared 10 calls per second"""
+        number_of_processes = 4
+        duration_in_seconds = 3
+        context = multiprocessing.get_context("fork")
+        call_timestamps = context.Queue()
+        deadline = time.time() + duration_in_seconds
+        processes = [
+            context.Process(target=_acquire_calls_until_deadline, args=(str(tmp_path / "budget.sqlite"), deadline, call_timestamps))
+            for _ in range(number_of_processes)
+        ]
+        for process in processes:
+            process.start()
+        timestamps = sorted(timestamp for _ in processes for timestamp in call_timestamps.get(timeout=30))
+        for process in processes:
+            process.join(timeout=30)
+
+        assert all(process.exitcode == 0 for process in processes)
+        assert 10 * (duration_in_seconds - 1) <= len(timestamps) <= 10 * (duration_in_seconds + 1)
+
+
 class TestHttpStreamIntegration:
     def test_without_cache(self, mocker, requests_mock):
         """Test that HttpStream will use call budget when provided"""
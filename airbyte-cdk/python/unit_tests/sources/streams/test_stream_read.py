@@ -3,8 +3,9 @@
 #
 
 import logging
+from datetime import timedelta
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from airbyte_cdk.models import (
@@ -25,6 +26,7 @@ from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.checkpoint import IncrementalCheckpointReader
 from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
 from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, FinalStateCursor
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -476,6 +478,90 @@ def test_configured_json_schema():
     assert stream.configured_json_schema == configured_json_schema
 
 
+class _MockIncrementalStreamWithCheckpointInterval(_MockIncrementalStream):
+    def __init__(
+        self,
+        slice_to_records: Mapping[str, List[Mapping[str, Any]]],
+        checkpoint_interval: Optional[int],
+        checkpoint_time_interval: Optional[timedelta],
+        clock: List[float],
+    ):
+        super().__init__(slice_to_records)
+        self._state = {}
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoint_time_interval = checkpoint_time_interval
+        self._clock = clock
+
+    @property
+    def state_checkpoint_interval(self) -> Optional[int]:
+        return self._checkpoint_interval
+
+    @property
+    def state_checkpoint_time_interval(self) -> Optional[timedelta]:
+        return self._checkpoint_time_interval
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: Optional[List[str]] = None,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> Iterable[StreamData]:
+        for record in super().read_records(sync_mode, cursor_field, stream_slice, stream_state):
+            # Records are read at the time of their cursor value
+            self._clock[0] = float(record["created_at"])
+            yield record
+
+
+@pytest.mark.parametrize(
+    "checkpoint_interval, checkpoint_time_interval, expected_states_after_records, expected_number_of_checkpoints",
+    [
+        pytest.param(None, None, [], 1, id="test_no_checkpoint_interval"),
+        pytest.param(2, None, [2, 4, 6], 4, id="test_checkpoint_interval"),
+        pytest.param(2, timedelta(seconds=25), [4], 2, id="test_checkpoint_interval_and_time_interval"),
+        pytest.param(None, timedelta(seconds=25), [], 1, id="test_time_interval_without_checkpoint_interval"),
+    ],
+)
+def test_incremental_read_only_computes_checkpoint_when_state_is_emitted(
+    checkpoint_interval, checkpoint_time_interval, expected_states_after_records, expected_number_of_checkpoints
+):
+    configured_stream = ConfiguredAirbyteStream(
+        stream=AirbyteStream(name="mock_stream", supported_sync_modes=[SyncMode.full_refresh, SyncMode.incremental], json_schema={}),
+        sync_mode=SyncMode.incremental,
+        cursor_field=["created_at"],
+        destination_sync_mode=DestinationSyncMode.overwrite,
+    )
+    logger = _mock_logger()
+    message_repository = InMemoryMessageRepository(Level.INFO)
+    records = [{"id": record_id, "created_at": str(record_id * 10)} for record_id in range(1, 7)]
+    clock = [0.0]
+    stream = _MockIncrementalStreamWithCheckpointInterval({1: records}, checkpoint_interval, checkpoint_time_interval, clock)
+
+    with patch("airbyte_cdk.sources.streams.core.time.monotonic", side_effect=lambda: clock[0]), patch.object(
+        IncrementalCheckpointReader, "get_checkpoint", autospec=True, side_effect=IncrementalCheckpointReader.get_checkpoint
+    ) as get_checkpoint:
+        messages = _read(
+            stream,
+            configured_stream,
+            logger,
+            DebugSliceLogger(),
+            message_repository,
+            ConnectorStateManager(stream_instance_map={}),
+            InternalConfig(),
+        )
+
+    states_after_records = []
+    records_read = 0
+    for message in messages:
+        if isinstance(message, AirbyteMessage) and message.type == MessageType.STATE:
+            states_after_records.append(records_read)
+        elif isinstance(message, Mapping):
+            records_read += 1
+    # The last state is emitted at the end of the slice
+    assert states_after_records == expected_states_after_records + [6]
+    assert get_checkpoint.call_count == expected_number_of_checkpoints + 1
+
+
 def _read(stream, configured_stream, logger, slice_logger, message_repository, state_manager, internal_config):
     records = []
     for record in stream.read(configured_stream, logger, slice_logger, {}, state_manager, internal_config):
@@ -461,8 +461,9 @@ def test_source_config_no_transform(mocker, abstract_source, catalog):
     records = [r for r in abstract_source.read(logger=logger_mock, config={}, catalog=catalog, state={})]
     assert len(records) == 2 * (5 + SLICE_DEBUG_LOG_COUNT + TRACE_STATUS_COUNT + STATE_COUNT)
     assert [r.record.data for r in records if r.type == Type.RECORD] == [{"value": 23}] * 2 * 5
-    assert http_stream.get_json_schema.call_count == 5
-    assert non_http_stream.get_json_schema.call_count == 5
+    # without transformation, the schema is not needed to emit records
+    assert http_stream.get_json_schema.call_count == 0
+    assert non_http_stream.get_json_schema.call_count == 0
 
 
 def test_source_config_transform(mocker, abstract_source, catalog):
@@ -85,8 +85,10 @@ class _MockSource(AbstractSource):
 class _MockConcurrentSource(ConcurrentSourceAdapter):
     message_repository = InMemoryMessageRepository()
 
-    def __init__(self, logger):
-        concurrent_source = ConcurrentSource.create(1, 1, logger, NeverLogSliceLogger(), self.message_repository)
+    def __init__(self, logger, record_batch_size=1):
+        concurrent_source = ConcurrentSource.create(
+            1, 1, logger, NeverLogSliceLogger(), self.message_repository, record_batch_size=record_batch_size
+        )
         super().__init__(concurrent_source)
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
@@ -308,6 +310,23 @@ def test_concurrent_source_yields_the_same_messages_as_abstract_source_when_an_e
     _assert_errors(messages_from_abstract_source, messages_from_concurrent_source)
 
 
+@freezegun.freeze_time("2020-01-01T00:00:00")
+def test_concurrent_source_with_record_batches_yields_the_same_messages_as_abstract_source():
+    stream_slice_to_partition = {"1": [{"id": i, "partition": "1"} for i in range(5)], "2": [{"id": 5, "partition": "2"}]}
+    logger = _init_logger()
+    state = None
+
+    source = _init_source([stream_slice_to_partition], state, logger, _MockSource())
+    concurrent_source = _init_source([stream_slice_to_partition], state, logger, _MockConcurrentSource(logger, record_batch_size=2))
+    config = {}
+    catalog = _create_configured_catalog(source._streams)
+    messages_from_abstract_source = _read_from_source(source, logger, config, catalog, state, None)
+    messages_from_concurrent_source = _read_from_source(concurrent_source, logger, config, catalog, state, None)
+
+    _assert_status_messages(messages_from_abstract_source, messages_from_concurrent_source)
+    _assert_record_messages(messages_from_abstract_source, messages_from_concurrent_source)
+
+
 def _assert_status_messages(messages_from_abstract_source, messages_from_concurrent_source):
     status_from_concurrent_source = [message for message in messages_from_concurrent_source if message.type == MessageType.TRACE and message.trace.type == TraceType.STREAM_STATUS]
 
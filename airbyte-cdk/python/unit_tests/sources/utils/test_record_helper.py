@@ -2,7 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from unittest.mock import MagicMock
+import threading
+import time
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
 
 import pytest
 from airbyte_cdk.models import (
@@ -16,7 +19,8 @@ from airbyte_cdk.models import (
     TraceType,
 )
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.record_helper import EmittedAtClock, stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 NOW = 1234567
 STREAM_NAME = "my_stream"
@@ -83,3 +87,68 @@ def test_state_message_to_message(test_name, data):
     schema = {}
     with pytest.raises(ValueError):
         stream_data_to_airbyte_message(STREAM_NAME, data, transformer, schema)
+
+
+def test_given_no_transform_when_data_to_airbyte_record_then_do_not_copy_data():
+    data = {"id": 0}
+
+    message = stream_data_to_airbyte_message(STREAM_NAME, data, emitted_at=NOW)
+
+    assert message.record.data is data
+    assert message.json(exclude_unset=True) == AirbyteMessage(
+        type=MessageType.RECORD, record=AirbyteRecordMessage(stream=STREAM_NAME, data=data, emitted_at=NOW)
+    ).json(exclude_unset=True)
+
+
+def test_given_mapping_when_data_to_airbyte_record_then_convert_to_dict():
+    message = stream_data_to_airbyte_message(STREAM_NAME, MappingProxyType({"id": 0}), emitted_at=NOW)
+
+    assert type(message.record.data) is dict
+    assert message.record.data == {"id": 0}
+
+
+def test_given_transformer_when_data_to_airbyte_record_then_transform_a_copy():
+    data = {"id": 0}
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    message = stream_data_to_airbyte_message(STREAM_NAME, data, transformer, {"properties": {"id": {"type": "string"}}}, emitted_at=NOW)
+
+    assert message.record.data == {"id": "0"}
+    assert data == {"id": 0}
+
+
+def test_given_no_tick_when_emitted_at_clock_read_then_time_is_read_once():
+    clock = EmittedAtClock(tick_in_seconds=60)
+    with patch("time.time", side_effect=[1.0, 2.0]) as time_mock:
+        assert [clock.now_ms() for _ in range(3)] == [1000] * 3
+    assert time_mock.call_count == 1
+
+
+def test_given_tick_when_emitted_at_clock_read_then_time_is_read_again():
+    clock = EmittedAtClock(tick_in_seconds=0.001)
+    with patch("time.time", side_effect=[1.0, 2.0]):
+        assert clock.now_ms() == 1000
+        _wait_until_stale(clock)
+        assert clock.now_ms() == 2000
+
+
+def test_given_time_is_patched_when_emitted_at_clock_read_then_patched_time_is_read():
+    clock = EmittedAtClock(tick_in_seconds=60)
+    clock.now_ms()
+    with patch("time.time", return_value=1.0):
+        assert clock.now_ms() == 1000
+
+
+def test_given_no_emitted_at_when_data_to_airbyte_record_then_use_current_time():
+    message = stream_data_to_airbyte_message(STREAM_NAME, {"id": 0})
+    # the shared clock can lag by a few milliseconds
+    assert abs(message.record.emitted_at - time.time() * 1000) < 1000
+
+
+def _wait_until_stale(clock: EmittedAtClock) -> None:
+    sleeper = threading.Event()
+    for _ in range(500):
+        if clock._stale:
+            return
+        sleeper.wait(0.01)
+    raise AssertionError("the clock did not tick")
@@ -264,3 +264,15 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+@pytest.mark.parametrize(
+    "config, expected_is_enabled",
+    [
+        pytest.param(TransformConfig.NoTransform, False, id="no_transform"),
+        pytest.param(TransformConfig.DefaultSchemaNormalization, True, id="default_schema_normalization"),
+        pytest.param(TransformConfig.CustomSchemaNormalization, True, id="custom_schema_normalization"),
+    ],
+)
+def test_is_enabled(config, expected_is_enabled):
+    assert TypeTransformer(config).is_enabled() == expected_is_enabled
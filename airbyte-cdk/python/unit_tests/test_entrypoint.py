@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import os
 from argparse import Namespace
 from collections import defaultdict
@@ -41,6 +42,7 @@ from airbyte_cdk.models.airbyte_protocol import AirbyteStateStats
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
 from airbyte_cdk.utils import AirbyteTracedException
+from airbyte_cdk.utils.message_serializer import AirbyteMessageWriter, FastRecordAirbyteMessageSerializer
 
 
 class MockSource(Source):
@@ -165,6 +167,19 @@ def test_run_spec(entrypoint: AirbyteEntrypoint, mocker):
     assert [MESSAGE_FROM_REPOSITORY.json(exclude_unset=True), _wrap_message(expected)] == messages
 
 
+def test_launch_writes_messages_with_message_writer(mocker):
+    message_repository = MagicMock()
+    message_repository.consume_queue.side_effect = [[MESSAGE_FROM_REPOSITORY], [], []]
+    mocker.patch.object(MockSource, "message_repository", new_callable=mocker.PropertyMock, return_value=message_repository)
+    expected = ConnectorSpecification(connectionSpecification={"hi": "hi"})
+    mocker.patch.object(MockSource, "spec", return_value=expected)
+    output = io.StringIO()
+
+    entrypoint_module.launch(MockSource(), ["spec"], AirbyteMessageWriter(FastRecordAirbyteMessageSerializer(), output))
+
+    assert output.getvalue() == f"{MESSAGE_FROM_REPOSITORY.json(exclude_unset=True)}\n{_wrap_message(expected)}\n"
+
+
 @pytest.fixture
 def config_mock(mocker, request):
     config = request.param if hasattr(request, "param") else {"username": "fake"}
@@ -323,6 +338,57 @@ def test_filter_internal_requests(deployment_mode, url, expected_error):
             assert isinstance(actual_response, requests.Response)
 
 
+_PUBLIC_ADDRESS_INFO = [(2, 1, 6, "", ("93.184.216.34", 443))]
+_PRIVATE_ADDRESS_INFO = [(2, 1, 6, "", ("192.168.27.30", 443))]
+
+
+def test_given_verdict_cached_when_is_private_url_then_do_not_resolve_hostname_again():
+    cache = entrypoint_module._PrivateUrlVerdictCache()
+
+    with patch.object(entrypoint_module.socket, "getaddrinfo", return_value=_PUBLIC_ADDRESS_INFO) as getaddrinfo:
+        assert not cache.is_private_url("airbyte.com", 443)
+        assert not cache.is_private_url("airbyte.com", 443)
+        assert not cache.is_private_url("airbyte.com", 8443)
+
+    assert getaddrinfo.call_count == 2
+
+
+def test_given_verdict_expired_when_is_private_url_then_resolve_hostname_again():
+    cache = entrypoint_module._PrivateUrlVerdictCache(ttl_in_seconds=10)
+
+    with patch.object(entrypoint_module.time, "monotonic", return_value=0):
+        with patch.object(entrypoint_module.socket, "getaddrinfo", return_value=_PUBLIC_ADDRESS_INFO):
+            assert not cache.is_private_url("airbyte.com", 443)
+    with patch.object(entrypoint_module.time, "monotonic", return_value=10):
+        with patch.object(entrypoint_module.socket, "getaddrinfo", return_value=_PRIVATE_ADDRESS_INFO):
+            assert cache.is_private_url("airbyte.com", 443)
+
+
+def test_given_max_size_reached_when_is_private_url_then_evict_least_recently_used_verdict():
+    cache = entrypoint_module._PrivateUrlVerdictCache(max_size=2)
+
+    with patch.object(entrypoint_module.socket, "getaddrinfo", return_value=_PUBLIC_ADDRESS_INFO) as getaddrinfo:
+        cache.is_private_url("first.com", 443)
+        cache.is_private_url("second.com", 443)
+        cache.is_private_url("first.com", 443)
+        cache.is_private_url("third.com", 443)
+        cache.is_private_url("first.com", 443)
+        cache.is_private_url("second.com", 443)
+
+    assert [call.args[0] for call in getaddrinfo.call_args_list] == ["first.com", "second.com", "third.com", "second.com"]
+
+
+def test_given_resolution_error_when_is_private_url_then_raise_and_do_not_cache():
+    cache = entrypoint_module._PrivateUrlVerdictCache()
+
+    with patch.object(entrypoint_module.socket, "getaddrinfo", side_effect=entrypoint_module.socket.gaierror) as getaddrinfo:
+        for _ in range(2):
+            with pytest.raises(entrypoint_module.socket.gaierror):
+                cache.is_private_url("airbyte.com", 443)
+
+    assert getaddrinfo.call_count == 2
+
+
 @pytest.mark.parametrize(
     "incoming_message, stream_message_count, expected_message, expected_records_by_stream",
     [
@@ -0,0 +1,114 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+import datetime
+import io
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteLogMessage,
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateBlob,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    Level,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.utils import message_serializer
+from airbyte_cdk.utils.message_serializer import AirbyteMessageWriter, FastRecordAirbyteMessageSerializer, PydanticAirbyteMessageSerializer
+
+_A_RECORD = AirbyteMessage(
+    type=Type.RECORD,
+    record=AirbyteRecordMessage(
+        stream="test_stream",
+        data={"id": 12345, "amount": Decimal("1.5"), "updated_at": datetime.datetime(2024, 1, 1), "nested": {"values": [1, "2"]}},
+        emitted_at=1,
+    ),
+)
+_A_STATE = AirbyteMessage(
+    type=Type.STATE,
+    state=AirbyteStateMessage(
+        type=AirbyteStateType.STREAM,
+        stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="test_stream"), stream_state=AirbyteStateBlob(cursor=1)),
+    ),
+)
+
+
+@pytest.mark.parametrize("use_orjson", [pytest.param(True, id="orjson"), pytest.param(False, id="standard library")])
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(_A_RECORD, id="record"),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD, record=AirbyteRecordMessage(stream="test_stream", namespace="a_namespace", data={"id": 1}, emitted_at=1)
+            ),
+            id="record with namespace",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="test_stream", data={"id": 2**70}, emitted_at=1)),
+            id="record with integer exceeding 64 bits",
+        ),
+        pytest.param(_A_STATE, id="state"),
+        pytest.param(AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="a log")), id="log"),
+    ],
+)
+def test_fast_record_serializer_produces_the_same_json_as_the_protocol_models(message, use_orjson):
+    with patch.object(message_serializer, "orjson", message_serializer.orjson if use_orjson else None):
+        serialized = FastRecordAirbyteMessageSerializer().serialize(message)
+
+    assert json.loads(serialized) == json.loads(PydanticAirbyteMessageSerializer().serialize(message))
+
+
+def test_given_standard_library_when_serialize_record_then_output_is_identical_to_the_protocol_models():
+    with patch.object(message_serializer, "orjson", None):
+        serialized = FastRecordAirbyteMessageSerializer().serialize(_A_RECORD)
+
+    assert serialized == _A_RECORD.json(exclude_unset=True)
+
+
+def test_given_no_buffer_when_write_then_flush_every_message():
+    output = io.StringIO()
+    writer = AirbyteMessageWriter(output=output)
+
+    writer.write(_A_RECORD)
+
+    assert output.getvalue() == f"{_A_RECORD.json(exclude_unset=True)}\n"
+
+
+def test_given_buffer_when_write_records_then_only_flush_when_buffer_is_full():
+    output = io.StringIO()
+    serialized_record = _A_RECORD.json(exclude_unset=True)
+    writer = AirbyteMessageWriter(output=output, record_buffer_size=2 * len(serialized_record) + 2)
+
+    writer.write(_A_RECORD)
+    assert output.getvalue() == ""
+
+    writer.write(_A_RECORD)
+    assert output.getvalue() == f"{serialized_record}\n" * 2
+
+
+def test_given_buffered_records_when_write_state_then_flush_records_before_state():
+    output = io.StringIO()
+    writer = AirbyteMessageWriter(output=output, record_buffer_size=1_000_000)
+
+    writer.write(_A_RECORD)
+    writer.write(_A_STATE)
+
+    assert output.getvalue() == f"{_A_RECORD.json(exclude_unset=True)}\n{_A_STATE.json(exclude_unset=True)}\n"
+
+
+def test_given_exception_when_exiting_writer_then_flush_buffered_records():
+    output = io.StringIO()
+
+    with pytest.raises(ValueError):
+        with AirbyteMessageWriter(output=output, record_buffer_size=1_000_000) as writer:
+            writer.write(_A_RECORD)
+            raise ValueError()
+
+    assert output.getvalue() == f"{_A_RECORD.json(exclude_unset=True)}\n"
@@ -5,7 +5,6 @@ import json
 import os
 import re
 import uuid
-from collections import defaultdict
 from logging import getLogger
 from typing import Any, Dict, Iterable, List, Mapping
 
@@ -22,6 +21,15 @@ logger = getLogger("airbyte")
 CONFIG_MOTHERDUCK_API_KEY = "motherduck_api_key"
 CONFIG_DEFAULT_SCHEMA = "main"
 
+AIRBYTE_COLUMNS = ("_airbyte_ab_id", "_airbyte_emitted_at", "_airbyte_data")
+BUFFER_SCHEMA = pa.schema(
+    [
+        pa.field("_airbyte_ab_id", pa.string()),
+        pa.field("_airbyte_emitted_at", pa.timestamp("us")),
+        pa.field("_airbyte_data", pa.string()),
+    ]
+)
+
 
 def validated_sql_name(sql_name: Any) -> str:
     """Return the input if it is a valid SQL name, otherwise raise an exception."""
@@ -33,7 +41,102 @@ def validated_sql_name(sql_name: Any) -> str:
     raise ValueError(f"Invalid SQL name: {sql_name}")
 
 
+def json_schema_to_duckdb_type(property_schema: Mapping[str, Any]) -> str:
+    """Return the DuckDB type of the column materializing a top-level property of a stream JSON schema."""
+    types = property_schema.get("type", [])
+    types = [types] if isinstance(types, str) else types
+    non_null_types = [json_type for json_type in types if json_type != "null"]
+    if len(non_null_types) != 1:
+        return "JSON"
+
+    json_type = non_null_types[0]
+    airbyte_type = property_schema.get("airbyte_type")
+    if json_type == "string":
+        string_format = property_schema.get("format")
+        if string_format == "date-time":
+            return "TIMESTAMP" if airbyte_type == "timestamp_without_timezone" else "TIMESTAMPTZ"
+        if string_format == "date":
+            return "DATE"
+        return "VARCHAR"
+    if json_type == "integer" or (json_type == "number" and airbyte_type == "integer"):
+        return "BIGINT"
+    if json_type == "number":
+        return "DOUBLE"
+    if json_type == "boolean":
+        return "BOOLEAN"
+    return "JSON"
+
+
+def typed_columns_from_json_schema(json_schema: Mapping[str, Any]) -> Dict[str, str]:
+    """
+    Return the DuckDB type of the column of each top-level property of a stream JSON schema. Properties which names are not valid SQL names
+    or which only differ from another column by their case are not materialized as columns, they are still available in `_airbyte_data`.
+    """
+    columns: Dict[str, str] = {}
+    lowercase_names = set(AIRBYTE_COLUMNS)
+    for name, property_schema in (json_schema.get("properties") or {}).items():
+        if not re.match(r"^[a-zA-Z0-9_]+$", name) or name.lower() in lowercase_names or not isinstance(property_schema, Mapping):
+            continue
+        lowercase_names.add(name.lower())
+        columns[name] = json_schema_to_duckdb_type(property_schema)
+    return columns
+
+
+def _extract_column(column_name: str, column_type: str) -> str:
+    if column_type == "JSON":
+        return f"_airbyte_data -> '$.\"{column_name}\"'"
+    value = f"_airbyte_data ->> '$.\"{column_name}\"'"
+    if column_type == "VARCHAR":
+        return value
+    return f"TRY_CAST({value} AS {column_type})"
+
+
+class StreamBuffer:
+    """
+    Records of a stream waiting to be written. Records are appended to Python lists which are converted to an Arrow record batch every
+    `record_batch_size` records so that the buffered records are held in Arrow memory rather than as Python objects.
+    """
+
+    def __init__(self, record_batch_size: int) -> None:
+        self._record_batch_size = record_batch_size
+        self._record_batches: List[pa.RecordBatch] = []
+        self._init_lists()
+
+    def _init_lists(self) -> None:
+        self._ids: List[str] = []
+        self._emitted_at: List[datetime.datetime] = []
+        self._data: List[str] = []
+
+    def append(self, data: Mapping[str, Any]) -> int:
+        """
+        :return: The approximate number of bytes the record adds to the buffer
+        """
+        serialized_data = json.dumps(data)
+        self._ids.append(str(uuid.uuid4()))
+        self._emitted_at.append(datetime.datetime.now())
+        self._data.append(serialized_data)
+        if len(self._data) >= self._record_batch_size:
+            self._seal_record_batch()
+        # the id is 36 characters and the timestamp 8 bytes
+        return len(serialized_data) + 44
+
+    def to_table(self) -> pa.Table:
+        self._seal_record_batch()
+        return pa.Table.from_batches(self._record_batches, schema=BUFFER_SCHEMA)
+
+    def _seal_record_batch(self) -> None:
+        if self._data:
+            self._record_batches.append(pa.RecordBatch.from_arrays([self._ids, self._emitted_at, self._data], schema=BUFFER_SCHEMA))
+            self._init_lists()
+
+
 class DestinationDuckdb(Destination):
+    # The buffered records of all the streams are written once there are this many rows or bytes buffered even if no state message was
+    # received so that the memory used does not depend on how often the source emits state messages
+    flush_rows = 100_000
+    flush_bytes = 64 * 1024 * 1024
+    record_batch_size = 10_000
+
     @staticmethod
     def _get_destination_path(destination_path: str) -> str:
         """
@@ -91,6 +194,7 @@ class DestinationDuckdb(Destination):
 
         con.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
 
+        typed_columns: Dict[str, Dict[str, str]] = {}
         for configured_stream in configured_catalog.streams:
             name = configured_stream.stream.name
             table_name = f"_airbyte_raw_{name}"
@@ -109,17 +213,22 @@ class DestinationDuckdb(Destination):
             """
 
             con.execute(query)
+            typed_columns[name] = self._create_typed_columns(
+                con, schema_name, table_name, typed_columns_from_json_schema(configured_stream.stream.json_schema)
+            )
 
-        buffer = defaultdict(lambda: defaultdict(list))
+        buffers: Dict[str, StreamBuffer] = {}
+        buffered_rows = 0
+        buffered_bytes = 0
 
         for message in input_messages:
             if message.type == Type.STATE:
                 # flush the buffer
-                for stream_name in buffer.keys():
+                if buffers:
                     logger.info(f"flushing buffer for state: {message}")
-                    DestinationDuckdb._safe_write(con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name)
-
-                buffer = defaultdict(lambda: defaultdict(list))
+                self._flush(con, schema_name, buffers, typed_columns)
+                buffers = {}
+                buffered_rows = buffered_bytes = 0
 
                 yield message
             elif message.type == Type.RECORD:
@@ -129,39 +238,75 @@ class DestinationDuckdb(Destination):
                     logger.debug(f"Stream {stream_name} was not present in configured streams, skipping")
                     continue
                 # add to buffer
-                buffer[stream_name]["_airbyte_ab_id"].append(str(uuid.uuid4()))
-                buffer[stream_name]["_airbyte_emitted_at"].append(datetime.datetime.now().isoformat())
-                buffer[stream_name]["_airbyte_data"].append(json.dumps(data))
+                if stream_name not in buffers:
+                    buffers[stream_name] = StreamBuffer(self.record_batch_size)
+                buffered_bytes += buffers[stream_name].append(data)
+                buffered_rows += 1
+                if buffered_rows >= self.flush_rows or buffered_bytes >= self.flush_bytes:
+                    logger.info(f"flushing buffer of {buffered_rows} records and {buffered_bytes} bytes")
+                    self._flush(con, schema_name, buffers, typed_columns)
+                    buffers = {}
+                    buffered_rows = buffered_bytes = 0
 
             else:
                 logger.info(f"Message type {message.type} not supported, skipping")
 
         # flush any remaining messages
-        for stream_name in buffer.keys():
-            DestinationDuckdb._safe_write(con=con, buffer=buffer, schema_name=schema_name, stream_name=stream_name)
+        self._flush(con, schema_name, buffers, typed_columns)
 
     @staticmethod
-    def _safe_write(*, con: duckdb.DuckDBPyConnection, buffer: Dict[str, Dict[str, List[Any]]], schema_name: str, stream_name: str):
+    def _create_typed_columns(
+        con: duckdb.DuckDBPyConnection, schema_name: str, table_name: str, typed_columns: Mapping[str, str]
+    ) -> Dict[str, str]:
+        """
+        Add the columns of the properties of the stream to its table if they do not exist yet.
+
+        :return: The type of each typed column of the table which can differ from the type of the JSON schema if the column already existed
+        """
+        for column_name, column_type in typed_columns.items():
+            con.execute(f'ALTER TABLE {schema_name}.{table_name} ADD COLUMN IF NOT EXISTS "{column_name}" {column_type}')
+        table_columns = con.execute(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_schema = ? AND table_name = ?",
+            [schema_name, table_name],
+        ).fetchall()
+        table_column_types = {column_name.lower(): data_type for column_name, data_type in table_columns}
+        return {
+            column_name: table_column_types[column_name.lower()]
+            for column_name in typed_columns
+            if column_name.lower() in table_column_types
+        }
+
+    @staticmethod
+    def _flush(
+        con: duckdb.DuckDBPyConnection,
+        schema_name: str,
+        buffers: Mapping[str, StreamBuffer],
+        typed_columns: Mapping[str, Mapping[str, str]],
+    ) -> None:
+        for stream_name, buffer in buffers.items():
+            DestinationDuckdb._write_buffer(
+                con=con, table=buffer.to_table(), schema_name=schema_name, stream_name=stream_name, typed_columns=typed_columns[stream_name]
+            )
+
+    @staticmethod
+    def _write_buffer(
+        *, con: duckdb.DuckDBPyConnection, table: pa.Table, schema_name: str, stream_name: str, typed_columns: Mapping[str, str]
+    ) -> None:
+        """
+        Insert the buffered records with a single INSERT ... SELECT from the Arrow table. The typed columns are extracted from
+        `_airbyte_data` by DuckDB. A value which cannot be cast to the type of its column is NULL in the column but is kept in
+        `_airbyte_data`.
+        """
         table_name = f"_airbyte_raw_{stream_name}"
+        column_names = [*AIRBYTE_COLUMNS, *(f'"{column_name}"' for column_name in typed_columns)]
+        expressions = [*AIRBYTE_COLUMNS, *(_extract_column(column_name, column_type) for column_name, column_type in typed_columns.items())]
+        con.register("_airbyte_buffer", table)
         try:
-            pa_table = pa.Table.from_pydict(buffer[stream_name])
-        except:
-            logger.exception(
-                f"Writing with pyarrow view failed, falling back to writing with executemany. Expect some performance degradation."
-            )
-            query = f"""
-            INSERT INTO {schema_name}.{table_name}
-                (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
-            VALUES (?,?,?)
-            """
-            entries_to_write = buffer[stream_name]
-            con.executemany(
-                query, zip(entries_to_write["_airbyte_ab_id"], entries_to_write["_airbyte_emitted_at"], entries_to_write["_airbyte_data"])
+            con.execute(
+                f"INSERT INTO {schema_name}.{table_name} ({', '.join(column_names)}) SELECT {', '.join(expressions)} FROM _airbyte_buffer"
             )
-        else:
-            # DuckDB will automatically find and SELECT from the `pa_table`
-            # local variable defined above.
-            con.sql(f"INSERT INTO {schema_name}.{table_name} SELECT * FROM pa_table")
+        finally:
+            con.unregister("_airbyte_buffer")
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -319,3 +319,130 @@ def test_large_number_of_writes(
         )
         result = cursor.fetchall()
     assert result[0][0] == TOTAL_RECORDS - TOTAL_RECORDS // (BATCH_WRITE_SIZE + 1)
+
+
+def _connect(config: Dict[str, str]) -> duckdb.DuckDBPyConnection:
+    motherduck_api_key = str(config.get(CONFIG_MOTHERDUCK_API_KEY, ""))
+    duckdb_config = {}
+    if motherduck_api_key:
+        duckdb_config["motherduck_token"] = motherduck_api_key
+        duckdb_config["custom_user_agent"] = "airbyte_intg_test"
+    return duckdb.connect(database=config.get("destination_path"), read_only=False, config=duckdb_config)
+
+
+def _record(stream: str, data: Dict[str, Any]) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(stream=stream, data=data, emitted_at=int(datetime.now().timestamp()) * 1000),
+    )
+
+
+def _catalog(stream: str, json_schema: Dict[str, Any]) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=stream, json_schema=json_schema, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+        ]
+    )
+
+
+def test_write_materializes_typed_columns(config: Dict[str, str], request, test_table_name: str, test_schema_name: str):
+    json_schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": ["null", "string"]},
+            "amount": {"type": "number"},
+            "active": {"type": "boolean"},
+            "created": {"type": "string", "format": "date"},
+            "updated_at": {"type": "string", "format": "date-time", "airbyte_type": "timestamp_without_timezone"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "invalid-name": {"type": "string"},
+        },
+    }
+    records = [
+        {
+            "id": 1,
+            "name": "first",
+            "amount": 1.5,
+            "active": True,
+            "created": "2024-01-02",
+            "updated_at": "2024-01-02T03:04:05",
+            "tags": ["a"],
+            "invalid-name": "x",
+        },
+        {"id": "not an integer", "amount": 2},
+    ]
+
+    destination = DestinationDuckdb()
+    list(destination.write(config, _catalog(test_table_name, json_schema), [_record(test_table_name, data) for data in records]))
+
+    with _connect(config) as con:
+        columns = con.execute(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_schema = ? AND table_name = ? ORDER BY ordinal_position",
+            [test_schema_name, f"_airbyte_raw_{test_table_name}"],
+        ).fetchall()
+        rows = con.execute(
+            "SELECT id, name, amount, active, created::VARCHAR, updated_at::VARCHAR, tags, _airbyte_data "
+            f"FROM {test_schema_name}._airbyte_raw_{test_table_name} ORDER BY amount"
+        ).fetchall()
+
+    assert columns == [
+        ("_airbyte_ab_id", "VARCHAR"),
+        ("_airbyte_emitted_at", "TIMESTAMP"),
+        ("_airbyte_data", "JSON"),
+        ("id", "BIGINT"),
+        ("name", "VARCHAR"),
+        ("amount", "DOUBLE"),
+        ("active", "BOOLEAN"),
+        ("created", "DATE"),
+        ("updated_at", "TIMESTAMP"),
+        ("tags", "JSON"),
+    ]
+    assert rows == [
+        (1, "first", 1.5, True, "2024-01-02", "2024-01-02 03:04:05", '["a"]', json.dumps(records[0])),
+        # values which cannot be cast to the type of their column are only kept in _airbyte_data
+        (None, None, 2.0, None, None, None, None, json.dumps(records[1])),
+    ]
+
+
+@pytest.mark.parametrize(
+    "flush_rows, flush_bytes, expected_batch_sizes",
+    [
+        pytest.param(3, 64 * 1024 * 1024, [3, 3, 1], id="flush by rows"),
+        pytest.param(100_000, 100, [2, 2, 2, 1], id="flush by bytes"),
+    ],
+)
+def test_write_flushes_the_buffer_when_it_is_full(
+    config: Dict[str, str],
+    request,
+    monkeypatch,
+    test_table_name: str,
+    test_schema_name: str,
+    flush_rows: int,
+    flush_bytes: int,
+    expected_batch_sizes: list[int],
+):
+    monkeypatch.setattr(DestinationDuckdb, "flush_rows", flush_rows)
+    monkeypatch.setattr(DestinationDuckdb, "flush_bytes", flush_bytes)
+    monkeypatch.setattr(DestinationDuckdb, "record_batch_size", 2)
+    written_batch_sizes = []
+    write_buffer = DestinationDuckdb._write_buffer
+
+    def _write_buffer(**kwargs):
+        written_batch_sizes.append(kwargs["table"].num_rows)
+        write_buffer(**kwargs)
+
+    monkeypatch.setattr(DestinationDuckdb, "_write_buffer", _write_buffer)
+    json_schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+    destination = DestinationDuckdb()
+    list(destination.write(config, _catalog(test_table_name, json_schema), [_record(test_table_name, {"id": i}) for i in range(7)]))
+
+    assert written_batch_sizes == expected_batch_sizes
+    with _connect(config) as con:
+        ids = con.execute(f"SELECT id FROM {test_schema_name}._airbyte_raw_{test_table_name} ORDER BY id").fetchall()
+    assert ids == [(i,) for i in range(7)]
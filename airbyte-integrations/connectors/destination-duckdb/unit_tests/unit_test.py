@@ -1,7 +1,7 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
 import pytest
-from destination_duckdb.destination import DestinationDuckdb, validated_sql_name
+from destination_duckdb.destination import DestinationDuckdb, json_schema_to_duckdb_type, typed_columns_from_json_schema, validated_sql_name
 
 
 def test_read_invalid_path():
@@ -32,3 +32,39 @@ def test_validated_sql_name(input, expected):
             validated_sql_name(input)
     else:
         assert validated_sql_name(input) == expected
+
+
+@pytest.mark.parametrize(
+    "property_schema, expected",
+    [
+        ({"type": "string"}, "VARCHAR"),
+        ({"type": ["null", "string"]}, "VARCHAR"),
+        ({"type": "string", "format": "date"}, "DATE"),
+        ({"type": "string", "format": "date-time"}, "TIMESTAMPTZ"),
+        ({"type": "string", "format": "date-time", "airbyte_type": "timestamp_without_timezone"}, "TIMESTAMP"),
+        ({"type": "integer"}, "BIGINT"),
+        ({"type": "number", "airbyte_type": "integer"}, "BIGINT"),
+        ({"type": "number"}, "DOUBLE"),
+        ({"type": ["null", "boolean"]}, "BOOLEAN"),
+        ({"type": "object"}, "JSON"),
+        ({"type": "array", "items": {"type": "integer"}}, "JSON"),
+        ({"type": ["string", "integer"]}, "JSON"),
+        ({}, "JSON"),
+    ],
+)
+def test_json_schema_to_duckdb_type(property_schema, expected):
+    assert json_schema_to_duckdb_type(property_schema) == expected
+
+
+def test_typed_columns_skip_invalid_and_conflicting_names():
+    json_schema = {
+        "properties": {
+            "id": {"type": "integer"},
+            "ID": {"type": "string"},
+            "invalid-name": {"type": "string"},
+            "_airbyte_data": {"type": "string"},
+            "name": {"type": "string"},
+        }
+    }
+
+    assert typed_columns_from_json_schema(json_schema) == {"id": "BIGINT", "name": "VARCHAR"}
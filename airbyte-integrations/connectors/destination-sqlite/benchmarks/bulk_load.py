@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+"""
+Compares the records/s of an overwrite sync of a single stream with the default mode, where the records are inserted in a table with a
+primary key and every commit is synced to disk, and with the bulk load mode, where the records are inserted in a staging table without
+index with the write-ahead log enabled and the index is built once all the records are loaded.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Iterable
+
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_sqlite import DestinationSqlite
+
+_STREAM_NAME = "benchmark"
+
+
+def _input_messages(number_of_records: int, records_between_states: int) -> Iterable[AirbyteMessage]:
+    # the messages are not validated as it would take longer than writing them
+    for record_id in range(number_of_records):
+        yield AirbyteMessage.construct(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage.construct(
+                stream=_STREAM_NAME, data={"id": record_id, "name": f"name {record_id}", "amount": record_id / 100}, emitted_at=0
+            ),
+        )
+        if (record_id + 1) % records_between_states == 0:
+            yield AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": record_id}))
+
+
+def _measure(number_of_records: int, records_between_states: int, bulk_load: bool) -> None:
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=_STREAM_NAME, json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+        ]
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.db")
+        destination = DestinationSqlite()
+        # the path is used as is instead of being placed in the /local mount
+        destination._get_destination_path = lambda destination_path: destination_path
+
+        start = time.perf_counter()
+        for _ in destination.write(
+            {"destination_path": path, "bulk_load": bulk_load}, catalog, _input_messages(number_of_records, records_between_states)
+        ):
+            pass
+        elapsed = time.perf_counter() - start
+
+    print(f"bulk_load={bulk_load}: {number_of_records / elapsed:>10,.0f} records/s, {elapsed:,.1f}s for {number_of_records:,} records")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10_000_000)
+    parser.add_argument("--records-between-states", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    _measure(args.records, args.records_between_states, False)
+    _measure(args.records, args.records_between_states, True)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,33 @@
 #
 
 import datetime
+import itertools
 import json
 import os
 import sqlite3
-import uuid
 from asyncio.log import logger
 from collections import defaultdict
-from typing import Any, Iterable, Mapping
+from typing import Any, Dict, Iterable, List, Mapping
 
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
+# Random version 4 UUID in its canonical text form
+_RANDOM_UUID_SQL = (
+    "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || substr(lower(hex(randomblob(2))), 2) || '-' || "
+    "substr('89ab', 1 + abs(random()) % 4, 1) || substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6)))"
+)
+
 
 class DestinationSqlite(Destination):
+    # The buffered records of all the streams are written once there are this many records or bytes of serialized records buffered even
+    # if no state message was received so that the memory used does not depend on how often the source emits state messages
+    flush_rows = 100_000
+    flush_bytes = 64 * 1024 * 1024
+    # Size of the page cache in KiB used for bulk loads
+    bulk_load_cache_size = 256 * 1024
+
     @staticmethod
     def _get_destination_path(destination_path: str) -> str:
         """
@@ -55,75 +68,145 @@ class DestinationSqlite(Destination):
         streams = {s.stream.name for s in configured_catalog.streams}
         path = config.get("destination_path")
         path = self._get_destination_path(path)
+        bulk_load = config.get("bulk_load", False)
         con = sqlite3.connect(path)
-        with con:
-            # create the tables if needed
-            for configured_stream in configured_catalog.streams:
-                name = configured_stream.stream.name
-                table_name = f"_airbyte_raw_{name}"
-                if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
-                    # delete the tables
+        journal_mode = con.execute("PRAGMA journal_mode").fetchone()[0]
+        if bulk_load:
+            # The write-ahead log does not need to be synced to disk on every commit and lets readers query the tables during the load
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.execute(f"PRAGMA cache_size=-{self.bulk_load_cache_size}")
+        try:
+            with con:
+                # the table the records of each stream are inserted in
+                tables: Dict[str, str] = {}
+                staged_streams: List[str] = []
+                # create the tables if needed
+                for configured_stream in configured_catalog.streams:
+                    name = configured_stream.stream.name
+                    table_name = f"_airbyte_raw_{name}"
+                    if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite and bulk_load:
+                        # the records are loaded into a staging table without index which replaces the table once all the records are loaded
+                        tables[name] = self._create_staging_table(con, name)
+                        staged_streams.append(name)
+                        continue
+                    if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
+                        # delete the tables
+                        query = """
+                        DROP TABLE IF EXISTS {}
+                        """.format(
+                            table_name
+                        )
+                        con.execute(query)
+                    # create the table if needed
                     query = """
-                    DROP TABLE IF EXISTS {}
+                    CREATE TABLE IF NOT EXISTS {table_name} (
+                        _airbyte_ab_id TEXT PRIMARY KEY,
+                        _airbyte_emitted_at TEXT,
+                        _airbyte_data TEXT
+                    )
                     """.format(
-                        table_name
+                        table_name=table_name
                     )
                     con.execute(query)
-                # create the table if needed
-                query = """
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    _airbyte_ab_id TEXT PRIMARY KEY,
-                    _airbyte_emitted_at TEXT,
-                    _airbyte_data TEXT
-                )
-                """.format(
-                    table_name=table_name
-                )
-                con.execute(query)
-
-            buffer = defaultdict(list)
-
-            for message in input_messages:
-                if message.type == Type.STATE:
-                    # flush the buffer
-                    for stream_name in buffer.keys():
-
-                        query = """
-                        INSERT INTO {table_name}
-                        VALUES (?,?,?)
-                        """.format(
-                            table_name=f"_airbyte_raw_{stream_name}"
-                        )
+                    tables[name] = table_name
+
+                buffer = defaultdict(list)
+                buffered_records = 0
+                buffered_bytes = 0
+
+                for message in input_messages:
+                    if message.type == Type.STATE:
+                        # flush the buffer
+                        self._flush(con, tables, buffer)
+                        buffer = defaultdict(list)
+                        buffered_records = buffered_bytes = 0
+
+                        yield message
+                    elif message.type == Type.RECORD:
+                        data = message.record.data
+                        stream = message.record.stream
+                        if stream not in streams:
+                            logger.debug(f"Stream {stream} was not present in configured streams, skipping")
+                            continue
+
+                        # add to buffer
+                        serialized_data = json.dumps(data)
+                        buffer[stream].append(serialized_data)
+                        buffered_records += 1
+                        buffered_bytes += len(serialized_data)
+                        if buffered_records >= self.flush_rows or buffered_bytes >= self.flush_bytes:
+                            self._flush(con, tables, buffer)
+                            buffer = defaultdict(list)
+                            buffered_records = buffered_bytes = 0
+
+                # flush any remaining messages
+                self._flush(con, tables, buffer)
+
+                for stream_name in staged_streams:
+                    self._replace_table_with_staging_table(con, stream_name)
+        finally:
+            if bulk_load:
+                self._restore_journal_mode(con, journal_mode)
 
-                        con.executemany(query, buffer[stream_name])
-
-                    con.commit()
-                    buffer = defaultdict(list)
-
-                    yield message
-                elif message.type == Type.RECORD:
-                    data = message.record.data
-                    stream = message.record.stream
-                    if stream not in streams:
-                        logger.debug(f"Stream {stream} was not present in configured streams, skipping")
-                        continue
+    @staticmethod
+    def _restore_journal_mode(con: sqlite3.Connection, journal_mode: str) -> None:
+        # Leaving the write-ahead log mode requires that no other connection uses the database. The records are already committed so the
+        # database is only left in WAL mode if it is not the case
+        try:
+            con.execute(f"PRAGMA journal_mode={journal_mode}")
+        except sqlite3.OperationalError as exception:
+            logger.warning(f"Could not restore the journal mode of the database to {journal_mode}: {exception}")
 
-                    # add to buffer
-                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
+    @staticmethod
+    def _flush(con: sqlite3.Connection, tables: Mapping[str, str], buffer: Mapping[str, List[str]]) -> None:
+        # The ids are random version 4 UUIDs generated by SQLite and the time is only formatted once per flush as generating and formatting
+        # them in Python for every record is noticeable on large syncs
+        emitted_at = datetime.datetime.now().isoformat()
+        for stream_name, records in buffer.items():
+            query = """
+            INSERT INTO {table_name}
+            VALUES ({uuid},?,?)
+            """.format(
+                table_name=tables[stream_name], uuid=_RANDOM_UUID_SQL
+            )
 
-            # flush any remaining messages
-            for stream_name in buffer.keys():
+            con.executemany(query, zip(itertools.repeat(emitted_at), records))
 
-                query = """
-                INSERT INTO {table_name}
-                VALUES (?,?,?)
-                """.format(
-                    table_name=f"_airbyte_raw_{stream_name}"
-                )
+        con.commit()
 
-                con.executemany(query, buffer[stream_name])
+    @staticmethod
+    def _create_staging_table(con: sqlite3.Connection, stream_name: str) -> str:
+        staging_table_name = f"_airbyte_tmp_{stream_name}"
+        # a staging table left by a previous sync which failed is not reused as the sync starts over
+        con.execute(f"DROP TABLE IF EXISTS {staging_table_name}")
+        con.execute(
+            f"""
+            CREATE TABLE {staging_table_name} (
+                _airbyte_ab_id TEXT,
+                _airbyte_emitted_at TEXT,
+                _airbyte_data TEXT
+            )
+            """
+        )
+        return staging_table_name
 
-            con.commit()
+    @staticmethod
+    def _replace_table_with_staging_table(con: sqlite3.Connection, stream_name: str) -> None:
+        """
+        Replace the table of the stream by its staging table in a single transaction so that the previous records can be queried until the
+        new ones are all loaded. The primary key of the table is replaced by a unique index on `_airbyte_ab_id`, which is what SQLite uses to
+        enforce the primary key of a table without rowid alias. Building the index once all the records are loaded is a lot faster than
+        updating it on every insert as the ids are random.
+        """
+        table_name = f"_airbyte_raw_{stream_name}"
+        staging_table_name = f"_airbyte_tmp_{stream_name}"
+        con.commit()
+        con.execute("BEGIN")
+        con.execute(f"DROP TABLE IF EXISTS {table_name}")
+        con.execute(f"CREATE UNIQUE INDEX {table_name}_airbyte_ab_id ON {staging_table_name} (_airbyte_ab_id)")
+        con.execute(f"ALTER TABLE {staging_table_name} RENAME TO {table_name}")
+        con.commit()
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -7,14 +7,16 @@ import random
 import sqlite3
 import string
 import tempfile
+from contextlib import closing
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, List
 from unittest.mock import MagicMock
 
 import pytest
 from airbyte_cdk.models import (
     AirbyteMessage,
     AirbyteRecordMessage,
+    AirbyteStateMessage,
     AirbyteStream,
     ConfiguredAirbyteCatalog,
     ConfiguredAirbyteStream,
@@ -135,3 +137,101 @@ def test_write(
     assert len(result) == 2
     assert result[0][2] == json.dumps(airbyte_message1.record.data)
     assert result[1][2] == json.dumps(airbyte_message2.record.data)
+
+
+def _record(stream: str, data: Dict[str, Any]) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, data=data, emitted_at=0))
+
+
+def _state(data: Dict[str, Any]) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data=data))
+
+
+def _catalog(stream: str, destination_sync_mode: DestinationSyncMode) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=stream, json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=destination_sync_mode,
+            )
+        ]
+    )
+
+
+def _ids(path: str, table_name: str) -> List[int]:
+    with closing(sqlite3.connect(path)) as con:
+        return [json.loads(data)["id"] for (data,) in con.execute(f"SELECT _airbyte_data FROM {table_name} ORDER BY rowid")]
+
+
+def test_write_flushes_the_buffer_when_it_is_full(monkeypatch, test_table_name: str):
+    monkeypatch.setattr(DestinationSqlite, "flush_rows", 3)
+    path = tempfile.NamedTemporaryFile(suffix=".db")
+    table_name = f"_airbyte_raw_{test_table_name}"
+    ids_written_before_record = []
+
+    def _input_messages():
+        for record_id in range(7):
+            ids_written_before_record.append(_ids(path.name, table_name))
+            yield _record(test_table_name, {"id": record_id})
+
+    destination = DestinationSqlite()
+    list(destination.write({"destination_path": path.name}, _catalog(test_table_name, DestinationSyncMode.append), _input_messages()))
+
+    assert ids_written_before_record == [[], [], [], [0, 1, 2], [0, 1, 2], [0, 1, 2], [0, 1, 2, 3, 4, 5]]
+    assert _ids(path.name, table_name) == list(range(7))
+
+
+def test_bulk_load_overwrite_replaces_the_table_at_the_end_of_the_sync(test_table_name: str):
+    path = tempfile.NamedTemporaryFile(suffix=".db")
+    config = {"destination_path": path.name, "bulk_load": True}
+    table_name = f"_airbyte_raw_{test_table_name}"
+    destination = DestinationSqlite()
+    catalog = _catalog(test_table_name, DestinationSyncMode.overwrite)
+    list(destination.write(config, catalog, [_record(test_table_name, {"id": 1}), _record(test_table_name, {"id": 2})]))
+    ids_during_second_sync = []
+
+    def _input_messages():
+        yield _record(test_table_name, {"id": 3})
+        yield _state({"cursor": 3})
+        # the records of the previous sync are still queryable until the new records are all loaded
+        ids_during_second_sync.append(_ids(path.name, table_name))
+        yield _record(test_table_name, {"id": 4})
+
+    output_messages = list(destination.write(config, catalog, _input_messages()))
+
+    assert output_messages == [_state({"cursor": 3})]
+    assert ids_during_second_sync == [[1, 2]]
+    assert _ids(path.name, table_name) == [3, 4]
+    with closing(sqlite3.connect(path.name)) as con:
+        tables = [name for (name,) in con.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        indexes = con.execute("SELECT name, tbl_name FROM sqlite_master WHERE type = 'index'").fetchall()
+        journal_mode = con.execute("PRAGMA journal_mode").fetchone()[0]
+        with pytest.raises(sqlite3.IntegrityError):
+            con.execute(f"INSERT INTO {table_name} SELECT * FROM {table_name} LIMIT 1")
+    assert tables == [table_name]
+    assert indexes == [(f"{table_name}_airbyte_ab_id", table_name)]
+    assert journal_mode == "delete"
+
+
+def test_bulk_load_append_inserts_into_the_existing_table(test_table_name: str):
+    path = tempfile.NamedTemporaryFile(suffix=".db")
+    table_name = f"_airbyte_raw_{test_table_name}"
+    destination = DestinationSqlite()
+    list(
+        destination.write(
+            {"destination_path": path.name, "bulk_load": True},
+            _catalog(test_table_name, DestinationSyncMode.overwrite),
+            [_record(test_table_name, {"id": 1})],
+        )
+    )
+
+    list(
+        destination.write(
+            {"destination_path": path.name, "bulk_load": True},
+            _catalog(test_table_name, DestinationSyncMode.append),
+            [_record(test_table_name, {"id": 2})],
+        )
+    )
+
+    assert _ids(path.name, table_name) == [1, 2]
@@ -7,6 +7,7 @@ import logging
 import sys
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from functools import cached_property, lru_cache
 from http import HTTPStatus
@@ -101,16 +102,18 @@ class RecordUnnester:
             "properties_hs_note_body": "World's best boss",
             "properties_hs_created_by": "Michael Scott"
         }
+        The nested fields are copied into the record itself rather than into a new record so that records with thousands of properties are
+        not copied once more.
         """
 
+        fields_to_unnest = self.fields + ["properties"]
         for record in records:
-            fields_to_unnest = self.fields + ["properties"]
-            data_to_unnest = {field: record.get(field, {}) for field in fields_to_unnest}
-            unnested_data = {
-                f"{top_level_name}_{name}": value for (top_level_name, data) in data_to_unnest.items() for (name, value) in data.items()
-            }
-            final = {**record, **unnested_data}
-            yield final
+            for top_level_name in fields_to_unnest:
+                data = record.get(top_level_name)
+                if data:
+                    prefix = f"{top_level_name}_"
+                    record.update({prefix + name: value for name, value in data.items()})
+            yield record
 
 
 def retry_connection_handler(**kwargs):
@@ -336,6 +339,8 @@ class Stream(HttpStream, ABC):
     properties_scopes: Set = None
     unnest_fields: Optional[List[str]] = None
     checkpoint_by_page = False
+    # HubSpot allows at least 100 requests per 10 seconds for an app so the chunks of a page are only requested a few at a time
+    max_concurrent_property_chunk_requests = 4
 
     @cached_property
     def record_unnester(self):
@@ -493,12 +498,19 @@ class Stream(HttpStream, ABC):
         response = None
 
         properties = self._property_wrapper
-        for chunk in properties.split():
-            response = self.handle_request(
-                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
+        # The chunks of the same page are requested concurrently and merged in order as soon as they are received. The responses are not
+        # cached concurrently as the cassette is not thread-safe.
+        max_workers = 1 if self.use_cache else self.max_concurrent_property_chunk_requests
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.name) as executor:
+            responses = executor.map(
+                lambda chunk: self.handle_request(
+                    stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
+                ),
+                properties.split(),
             )
-            for record in self._transform(self.parse_response(response, stream_state=stream_state)):
-                post_processor.add_record(record)
+            for response in responses:
+                for record in self._transform(self.parse_response(response, stream_state=stream_state)):
+                    post_processor.add_record(record)
 
         return post_processor.flat, response
 
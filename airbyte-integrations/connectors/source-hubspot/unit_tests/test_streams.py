@@ -3,11 +3,13 @@
 #
 
 import json
+import threading
 from unittest.mock import patch
 
 import pendulum
 import pytest
 from airbyte_cdk.models import SyncMode
+from source_hubspot.helpers import APIv3Property
 from source_hubspot.streams import (
     Campaigns,
     Companies,
@@ -529,6 +531,44 @@ def test_records_unnester(input_data, unnest_fields, expected_output):
     assert list(unnester.unnest(input_data)) == expected_output
 
 
+def test_records_unnester_does_not_copy_records():
+    record = {"id": 1, "properties": {"phone": "+38044-111-111"}}
+
+    assert next(RecordUnnester().unnest([record])) is record
+    assert record["properties_phone"] == "+38044-111-111"
+
+
+def test_read_stream_records_requests_property_chunks_concurrently(requests_mock, common_params, fake_properties_list):
+    requests_mock.register_uri(
+        "GET",
+        "/properties/v2/company/properties",
+        json=[{"name": property_name, "type": "string"} for property_name in fake_properties_list],
+    )
+    stream = Companies(**common_params)
+    stream._sync_mode = SyncMode.full_refresh
+    chunks = list(APIv3Property(fake_properties_list).split())
+    for chunk in chunks:
+        requests_mock.register_uri(
+            "GET",
+            f"{stream.url}?limit=100&properties={','.join(chunk.properties)}",
+            json={"results": [{"id": record_id, "properties": {p: "fake_data" for p in chunk.properties}} for record_id in ["1", "2"]]},
+        )
+    # every request waits for all the chunks to be requested so reading the page would time out if they were requested one at a time
+    barrier = threading.Barrier(len(chunks), timeout=5)
+    handle_request = stream.handle_request
+
+    def _handle_request_once_all_chunks_are_requested(**kwargs):
+        barrier.wait()
+        return handle_request(**kwargs)
+
+    stream.max_concurrent_property_chunk_requests = len(chunks)
+    with patch.object(stream, "handle_request", side_effect=_handle_request_once_all_chunks_are_requested):
+        records, _ = stream._read_stream_records()
+
+    assert [record["id"] for record in records] == ["1", "2"]
+    assert all(len(record["properties"]) == len(fake_properties_list) for record in records)
+
+
 def test_web_analytics_stream_slices(common_params, mocker):
     parent_slicer_mock = mocker.patch("airbyte_cdk.sources.streams.http.HttpSubStream.stream_slices")
     parent_slicer_mock.return_value = (_ for _ in [{"parent": {"id": 1}}])
@@ -4,17 +4,20 @@
 
 import csv
 import ctypes
+import io
+import itertools
 import math
-import os
+import threading
 import time
 import urllib.parse
-import uuid
 from abc import ABC
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
+from queue import Full, Queue
 from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
 import backoff
-import pandas as pd
 import pendulum
 import requests  # type: ignore[import]
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType, SyncMode
@@ -25,14 +28,13 @@ from airbyte_cdk.sources.streams.core import CheckpointMixin, Stream, StreamData
 from airbyte_cdk.sources.streams.http import HttpClient, HttpStream, HttpSubStream
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from airbyte_cdk.utils import AirbyteTracedException
-from numpy import nan
 from pendulum import DateTime  # type: ignore[attr-defined]
 from requests import JSONDecodeError, exceptions
 from requests.models import PreparedRequest
 
 from .api import PARENT_SALESFORCE_OBJECTS, UNSUPPORTED_FILTERING_STREAMS, Salesforce
 from .availability_strategy import SalesforceAvailabilityStrategy
-from .exceptions import SalesforceException, TmpFileIOError
+from .exceptions import SalesforceException
 from .rate_limiting import (
     RESPONSE_CONSUMPTION_EXCEPTIONS,
     TRANSIENT_EXCEPTIONS,
@@ -154,13 +156,78 @@ class PropertyChunk:
         self.next_page = None
 
 
+class _PropertyChunksRecordsMerger:
+    """
+    Merges the parts of the records read for each chunk of properties by their primary key. When the records of all the chunks are sorted
+    by primary key, a record that is still incomplete once every chunk returned a later record is missing from some chunks and can never be
+    completed. Such records are dropped from the incomplete records which bounds their number by how far apart the chunks are read.
+    Otherwise, the chunks can return the same records in different orders so the incomplete records are kept until the end of the read.
+    """
+
+    def __init__(self, primary_key: str, number_of_chunks: int, sorted_by_primary_key: bool = False):
+        self._primary_key = primary_key
+        self._number_of_chunks = number_of_chunks
+        self._sorted_by_primary_key = sorted_by_primary_key
+        # incomplete records by primary key in the order they were first read with their position in this order and the number of chunks
+        # they were read from
+        self._incomplete_records: "OrderedDict[Any, Tuple[MutableMapping[str, Any], int, int]]" = OrderedDict()
+        self._skipped_record_ids: List[Any] = []
+        self._next_position = 0
+        # position of the last record read for each chunk
+        self._chunk_positions = [-1] * number_of_chunks
+
+    def add(self, chunk_id: int, record: MutableMapping[str, Any]) -> Optional[MutableMapping[str, Any]]:
+        """
+        :return: The complete record once the parts of all the chunks were added
+        """
+        record_id = record[self._primary_key]
+        if record_id in self._incomplete_records:
+            partial_record, position, counter = self._incomplete_records[record_id]
+            partial_record.update(record)
+            counter += 1
+        else:
+            partial_record, position, counter = record, self._next_position, 1
+            self._next_position += 1
+        self._chunk_positions[chunk_id] = max(self._chunk_positions[chunk_id], position)
+
+        if counter == self._number_of_chunks:
+            self._incomplete_records.pop(record_id, None)
+            complete_record: Optional[MutableMapping[str, Any]] = partial_record
+        else:
+            self._incomplete_records[record_id] = (partial_record, position, counter)
+            complete_record = None
+        if self._sorted_by_primary_key:
+            self._drop_records_read_by_all_chunks()
+        return complete_record
+
+    def incomplete_record_ids(self) -> List[Any]:
+        return self._skipped_record_ids + list(self._incomplete_records)
+
+    def _drop_records_read_by_all_chunks(self) -> None:
+        all_chunks_position = min(self._chunk_positions)
+        while self._incomplete_records:
+            record_id, (_, position, _) = next(iter(self._incomplete_records.items()))
+            if position >= all_chunks_position:
+                return
+            self._skipped_record_ids.append(record_id)
+            del self._incomplete_records[record_id]
+
+
 class RestSalesforceStream(SalesforceStream):
     state_converter = IsoMillisConcurrentStreamStateConverter(is_sequential_state=False)
+    MAX_CONCURRENT_PROPERTY_CHUNK_REQUESTS = 8
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         assert self.primary_key or not self.too_many_properties
 
+    @property
+    def sorted_by_primary_key(self) -> bool:
+        """
+        Whether the query built by `request_params` orders the records by primary key
+        """
+        return bool(self.primary_key) and self.name not in UNSUPPORTED_FILTERING_STREAMS
+
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         if next_page_token:
             """
@@ -224,11 +291,11 @@ class RestSalesforceStream(SalesforceStream):
         if local_properties:
             yield local_properties
 
-    @staticmethod
-    def _next_chunk_id(property_chunks: Mapping[int, PropertyChunk]) -> Optional[int]:
+    def _chunks_to_fetch(self, property_chunks: Mapping[int, PropertyChunk]) -> List[int]:
         """
-        Figure out which chunk is going to be read next.
-        It should be the one with the least number of records read by the moment.
+        Figure out which chunks are going to be read next. Their next pages are fetched concurrently.
+        The chunk with the least number of records read by the moment is always read, as well as the other chunks that are less than a page
+        ahead of it so that the records of the chunks stay close enough to be merged with a bounded number of incomplete records.
         """
         non_exhausted_chunks = {
             # We skip chunks that have already attempted a sync before and do not have a next page
@@ -237,8 +304,11 @@ class RestSalesforceStream(SalesforceStream):
             if property_chunk.first_time or property_chunk.next_page
         }
         if not non_exhausted_chunks:
-            return None
-        return min(non_exhausted_chunks, key=non_exhausted_chunks.get)
+            return []
+        least_record_counter = min(non_exhausted_chunks.values())
+        return [
+            chunk_id for chunk_id, record_counter in non_exhausted_chunks.items() if record_counter < least_record_counter + self.page_size
+        ]
 
     def _read_pages(
         self,
@@ -249,50 +319,53 @@ class RestSalesforceStream(SalesforceStream):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
-        records_by_primary_key = {}
         property_chunks: Mapping[int, PropertyChunk] = {
             index: PropertyChunk(properties=properties) for index, properties in enumerate(self.chunk_properties())
         }
-        while True:
-            chunk_id = self._next_chunk_id(property_chunks)
-            if chunk_id is None:
-                # pagination complete
-                break
-
-            property_chunk = property_chunks[chunk_id]
-            request, response = self._fetch_next_page_for_chunk(
-                stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
-            )
-
-            # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next chunk
-            if property_chunk.first_time:
-                property_chunk.first_time = False
-            property_chunk.next_page = self.next_page_token(response)
-            chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
-            if not self.too_many_properties:
-                # this is the case when a stream has no primary key
-                # (it is allowed when properties length does not exceed the maximum value)
-                # so there would be a single chunk, therefore we may and should yield records immediately
-                for record in chunk_page_records:
-                    property_chunk.record_counter += 1
-                    yield record
-                continue
-
-            # stick together different parts of records by their primary key and emit if a record is complete
-            for record in chunk_page_records:
-                property_chunk.record_counter += 1
-                record_id = record[self.primary_key]
-                if record_id not in records_by_primary_key:
-                    records_by_primary_key[record_id] = (record, 1)
-                    continue
-                partial_record, counter = records_by_primary_key[record_id]
-                partial_record.update(record)
-                counter += 1
-                if counter == len(property_chunks):
-                    yield partial_record  # now it's complete
-                    records_by_primary_key.pop(record_id)
-                else:
-                    records_by_primary_key[record_id] = (partial_record, counter)
+        records_merger = _PropertyChunksRecordsMerger(self.primary_key, len(property_chunks), self.sorted_by_primary_key)
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_PROPERTY_CHUNK_REQUESTS, thread_name_prefix=self.name) as executor:
+            while True:
+                chunk_ids = self._chunks_to_fetch(property_chunks)
+                if not chunk_ids:
+                    # pagination complete
+                    break
+
+                futures = [
+                    executor.submit(
+                        self._fetch_next_page_for_chunk,
+                        stream_slice,
+                        stream_state,
+                        property_chunks[chunk_id].next_page,
+                        property_chunks[chunk_id].properties,
+                    )
+                    for chunk_id in chunk_ids
+                ]
+                # the pages are merged in the order of the chunks as soon as they are received
+                for chunk_id, future in zip(chunk_ids, futures):
+                    request, response = future.result()
+                    property_chunk = property_chunks[chunk_id]
+
+                    # When this is the first time we're getting a chunk's records, we set this to False to be used when deciding the next
+                    # chunks
+                    if property_chunk.first_time:
+                        property_chunk.first_time = False
+                    property_chunk.next_page = self.next_page_token(response)
+                    chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
+                    if not self.too_many_properties:
+                        # this is the case when a stream has no primary key
+                        # (it is allowed when properties length does not exceed the maximum value)
+                        # so there would be a single chunk, therefore we may and should yield records immediately
+                        for record in chunk_page_records:
+                            property_chunk.record_counter += 1
+                            yield record
+                        continue
+
+                    # stick together different parts of records by their primary key and emit them as soon as they are complete
+                    for record in chunk_page_records:
+                        property_chunk.record_counter += 1
+                        complete_record = records_merger.add(chunk_id, record)
+                        if complete_record is not None:
+                            yield complete_record
 
         # Process what's left.
         # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
@@ -302,7 +375,7 @@ class RestSalesforceStream(SalesforceStream):
         # Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
         # Then records `2` and `3` would be incomplete.
         # This may result in data inconsistency. We skip such records for now and log a warning message.
-        incomplete_record_ids = ",".join([str(key) for key in records_by_primary_key])
+        incomplete_record_ids = ",".join([str(key) for key in records_merger.incomplete_record_ids()])
         if incomplete_record_ids:
             self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
 
@@ -357,10 +430,106 @@ class RestSalesforceSubStream(BatchedSubStream, RestSalesforceStream):
     pass
 
 
+class _NullBytesFilteringReader(io.RawIOBase):
+    """
+    Raw binary stream over chunks of bytes which are filtered as they are read so that they can be decoded by an io.TextIOWrapper
+    """
+
+    def __init__(self, chunks: Iterable[bytes], filter_chunk: Callable[[bytes], bytes]):
+        self._chunks = iter(chunks)
+        self._filter_chunk = filter_chunk
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(self._filter_chunk(chunk))
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+class _DownloadCancelled(Exception):
+    pass
+
+
+class _ResultsPage:
+    """
+    Page of the results of a bulk job downloaded in a background thread. The records are passed to the thread reading them through a
+    bounded queue of batches so that the memory used does not depend on the size of the page.
+    """
+
+    _END = object()
+    _TIMEOUT_IN_SECONDS = 0.1
+
+    def __init__(
+        self,
+        url: str,
+        queue_size: int,
+        cancelled: threading.Event,
+        create_next_page: Callable[[Mapping[str, str]], Optional["_ResultsPage"]],
+    ):
+        self.url = url
+        self.number_of_records = 0
+        self.next_page: Optional[_ResultsPage] = None
+        self._batches: "Queue[Any]" = Queue(maxsize=queue_size)
+        self._cancelled = cancelled
+        self._create_next_page = create_next_page
+        self._headers_received = False
+
+    def set_headers(self, headers: Mapping[str, str]) -> None:
+        # retried downloads receive the same headers and the next page must only be downloaded once
+        if not self._headers_received:
+            self._headers_received = True
+            self.next_page = self._create_next_page(headers)
+
+    def add_records(self, records: List[MutableMapping[str, Any]]) -> None:
+        self._put(records)
+        self.number_of_records += len(records)
+
+    def finish(self) -> None:
+        self._put(self._END)
+
+    def fail(self, exception: BaseException) -> None:
+        try:
+            self._put(exception)
+        except _DownloadCancelled:
+            pass
+
+    def read(self) -> Iterable[List[MutableMapping[str, Any]]]:
+        while True:
+            item = self._batches.get()
+            if item is self._END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _put(self, item: Any) -> None:
+        while True:
+            if self._cancelled.is_set():
+                raise _DownloadCancelled()
+            try:
+                self._batches.put(item, timeout=self._TIMEOUT_IN_SECONDS)
+                return
+            except Full:
+                pass
+
+
 class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT_SECONDS = 86400  # 24-hour bulk job running time
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024
+    RECORDS_BATCH_SIZE = 1000
+    MAX_CONCURRENT_RESULTS_PAGES = 3
+    RESULTS_PAGE_QUEUE_SIZE = 2
 
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         return f"/services/data/{self.sf_api.version}/jobs/query"
@@ -511,51 +680,50 @@ class BulkSalesforceStream(SalesforceStream):
     @default_backoff_handler(
         max_tries=5, retry_on=RESPONSE_CONSUMPTION_EXCEPTIONS
     )  # We need the default_backoff_handler here because the HttpClient does not handle errors during the streaming of the response
-    def download_data(self, url: str, chunk_size: int = 1024) -> tuple[str, str, dict]:
+    def download_data(self, page: "_ResultsPage") -> None:
         """
-        Retrieves binary data result from successfully `executed_job`, using chunks, to avoid local memory limitations.
-        @ url: string - the url of the `executed_job`
-        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1024 bytes
-        Return the tuple containing string with file path of downloaded binary data (Saved temporarily) and file encoding.
+        Downloads a page of the results of an `executed_job` and passes its records to `page` in batches as the response is received, to
+        avoid local memory limitations. When the download is retried, the records that were already passed to `page` are skipped.
+        @ page: _ResultsPage - the page of results to download
         """
-        # set filepath for binary data from response
-        tmp_file = str(uuid.uuid4())
         _, streamed_response = self._http_client.send_request(
-            "GET", url, headers={"Accept-Encoding": "gzip"}, request_kwargs={"stream": True}
+            "GET", page.url, headers={"Accept-Encoding": "gzip"}, request_kwargs={"stream": True}
         )
-        with closing(streamed_response) as response, open(tmp_file, "wb") as data_file:
-            response_headers = response.headers
-            response_encoding = self.get_response_encoding(response_headers)
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                data_file.write(self.filter_null_bytes(chunk))
-        # check the file exists
-        if os.path.isfile(tmp_file):
-            return tmp_file, response_encoding, response_headers
-        else:
-            raise TmpFileIOError(f"The IO/Error occured while verifying binary data. Stream: {self.name}, file {tmp_file} doesn't exist.")
-
-    def read_with_chunks(self, path: str, file_encoding: str, chunk_size: int = 100) -> Iterable[Tuple[int, Mapping[str, Any]]]:
+        with closing(streamed_response) as response:
+            page.set_headers(response.headers)
+            records_to_skip = page.number_of_records
+            chunks = response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE)
+            for records in self.read_with_chunks(chunks, self.get_response_encoding(response.headers)):
+                if records_to_skip:
+                    skipped = min(records_to_skip, len(records))
+                    records, records_to_skip = records[skipped:], records_to_skip - skipped
+                if records:
+                    page.add_records(records)
+
+    def read_with_chunks(
+        self, chunks: Iterable[bytes], encoding: str, batch_size: Optional[int] = None
+    ) -> Iterable[List[MutableMapping[str, Any]]]:
         """
-        Reads the downloaded binary data, using lines chunks, set by `chunk_size`.
-        @ path: string - the path to the downloaded temporarily binary data.
-        @ file_encoding: string - encoding for binary data file according to Standard Encodings from codecs module
-        @ chunk_size: int - the number of lines to read at a time, default: 100 lines / time.
+        Decodes the CSV data as the chunks of bytes are received and returns the records in batches of `batch_size`. All values are strings
+        and empty values are None.
+        @ chunks: Iterable[bytes] - the chunks of binary data
+        @ encoding: string - encoding of the binary data according to Standard Encodings from codecs module
+        @ batch_size: int - the maximum number of records per batch, default: RECORDS_BATCH_SIZE
         """
-        try:
-            with open(path, "r", encoding=file_encoding) as data:
-                chunks = pd.read_csv(data, chunksize=chunk_size, iterator=True, dialect="unix", dtype=object)
-                for chunk in chunks:
-                    chunk = chunk.replace({nan: None}).to_dict(orient="records")
-                    for row in chunk:
-                        yield row
-        except pd.errors.EmptyDataError as e:
-            self.logger.info(f"Empty data received. {e}")
-            yield from []
-        except IOError as ioe:
-            raise TmpFileIOError(f"The IO/Error occured while reading tmp data. Called: {path}. Stream: {self.name}", ioe)
-        finally:
-            # remove binary tmp file, after data is read
-            os.remove(path)
+        batch_size = batch_size or self.RECORDS_BATCH_SIZE
+        raw_data = _NullBytesFilteringReader(chunks, self.filter_null_bytes)
+        with io.TextIOWrapper(io.BufferedReader(raw_data, self.DOWNLOAD_CHUNK_SIZE), encoding=encoding, newline="") as data:
+            reader = csv.reader(data, dialect="unix")
+            field_names = next(reader, None)
+            if field_names is None:
+                self.logger.info("Empty data received.")
+                return
+            while True:
+                rows = list(itertools.islice(reader, batch_size))
+                if not rows:
+                    return
+                # blank lines are skipped and the bulk API writes empty fields for null values
+                yield [{name: value or None for name, value in zip(field_names, row)} for row in rows if row]
 
     def abort_job(self, url: str):
         data = {"state": "Aborted"}
@@ -632,31 +800,60 @@ class BulkSalesforceStream(SalesforceStream):
                 )
                 return
             raise SalesforceException(f"Job for {self.name} stream using BULK API was failed.")
-        salesforce_bulk_api_locator = None
-        while True:
-            req = PreparedRequest()
-            req.prepare_url(f"{job_full_url}/results", {"locator": salesforce_bulk_api_locator})
-            try:
-                tmp_file, response_encoding, response_headers = self.download_data(url=req.url)
-            except TRANSIENT_EXCEPTIONS as exception:
-                # We have seen some cases where pulling the job result's data would simply not work even with the retry on `download_data`.
-                # Those cases have unfortunately not been documented and we are unsure of the efficacy of retrying the whole job as we have
-                # done multiple reliability change without tracking the efficacy of each.
-                if call_count >= _JOB_TRANSIENT_ERRORS_MAX_RETRY:
-                    self.logger.error(f"Downloading data failed even after {call_count} retries. Stopping retry and raising exception")
-                    raise exception
-                self.logger.warning(f"Downloading data failed after {call_count} retries. Retrying the whole job...")
-                call_count += 1
-                yield from self.read_records(sync_mode, cursor_field, stream_slice, stream_state, call_count=call_count)
-                return
+        try:
+            yield from self._read_results(job_full_url)
+        except TRANSIENT_EXCEPTIONS as exception:
+            # We have seen some cases where pulling the job result's data would simply not work even with the retry on `download_data`.
+            # Those cases have unfortunately not been documented and we are unsure of the efficacy of retrying the whole job as we have
+            # done multiple reliability change without tracking the efficacy of each.
+            if call_count >= _JOB_TRANSIENT_ERRORS_MAX_RETRY:
+                self.logger.error(f"Downloading data failed even after {call_count} retries. Stopping retry and raising exception")
+                raise exception
+            self.logger.warning(f"Downloading data failed after {call_count} retries. Retrying the whole job...")
+            call_count += 1
+            yield from self.read_records(sync_mode, cursor_field, stream_slice, stream_state, call_count=call_count)
+            return
+        self.delete_job(url=job_full_url)
+
+    def _read_results(self, job_full_url: str) -> Iterable[Mapping[str, Any]]:
+        """
+        Reads the pages of results of a job in order. The locator of the next page is returned in the headers of the previous page so the
+        download of the next page starts as soon as these headers are received, and up to MAX_CONCURRENT_RESULTS_PAGES pages are downloaded
+        and decoded concurrently while the records of the first one are read.
+        """
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_RESULTS_PAGES, thread_name_prefix=f"{self.name}_results")
 
-            for record in self.read_with_chunks(tmp_file, response_encoding):
-                yield record
+        def download(page: _ResultsPage) -> None:
+            try:
+                self.download_data(page)
+            except BaseException as exception:
+                page.fail(exception)
+            else:
+                page.finish()
 
-            if response_headers.get("Sforce-Locator", "null") == "null":
-                break
-            salesforce_bulk_api_locator = response_headers.get("Sforce-Locator")
-        self.delete_job(url=job_full_url)
+        def create_page(locator: Optional[str]) -> _ResultsPage:
+            req = PreparedRequest()
+            req.prepare_url(f"{job_full_url}/results", {"locator": locator})
+            page = _ResultsPage(req.url, self.RESULTS_PAGE_QUEUE_SIZE, cancelled, create_next_page)
+            executor.submit(download, page)
+            return page
+
+        def create_next_page(headers: Mapping[str, str]) -> Optional[_ResultsPage]:
+            locator = headers.get("Sforce-Locator", "null")
+            if locator == "null" or cancelled.is_set():
+                return None
+            return create_page(locator)
+
+        page: Optional[_ResultsPage] = create_page(None)
+        try:
+            while page is not None:
+                for records in page.read():
+                    yield from records
+                page = page.next_page
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def get_standard_instance(self) -> SalesforceStream:
         """Returns a instance of standard logic(non-BULK) with same settings"""
@@ -758,9 +955,17 @@ class IncrementalRestSalesforceStream(RestSalesforceStream, CheckpointMixin, ABC
 
         where_clause = f"WHERE {' AND '.join(where_conditions)}"
         query = f"SELECT {select_fields} FROM {table_name} {where_clause}"
+        if self.sorted_by_primary_key:
+            # the state is only updated once a slice is complete, so the records of the slice can be read in any order
+            query += f" ORDER BY {self.primary_key} ASC"
 
         return {"q": query}
 
+    @property
+    def sorted_by_primary_key(self) -> bool:
+        # the records of the property chunks are merged by primary key, which is bounded in memory only if they are sorted by it
+        return bool(self.primary_key) and self.too_many_properties
+
     @property
     def cursor_field(self) -> str:
         return self.replication_key
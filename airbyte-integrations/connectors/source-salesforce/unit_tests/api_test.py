@@ -6,6 +6,7 @@ import csv
 import io
 import logging
 import re
+import urllib.parse
 from datetime import datetime, timedelta
 from typing import List
 from unittest.mock import Mock, patch
@@ -40,7 +41,9 @@ from source_salesforce.streams import (
     BulkSalesforceStream,
     BulkSalesforceSubStream,
     IncrementalRestSalesforceStream,
+    PropertyChunk,
     RestSalesforceStream,
+    _PropertyChunksRecordsMerger,
 )
 
 _A_CHUNKED_RESPONSE = [b"first chunk", b"second chunk"]
@@ -263,51 +266,50 @@ def test_stream_start_datetime_format_should_not_changed(stream_config, stream_a
 
 
 def test_download_data_filter_null_bytes(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    job_full_url_results: str = f"{job_full_url}/results"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
         m.register_uri("GET", job_full_url_results, content=b"\x00")
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        res = list(stream._read_results(job_full_url))
         assert res == []
 
         m.register_uri("GET", job_full_url_results, content=b'"Id","IsDeleted"\n\x00"0014W000027f6UwQAI","false"\n\x00\x00')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        res = list(stream._read_results(job_full_url))
         assert res == [{"Id": "0014W000027f6UwQAI", "IsDeleted": "false"}]
 
 
 def test_read_with_chunks_should_return_only_object_data_type(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    job_full_url_results: str = f"{job_full_url}/results"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
         m.register_uri("GET", job_full_url_results, content=b'"IsDeleted","Age"\n"false",24\n')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        res = list(stream._read_results(job_full_url))
         assert res == [{"IsDeleted": "false", "Age": "24"}]
 
 
 def test_read_with_chunks_should_return_a_string_when_a_string_with_only_digits_is_provided(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    job_full_url_results: str = f"{job_full_url}/results"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
         m.register_uri("GET", job_full_url_results, content=b'"ZipCode"\n"01234"\n')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        res = list(stream._read_results(job_full_url))
         assert res == [{"ZipCode": "01234"}]
 
 
 def test_read_with_chunks_should_return_null_value_when_no_data_is_provided(stream_config, stream_api):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    job_full_url_results: str = f"{job_full_url}/results"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
 
     with requests_mock.Mocker() as m:
         m.register_uri("GET", job_full_url_results, content=b'"IsDeleted","Age","Name"\n"false",,"Airbyte"\n')
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        res = list(stream._read_results(job_full_url))
         assert res == [{"IsDeleted": "false", "Age": None, "Name": "Airbyte"}]
 
 
@@ -317,13 +319,14 @@ def test_read_with_chunks_should_return_null_value_when_no_data_is_provided(stre
     ids=[f"charset: {x[1]}, chunk_size: {x[0]}" for x in encoding_symbols_parameters()],
 )
 def test_encoding_symbols(stream_config, stream_api, chunk_size, content_type_header, content, expected_result):
-    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    job_full_url_results: str = f"{job_full_url}/results"
     stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    stream.DOWNLOAD_CHUNK_SIZE = chunk_size
 
     with requests_mock.Mocker() as m:
         m.register_uri("GET", job_full_url_results, headers=content_type_header, content=content)
-        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
-        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        res = list(stream._read_results(job_full_url))
         assert res == expected_result
 
 
@@ -408,7 +411,8 @@ def test_pagination_rest(stream_config, stream_api):
 
 def test_csv_reader_dialect_unix():
     stream: BulkSalesforceStream = BulkSalesforceStream(stream_name=None, sf_api=None, pk=None)
-    url_results = "https://fake-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    job_full_url = "https://fake-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    url_results = f"{job_full_url}/results"
 
     data = [
         {"Id": "1", "Name": '"first_name" "last_name"'},
@@ -425,8 +429,7 @@ def test_csv_reader_dialect_unix():
 
     with requests_mock.Mocker() as m:
         m.register_uri("GET", url_results, text=text)
-        tmp_file, response_encoding, _ = stream.download_data(url=url_results)
-        result = [i for i in stream.read_with_chunks(tmp_file, response_encoding)]
+        result = list(stream._read_results(job_full_url))
         assert result == data
 
 
@@ -442,11 +445,60 @@ def test_given_retryable_error_when_download_data_then_retry(mocked_http_client,
     mocked_http_client.return_value.send_request.return_value = (Mock(), mocked_response)
     mocked_response.iter_content.side_effect = [ChunkedEncodingError(), _A_CHUNKED_RESPONSE]
 
-    BulkSalesforceStream(stream_name=_A_STREAM_NAME, sf_api=Mock(), pk=_A_PK).download_data(url="any url")
+    BulkSalesforceStream(stream_name=_A_STREAM_NAME, sf_api=Mock(), pk=_A_PK).download_data(Mock(url="any url", number_of_records=0))
 
     assert mocked_response.iter_content.call_count == 2
 
 
+def _chunks_then_error(chunks: List[bytes]):
+    yield from chunks
+    raise ChunkedEncodingError()
+
+
+@patch("source_salesforce.streams.HttpClient")
+def test_given_retryable_error_after_records_were_read_when_read_results_then_skip_records_already_read(
+    mocked_http_client, mocked_response
+):
+    mocked_http_client.return_value.send_request.return_value = (Mock(), mocked_response)
+    mocked_response.iter_content.side_effect = [
+        _chunks_then_error([b"Id\n1\n2\n"]),
+        [b"Id\n1\n2\n3\n"],
+    ]
+    stream = BulkSalesforceStream(stream_name=_A_STREAM_NAME, sf_api=Mock(), pk=_A_PK)
+    stream.RECORDS_BATCH_SIZE = 1
+
+    records = list(stream._read_results("https://fake-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"))
+
+    assert records == [{"Id": "1"}, {"Id": "2"}, {"Id": "3"}]
+
+
+def test_read_with_chunks_should_return_records_in_batches():
+    stream = BulkSalesforceStream(stream_name=_A_STREAM_NAME, sf_api=Mock(), pk=_A_PK)
+    chunks = [b'Id,Name\n1,"first\n', b'name"\n2,second', b"_name\n\n3,third_name\n"]
+
+    batches = list(stream.read_with_chunks(chunks, "utf-8", batch_size=2))
+
+    assert batches == [
+        [{"Id": "1", "Name": "first\nname"}, {"Id": "2", "Name": "second_name"}],
+        [{"Id": "3", "Name": "third_name"}],
+    ]
+
+
+def test_given_locators_when_read_results_then_return_records_of_all_pages_in_order(requests_mock):
+    stream = BulkSalesforceStream(stream_name=_A_STREAM_NAME, sf_api=Mock(), pk=_A_PK)
+    job_full_url = "https://fake-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA"
+    number_of_pages = 5
+    for page in range(number_of_pages):
+        locator = "null" if page == number_of_pages - 1 else str(page + 1)
+        url = f"{job_full_url}/results" if page == 0 else f"{job_full_url}/results?locator={page}"
+        records = "".join(f"{page}-{record}\n" for record in range(3))
+        requests_mock.register_uri("GET", url, text=f"Id\n{records}", headers={"Sforce-Locator": locator})
+
+    records = list(stream._read_results(job_full_url))
+
+    assert [record["Id"] for record in records] == [f"{page}-{record}" for page in range(number_of_pages) for record in range(3)]
+
+
 @patch("source_salesforce.streams.HttpClient")
 def test_given_first_download_fail_when_download_data_then_retry_job_only_once(mocked_http_client, mocked_response):
     sf_api = Mock()
@@ -660,28 +712,44 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
     assert stream.too_many_properties
     assert stream.primary_key
     assert type(stream) == RestSalesforceStream
-    url = next_page_url = "https://fase-account.salesforce.com/services/data/v57.0/queryAll"
-    requests_mock.get(
-        url,
-        [
+    url = "https://fase-account.salesforce.com/services/data/v57.0/queryAll"
+    chunk_ids_by_fields = {frozenset(chunk): chunk_id for chunk_id, chunk in enumerate(chunks)}
+    pages_by_chunk_id = {
+        0: [
             {
-                "json": {
-                    "records": [
-                        {"Id": 1, "propertyA": "A"},
-                        {"Id": 2, "propertyA": "A"},
-                        {"Id": 3, "propertyA": "A"},
-                        {"Id": 4, "propertyA": "A"},
-                    ]
-                }
+                "records": [
+                    {"Id": 1, "propertyA": "A"},
+                    {"Id": 2, "propertyA": "A"},
+                    {"Id": 3, "propertyA": "A"},
+                    {"Id": 4, "propertyA": "A"},
+                ]
+            }
+        ],
+        1: [
+            {
+                "nextRecordsUrl": "/services/data/v57.0/queryAll/next-page-1",
+                "records": [{"Id": 1, "propertyB": "B"}, {"Id": 2, "propertyB": "B"}],
             },
-            {"json": {"nextRecordsUrl": next_page_url, "records": [{"Id": 1, "propertyB": "B"}, {"Id": 2, "propertyB": "B"}]}},
-            # 2 for 2 chunks above
-            *[{"json": {"records": [{"Id": 1}, {"Id": 2}], "nextRecordsUrl": next_page_url}} for _ in range(chunks_len - 2)],
-            {"json": {"records": [{"Id": 3, "propertyB": "B"}, {"Id": 4, "propertyB": "B"}]}},
-            # 2 for 1 chunk above and 1 chunk had no next page
-            *[{"json": {"records": [{"Id": 3}, {"Id": 4}]}} for _ in range(chunks_len - 2)],
+            {"records": [{"Id": 3, "propertyB": "B"}, {"Id": 4, "propertyB": "B"}]},
         ],
-    )
+    }
+    for chunk_id in range(2, chunks_len):
+        pages_by_chunk_id[chunk_id] = [
+            {"nextRecordsUrl": f"/services/data/v57.0/queryAll/next-page-{chunk_id}", "records": [{"Id": 1}, {"Id": 2}]},
+            {"records": [{"Id": 3}, {"Id": 4}]},
+        ]
+
+    def _get_page(request, context):
+        # the pages of the chunks are requested concurrently so they are identified by the fields queried or the next page url
+        next_page = re.search(r"next-page-(\d+)$", request.path)
+        if next_page:
+            return pages_by_chunk_id[int(next_page.group(1))][1]
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)["q"][0]
+        fields = query.split(" FROM ")[0][len("SELECT ") :].split(",")
+        return pages_by_chunk_id[chunk_ids_by_fields[frozenset(fields)]][0]
+
+    requests_mock.get(url, json=_get_page)
+    requests_mock.get(re.compile(r".*/queryAll/next-page-\d+$"), json=_get_page)
     records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
     assert records == [
         {"Id": 1, "propertyA": "A", "propertyB": "B"},
@@ -693,6 +761,73 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
         assert len(call.url) < Salesforce.REQUEST_SIZE_LIMITS
 
 
+def test_property_chunks_records_merger_emits_records_once_all_chunks_are_read():
+    merger = _PropertyChunksRecordsMerger("Id", 2)
+
+    assert merger.add(0, {"Id": 1, "propertyA": "A"}) is None
+    assert merger.add(0, {"Id": 2, "propertyA": "A"}) is None
+    assert merger.add(1, {"Id": 1, "propertyB": "B"}) == {"Id": 1, "propertyA": "A", "propertyB": "B"}
+    assert merger.add(1, {"Id": 2, "propertyB": "B"}) == {"Id": 2, "propertyA": "A", "propertyB": "B"}
+    assert merger.incomplete_record_ids() == []
+
+
+def test_property_chunks_records_merger_drops_records_missing_from_a_chunk_once_all_chunks_read_past_them():
+    merger = _PropertyChunksRecordsMerger("Id", 2, sorted_by_primary_key=True)
+
+    for record_id in [1, 2, 3]:
+        merger.add(0, {"Id": record_id, "propertyA": "A"})
+    merger.add(1, {"Id": 1, "propertyB": "B"})
+    assert merger.add(1, {"Id": 3, "propertyB": "B"}) == {"Id": 3, "propertyA": "A", "propertyB": "B"}
+    merger.add(1, {"Id": 4, "propertyB": "B"})
+
+    assert merger.incomplete_record_ids() == [2, 4]
+    assert list(merger._incomplete_records) == [4]
+
+
+def test_property_chunks_records_merger_keeps_incomplete_records_when_chunks_are_not_sorted_by_primary_key():
+    merger = _PropertyChunksRecordsMerger("Id", 2, sorted_by_primary_key=False)
+
+    complete_records = [merger.add(0, {"Id": record_id, "propertyA": "A"}) for record_id in [1, 2, 3]]
+    complete_records += [merger.add(1, {"Id": record_id, "propertyB": "B"}) for record_id in [2, 1, 3]]
+
+    assert [record["Id"] for record in complete_records if record] == [2, 1, 3]
+    assert merger.incomplete_record_ids() == []
+
+
+def test_incremental_stream_without_too_many_properties_records_are_not_sorted_by_primary_key(stream_config, stream_api):
+    stream = generate_stream("Account", stream_config, stream_api).get_standard_instance()
+    assert isinstance(stream, IncrementalRestSalesforceStream)
+    assert "ORDER BY" not in stream.request_params(stream_state={}, property_chunk={"Id": {}})["q"]
+    assert not stream.sorted_by_primary_key
+
+
+def test_incremental_stream_with_too_many_properties_records_are_sorted_by_primary_key(
+    stream_config, stream_api_v2_pk_incremental_too_many_properties
+):
+    stream = generate_stream("Account", stream_config, stream_api_v2_pk_incremental_too_many_properties).get_standard_instance()
+    assert isinstance(stream, IncrementalRestSalesforceStream)
+    assert stream.too_many_properties
+    stream_slice = {"start_date": "2024-01-01T00:00:00.000+00:00", "end_date": "2024-02-01T00:00:00.000+00:00"}
+    query = stream.request_params(stream_state={}, stream_slice=stream_slice, property_chunk={"Id": {}})["q"]
+    assert query.endswith(
+        "WHERE LastModifiedDate >= 2024-01-01T00:00:00.000+00:00 AND LastModifiedDate < 2024-02-01T00:00:00.000+00:00 ORDER BY Id ASC"
+    )
+    assert stream.sorted_by_primary_key
+
+
+def test_given_chunk_more_than_a_page_ahead_when_chunks_to_fetch_then_only_fetch_the_chunks_behind(
+    stream_config, stream_api_v2_pk_too_many_properties
+):
+    stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
+    property_chunks = {chunk_id: PropertyChunk(properties={}) for chunk_id in range(3)}
+    for chunk_id, record_counter in enumerate([2 * stream.page_size, stream.page_size, stream.page_size + 1]):
+        property_chunks[chunk_id].first_time = False
+        property_chunks[chunk_id].next_page = {"next_token": f"next-page-{chunk_id}"}
+        property_chunks[chunk_id].record_counter = record_counter
+
+    assert stream._chunks_to_fetch(property_chunks) == [1, 2]
+
+
 def test_stream_with_no_records_in_response(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
     stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
     chunks = list(stream.chunk_properties())
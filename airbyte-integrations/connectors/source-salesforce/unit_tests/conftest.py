@@ -121,6 +121,13 @@ def stream_api_v2_pk_too_many_properties(stream_config):
     return mock_stream_api(stream_config, describe_response_data=describe_response_data)
 
 
+@pytest.fixture(scope="module")
+def stream_api_v2_pk_incremental_too_many_properties(stream_config):
+    describe_response_data = {"fields": [{"name": f"Property{str(i)}", "type": "string"} for i in range(Salesforce.REQUEST_SIZE_LIMITS)]}
+    describe_response_data["fields"].extend([{"name": "LastModifiedDate", "type": "string"}, {"name": "Id", "type": "string"}])
+    return mock_stream_api(stream_config, describe_response_data=describe_response_data)
+
+
 def generate_stream(stream_name, stream_config, stream_api, state=None, legacy=True):
     if state is None:
         state = _ANY_STATE
@@ -136,14 +143,14 @@ def generate_stream(stream_name, stream_config, stream_api, state=None, legacy=T
 def encoding_symbols_parameters():
     return (
         [
-            (x, {"Content-Type": "text/csv; charset=ISO-8859-1"}, b'"\xc4"\n,"4"\n\x00,"\xca \xfc"', [{"Ä": "4"}, {"Ä": "Ê ü"}])
+            (x, {"Content-Type": "text/csv; charset=ISO-8859-1"}, b'"\xc4"\n"4"\n\x00"\xca \xfc"', [{"Ä": "4"}, {"Ä": "Ê ü"}])
             for x in range(1, 11)
         ]
         + [
             (
                 x,
                 {"Content-Type": "text/csv; charset=utf-8"},
-                b'"\xd5\x80"\n "\xd5\xaf","\xd5\xaf"\n\x00,"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
+                b'"\xd5\x80"\n"\xd5\xaf"\n\x00"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
                 [{"Հ": "կ"}, {"Հ": "も ヤ ヤ 𝜵"}],
             )
             for x in range(1, 11)
@@ -152,7 +159,7 @@ def encoding_symbols_parameters():
             (
                 x,
                 {"Content-Type": "text/csv"},
-                b'"\xd5\x80"\n "\xd5\xaf","\xd5\xaf"\n\x00,"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
+                b'"\xd5\x80"\n"\xd5\xaf"\n\x00"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
                 [{"Հ": "կ"}, {"Հ": "も ヤ ヤ 𝜵"}],
             )
             for x in range(1, 11)
@@ -161,7 +168,7 @@ def encoding_symbols_parameters():
             (
                 x,
                 {},
-                b'"\xd5\x80"\n "\xd5\xaf","\xd5\xaf"\n\x00,"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
+                b'"\xd5\x80"\n"\xd5\xaf"\n\x00"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
                 [{"Հ": "կ"}, {"Հ": "も ヤ ヤ 𝜵"}],
             )
             for x in range(1, 11)
@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+"""
+Measures the lines/s and records/s of producing the records of the `products` stream from a BULK Job result of 1M lines, where each
+product is followed by its images and variants, the way they are produced while the result is downloaded.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Iterable
+
+from source_shopify.streams.streams import Products
+
+_IMAGES_PER_PRODUCT = 2
+_VARIANTS_PER_PRODUCT = 3
+
+
+def _product_lines(product_id: int) -> Iterable[str]:
+    product_gid = f"gid://shopify/Product/{product_id}"
+    yield json.dumps(
+        {
+            "__typename": "Product",
+            "id": product_gid,
+            "publishedAt": "2021-06-23T01:09:29Z",
+            "createdAt": "2021-06-23T01:09:29Z",
+            "status": "ACTIVE",
+            "vendor": "Blanda, O'Kon and Bartell",
+            "updatedAt": "2023-04-20T11:12:26Z",
+            "bodyHtml": "Gold and silver glitter iPhone 7 cases with geometric line patterns, stacked",
+            "productType": "Music",
+            "tags": ["developer-tools-generator"],
+            "handle": "gold-silver-iphone-7-case",
+            "templateSuffix": None,
+            "title": "Gold Silver iPhone 7 Case",
+            "description": "Gold and silver glitter iPhone 7 cases with geometric line patterns, stacked",
+            "descriptionHtml": "Gold and silver glitter iPhone 7 cases with geometric line patterns, stacked",
+            "isGiftCard": False,
+            "legacyResourceId": str(product_id),
+            "onlineStorePreviewUrl": "https://airbyte-integration-test.myshopify.com/products/gold-silver-iphone-7-case",
+            "onlineStoreUrl": None,
+            "totalInventory": 58,
+            "tracksInventory": True,
+            "total_variants": {"total_variants": _VARIANTS_PER_PRODUCT},
+            "media_count": {"media_count": _IMAGES_PER_PRODUCT},
+            "options": [{"id": f"gid://shopify/ProductOption/{product_id}", "name": "Title", "values": ["Plastic"], "position": 1}],
+        }
+    )
+    for image_id in range(_IMAGES_PER_PRODUCT):
+        yield json.dumps({"__typename": "Image", "id": f"gid://shopify/ProductImage/{product_id}{image_id}", "__parentId": product_gid})
+    for variant_id in range(_VARIANTS_PER_PRODUCT):
+        yield json.dumps(
+            {"__typename": "ProductVariant", "id": f"gid://shopify/ProductVariant/{product_id}{variant_id}", "__parentId": product_gid}
+        )
+
+
+def _write_result(path: str, number_of_lines: int) -> None:
+    with open(path, "w") as result:
+        lines_written = 0
+        product_id = 1
+        while lines_written < number_of_lines:
+            for line in _product_lines(product_id):
+                result.write(line + "\n")
+                lines_written += 1
+            product_id += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    config = {
+        "shop": "benchmark",
+        "start_date": "2023-01-01",
+        "credentials": {"auth_method": "api_password", "api_password": "api_password"},
+        "authenticator": None,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bulk-benchmark.jsonl")
+        _write_result(path, args.lines)
+        record_producer = Products(config).record_producer
+
+        start = time.perf_counter()
+        with open(path, "r") as lines:
+            number_of_records = sum(1 for _ in record_producer.read_result(lines))
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"{args.lines / elapsed:>10,.0f} lines/s, {number_of_records / elapsed:>10,.0f} records/s, "
+        f"{elapsed:,.1f}s for {args.lines:,} lines and {number_of_records:,} records"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
+from queue import Full, Queue
+from threading import Event, Thread
 from time import sleep, time
 from typing import Any, Final, Iterable, List, Mapping, Optional
 
@@ -20,7 +22,7 @@ from .exceptions import AirbyteTracedException, ShopifyBulkExceptions
 from .query import ShopifyBulkQuery, ShopifyBulkTemplates
 from .retry import bulk_retry_on_exception
 from .status import ShopifyBulkJobStatus
-from .tools import END_OF_FILE, BulkTools
+from .tools import BulkTools
 
 
 @dataclass
@@ -33,8 +35,12 @@ class ShopifyBulkManager:
     # default logger
     logger: Final[logging.Logger] = logging.getLogger("airbyte")
 
-    # 10Mb chunk size to save the file
-    _retrieve_chunk_size: Final[int] = 1024 * 1024 * 10
+    # 1Mb chunk size to download the result
+    _retrieve_chunk_size: Final[int] = 1024 * 1024
+    # max number of downloaded chunks waiting to be parsed, to avoid OOM
+    _retrieve_chunks_ahead: Final[int] = 10
+    # time to wait for the parser to catch up, before checking whether it has stopped reading the result
+    _retrieve_wait_interval: Final[float] = 0.1
     _job_max_retries: Final[int] = 6
     _job_backoff_time: int = 5
 
@@ -53,10 +59,14 @@ class ShopifyBulkManager:
     # currents: _job_id, _job_state, _job_created_at, _job_self_canceled
     _job_id: Optional[str] = field(init=False, default=None)
     _job_state: str = field(init=False, default=None)  # this string is based on ShopifyBulkJobStatus
-    # completed and saved Bulk Job result filename
-    _job_result_filename: Optional[str] = field(init=False, default=None)
+    # completed Bulk Job result url
+    _job_result_url: Optional[str] = field(init=False, default=None)
     # date-time when the Bulk Job was created on the server
     _job_created_at: Optional[str] = field(init=False, default=None)
+    # the time when the Bulk Job was submitted, to track the time elapsed even if the Job was submitted ahead of time
+    _job_submitted_at: Optional[float] = field(init=False, default=None)
+    # the slice of the Bulk Job submitted ahead of time, while the result of the previous Job is read
+    _job_submitted_ahead_slice: Optional[Mapping[str, str]] = field(init=False, default=None)
     # indicated whether or not we manually force-cancel the current job
     _job_self_canceled: bool = field(init=False, default=False)
     # time between job status checks
@@ -167,8 +177,10 @@ class ShopifyBulkManager:
     def __reset_state(self) -> None:
         # reset the job state to default
         self._job_state = None
-        # reset the filename to default
-        self._job_result_filename = None
+        # reset the result url to default
+        self._job_result_url = None
+        # reset the submission time to default
+        self._job_submitted_at = None
         # setting self-cancelation to default
         self._job_self_canceled = False
         # set the running job message counter to default
@@ -215,18 +227,62 @@ class ShopifyBulkManager:
 
     def _job_get_result(self, response: Optional[requests.Response] = None) -> Optional[str]:
         parsed_response = response.json().get("data", {}).get("node", {}) if response else None
-        job_result_url = parsed_response.get("url") if parsed_response and not self._job_self_canceled else None
-        if job_result_url:
-            # save to local file using chunks to avoid OOM
-            filename = self._tools.filename_from_url(job_result_url)
-            _, response = self._http_client.send_request(http_method="GET", url=job_result_url, request_kwargs={"stream": True})
-            response.raise_for_status()
-            with open(filename, "wb") as file:
-                for chunk in response.iter_content(chunk_size=self._retrieve_chunk_size):
-                    file.write(chunk)
-                # add `<end_of_file>` line to the bottom  of the saved data for easy parsing
-                file.write(END_OF_FILE.encode())
-            return filename
+        return parsed_response.get("url") if parsed_response and not self._job_self_canceled else None
+
+    def _put_chunk(self, chunks: Queue, chunk: Any, stopped: Event) -> bool:
+        while not stopped.is_set():
+            try:
+                chunks.put(chunk, timeout=self._retrieve_wait_interval)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _download_chunks(self, response: requests.Response, chunks: Queue, stopped: Event) -> None:
+        try:
+            for chunk in response.iter_content(chunk_size=self._retrieve_chunk_size):
+                if not self._put_chunk(chunks, chunk, stopped):
+                    return
+            self._put_chunk(chunks, None, stopped)
+        except Exception as e:
+            self._put_chunk(chunks, e, stopped)
+
+    def job_read_result(self, job_result_url: str) -> Iterable[str]:
+        """
+        Returns the lines of the JSONL result of the COMPLETED BULK Job while it is downloaded.
+        The result is downloaded by a background thread, up to `_retrieve_chunks_ahead` chunks ahead of the lines read,
+        so the records are produced while the rest of the result is downloaded, instead of saving the whole result to a file first.
+        """
+        _, response = self._http_client.send_request(http_method="GET", url=job_result_url, request_kwargs={"stream": True})
+        response.raise_for_status()
+        chunks: Queue = Queue(maxsize=self._retrieve_chunks_ahead)
+        stopped = Event()
+        downloader = Thread(target=self._download_chunks, args=(response, chunks, stopped), daemon=True)
+        downloader.start()
+        try:
+            # the part of the last line, which is not downloaded completely yet
+            remainder = b""
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                elif isinstance(chunk, Exception):
+                    raise chunk
+                lines, separator, next_remainder = chunk.rpartition(b"\n")
+                if separator:
+                    # the complete lines are decoded at once, so the lines don't need to be decoded one by one
+                    yield from (remainder + lines).decode("utf-8").split("\n")
+                    remainder = next_remainder
+                else:
+                    remainder += chunk
+            if remainder:
+                yield remainder.decode("utf-8")
+        finally:
+            # stop the download, when the result is not read till the end,
+            # closing the response first, so the downloader is not left waiting for the next chunk from the network
+            stopped.set()
+            response.close()
+            downloader.join()
 
     def _job_update_state(self, response: Optional[requests.Response] = None) -> None:
         if response:
@@ -259,7 +315,7 @@ class ShopifyBulkManager:
             sleep(self._job_check_interval)
 
     def _on_completed_job(self, response: Optional[requests.Response] = None) -> None:
-        self._job_result_filename = self._job_get_result(response)
+        self._job_result_url = self._job_get_result(response)
 
     def _on_failed_job(self, response: requests.Response) -> AirbyteTracedException:
         raise ShopifyBulkExceptions.BulkJobFailed(
@@ -346,6 +402,42 @@ class ShopifyBulkManager:
 
     @bulk_retry_on_exception(logger)
     def create_job(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+        if self._job_submitted_ahead_slice is not None:
+            if self._job_submitted_ahead_slice == stream_slice:
+                # the job for this slice is already submitted, it's tracked by `job_check_for_completion`
+                self._job_submitted_ahead_slice = None
+                return
+            # the job submitted ahead of time is not needed, it would also prevent the creation of the new job
+            self.job_cancel_submitted_ahead()
+        self._job_create(stream_slice, filter_field)
+
+    def submit_job_ahead(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
+        """
+        Submits the BULK Job for the next slice, while the result of the COMPLETED Job is read.
+        The shop runs a single BULK Job of the app at a time, so if another Job is running the slice Job is created later by `create_job`,
+        instead of waiting for the other Job to finish before the result of the COMPLETED one is read.
+        """
+        try:
+            self._job_create(stream_slice, filter_field)
+        except ShopifyBulkExceptions.BaseBulkException as e:
+            self.logger.info(
+                f"Stream: `{self.stream_name}`, the BULK Job for the next slice is not submitted ahead of time. Details: {repr(e)}."
+            )
+            return
+        if self._job_state == ShopifyBulkJobStatus.CREATED.value:
+            self._job_submitted_ahead_slice = stream_slice
+
+    def job_cancel_submitted_ahead(self) -> None:
+        """
+        Cancels the BULK Job submitted ahead of time, when its slice is not read.
+        """
+        if self._job_submitted_ahead_slice is not None:
+            self._job_submitted_ahead_slice = None
+            self.logger.info(f"Stream: `{self.stream_name}`, canceling the BULK Job: `{self._job_id}` submitted ahead of time.")
+            self._job_cancel()
+            self.__reset_state()
+
+    def _job_create(self, stream_slice: Mapping[str, str], filter_field: str) -> None:
         if stream_slice:
             query = self.query.get(filter_field, stream_slice["start"], stream_slice["end"])
         else:
@@ -380,6 +472,7 @@ class ShopifyBulkManager:
         if bulk_response and bulk_response.get("status") == ShopifyBulkJobStatus.CREATED.value:
             self._job_id = bulk_response.get("id")
             self._job_created_at = bulk_response.get("createdAt")
+            self._job_submitted_at = time()
             self._job_state = ShopifyBulkJobStatus.CREATED.value
             self.logger.info(f"Stream: `{self.stream_name}`, the BULK Job: `{self._job_id}` is {ShopifyBulkJobStatus.CREATED.value}")
 
@@ -403,15 +496,15 @@ class ShopifyBulkManager:
     @limiter.balance_rate_limit(api_type=ApiTypeEnum.graphql.value)
     def job_check_for_completion(self) -> Optional[str]:
         """
-        This method checks the status for the `CREATED` Shopify BULK Job, using it's `ID`.
+        This method checks the status for the `CREATED` Shopify BULK Job, using it's `ID`, and returns the result url of the COMPLETED Job.
         The time spent for the Job execution is tracked to understand the effort.
         """
 
-        job_started = time()
+        job_started = self._job_submitted_at or time()
         try:
             # track created job until it's COMPLETED
             self._job_check_state()
-            return self._job_result_filename
+            return self._job_result_url
         except (
             ShopifyBulkExceptions.BulkJobFailed,
             ShopifyBulkExceptions.BulkJobTimout,
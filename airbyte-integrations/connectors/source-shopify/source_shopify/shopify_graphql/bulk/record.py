@@ -5,14 +5,12 @@
 
 import logging
 from dataclasses import dataclass, field
-from io import TextIOWrapper
 from json import loads
-from os import remove
-from typing import Any, Callable, Final, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, Final, FrozenSet, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 from .exceptions import ShopifyBulkExceptions
 from .query import ShopifyBulkQuery
-from .tools import END_OF_FILE, BulkTools
+from .tools import BulkTools
 
 
 @dataclass
@@ -29,10 +27,11 @@ class ShopifyBulkRecord:
         self.composition: Optional[Mapping[str, Any]] = self.query.record_composition
         self.record_process_components: Optional[Callable[[MutableMapping], MutableMapping]] = self.query.record_process_components
         self.components: List[str] = self.composition.get("record_components", []) if self.composition else []
-
-    @property
-    def tools(self) -> BulkTools:
-        return BulkTools()
+        self.tools: BulkTools = BulkTools()
+        # the `__typename` of the records and of their components, to check the type of each line once
+        new_record = self.composition.get("new_record") if self.composition else None
+        self._new_record_types: FrozenSet[Optional[str]] = frozenset(new_record if isinstance(new_record, list) else [new_record])
+        self._component_types: FrozenSet[str] = frozenset(self.components)
 
     @staticmethod
     def check_type(record: Mapping[str, Any], types: Union[List[str], str]) -> bool:
@@ -74,24 +73,22 @@ class ShopifyBulkRecord:
         """
         Step 1: register the new record by it's `__typename`
         Step 2: check for `components` by their `__typename` and add to the placeholder
-        Step 3: repeat until the `<END_OF_FILE>`.
+        Step 3: repeat until the end of the result.
         """
-        if self.check_type(record, self.composition.get("new_record")):
+        record_type = record.get("__typename")
+        if record_type in self._new_record_types:
             # emit from previous iteration, if present
             yield from self.buffer_flush()
             # register the record
             self.record_new(record)
         # components check
-        elif self.check_type(record, self.components):
+        elif record_type in self._component_types:
             self.record_new_component(record)
 
-    def process_line(self, jsonl_file: TextIOWrapper) -> Iterable[MutableMapping[str, Any]]:
+    def process_line(self, lines: Iterable[str]) -> Iterable[MutableMapping[str, Any]]:
         # process the json lines
-        for line in jsonl_file:
-            # we exit from the loop when receive <end_of_file> (file ends)
-            if line == END_OF_FILE:
-                break
-            elif line != "":
+        for line in lines:
+            if line:
                 yield from self.record_compose(loads(line))
 
         # emit what's left in the buffer, typically last record
@@ -118,34 +115,21 @@ class ShopifyBulkRecord:
             record["id"] = self.tools.resolve_str_id(id)
         return record
 
-    def produce_records(self, filename: str) -> Iterable[MutableMapping[str, Any]]:
+    def produce_records(self, lines: Iterable[str]) -> Iterable[MutableMapping[str, Any]]:
         """
-        Read the JSONL content saved from `job.job_retrieve_result()` line-by-line to avoid OOM.
-        The filename example: `bulk-4039263649981.jsonl`,
-            where `4039263649981` is the `id` of the COMPLETED BULK Jobw with `result_url`.
-            Note: typically the `filename` is taken from the `result_url` string provided in the response.
+        Produce the records from the JSONL content of the COMPLETED BULK Job result line-by-line to avoid OOM.
+        The lines are typically taken from `job.job_read_result()`, while the result is being downloaded.
         """
 
-        with open(filename, "r") as jsonl_file:
-            for record in self.process_line(jsonl_file):
-                yield self.tools.fields_names_to_snake_case(record)
+        fields_names_to_snake_case = self.tools.fields_names_to_snake_case
+        for record in self.process_line(lines):
+            yield fields_names_to_snake_case(record)
 
-    def read_file(self, filename: str, remove_file: Optional[bool] = True) -> Iterable[Mapping[str, Any]]:
+    def read_result(self, lines: Iterable[str]) -> Iterable[Mapping[str, Any]]:
         try:
-            # produce records from saved result
-            yield from self.produce_records(filename)
+            # produce records from the result
+            yield from self.produce_records(lines)
         except Exception as e:
             raise ShopifyBulkExceptions.BulkRecordProduceError(
                 f"An error occured while producing records from BULK Job result. Trace: {repr(e)}.",
             )
-        finally:
-            # removing the tmp file, if requested
-            if remove_file and filename:
-                try:
-                    remove(filename)
-                except Exception as e:
-                    self.logger.info(f"Failed to remove the `tmp job result` file, the file doen't exist. Details: {repr(e)}.")
-                    # we should pass here, if the file wasn't removed , it's either:
-                    # - doesn't exist
-                    # - will be dropped with the container shut down.
-                    pass
@@ -4,20 +4,24 @@
 
 
 import re
-from typing import Any, Mapping, MutableMapping, Optional, Union
+from functools import lru_cache
+from typing import Any, Final, Mapping, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
 import pendulum as pdm
 
 from .exceptions import ShopifyBulkExceptions
 
-# default end line tag
-END_OF_FILE: str = "<end_of_file>"
 BULK_PARENT_KEY: str = "__parentId"
+# the field names come from the fixed GraphQL schema of the streams, so the conversions are cached and reused for every record
+FIELD_NAMES_CACHE_SIZE: Final[int] = 4096
+# the first number in the string is the id, like `123` in `gid://shopify/Order/123`
+ID_PATTERN: Final[re.Pattern] = re.compile(r"\d+")
 
 
 class BulkTools:
     @staticmethod
+    @lru_cache(maxsize=FIELD_NAMES_CACHE_SIZE)
     def camel_to_snake(camel_case: str) -> str:
         snake_case = []
         for char in camel_case:
@@ -65,11 +69,18 @@ class BulkTools:
         target_value = record.get(field)
         return pdm.parse(target_value).to_rfc3339_string() if target_value else record.get(field)
 
+    @staticmethod
+    @lru_cache(maxsize=FIELD_NAMES_CACHE_SIZE)
+    def field_name_to_snake_case(field_name: str) -> str:
+        # leaving the `__parentId` relation in place
+        return field_name if field_name == BULK_PARENT_KEY else BulkTools.camel_to_snake(field_name)
+
     def fields_names_to_snake_case(self, dict_input: Optional[Mapping[str, Any]] = None) -> Optional[MutableMapping[str, Any]]:
         # transforming record field names from camel to snake case, leaving the `__parent_id` relation in place
         if dict_input:
             # the `None` type check is required, to properly handle nested missing entities (return None)
-            return {self.camel_to_snake(k) if dict_input and k != BULK_PARENT_KEY else k: v for k, v in dict_input.items()}
+            field_name_to_snake_case = self.field_name_to_snake_case
+            return {field_name_to_snake_case(k): v for k, v in dict_input.items()}
 
     @staticmethod
     def resolve_str_id(
@@ -78,6 +89,6 @@ class BulkTools:
         # some fields that expected to be resolved as ids, might not be populated for the particular `RECORD`,
         # we should return `None` to make the field `null` in the output as the result of the transformation.
         if str_input:
-            return output_type(re.search(r"\d+", str_input).group())
+            return output_type(ID_PATTERN.search(str_input).group())
         else:
             return None
@@ -7,7 +7,7 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from functools import cached_property
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
 import pendulum as pdm
@@ -653,6 +653,9 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
             self.job_manager.job_size = self.bulk_window_in_days
         # define Record Producer instance
         self.record_producer: ShopifyBulkRecord = ShopifyBulkRecord(self.query)
+        # the slices of the sync, the next one is taken ahead of time to submit its BULK Job while the current slice is read
+        self._bulk_slices: Optional[Iterator[Mapping[str, str]]] = None
+        self._bulk_slice_ahead: Optional[Mapping[str, str]] = None
 
     @cached_property
     def parent_stream(self) -> object:
@@ -732,23 +735,44 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
         slice_size_message = f"Slice size: `P{round(self.job_manager.job_size, 1)}D`"
         self.logger.info(f"Stream: `{self.name}` requesting BULK Job for period: {slice_start} -- {slice_end}. {slice_size_message}")
 
+    def get_bulk_slices(self, start: datetime, end: datetime) -> Iterable[Mapping[str, str]]:
+        while start < end:
+            self.job_manager.job_size_normalize(start, end)
+            slice_end = self.job_manager.get_adjusted_job_start(start)
+            self.emit_slice_message(start, slice_end)
+            yield {"start": start.to_rfc3339_string(), "end": slice_end.to_rfc3339_string()}
+            # increment the end of the slice or reduce the next slice
+            start = self.job_manager.get_adjusted_job_end(start, slice_end)
+
     @stream_state_cache.cache_stream_state
     def stream_slices(self, stream_state: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         if self.filter_field:
             state = self.get_state_value(stream_state)
             start = pdm.parse(state)
             end = pdm.now()
-            while start < end:
-                self.job_manager.job_size_normalize(start, end)
-                slice_end = self.job_manager.get_adjusted_job_start(start)
-                self.emit_slice_message(start, slice_end)
-                yield {"start": start.to_rfc3339_string(), "end": slice_end.to_rfc3339_string()}
-                # increment the end of the slice or reduce the next slice
-                start = self.job_manager.get_adjusted_job_end(start, slice_end)
+            self._bulk_slices = iter(self.get_bulk_slices(start, end))
+            self._bulk_slice_ahead = None
+            for stream_slice in self._bulk_slices:
+                yield stream_slice
+                # the next slice could be taken by `read_records` already
+                while self._bulk_slice_ahead:
+                    stream_slice, self._bulk_slice_ahead = self._bulk_slice_ahead, None
+                    yield stream_slice
         else:
             # for the streams that don't support filtering
             yield {}
 
+    def submit_next_job_ahead(self) -> None:
+        """
+        Takes the next slice once the BULK Job of the current slice is COMPLETED, and submits its Job while the current result is read.
+        The next slice is computed at the same point as before, right after the current Job is COMPLETED and the slice size is adjusted,
+        and the records are still emitted slice after slice, so the state is the same as when the Jobs are submitted one at a time.
+        """
+        if self._bulk_slices is not None and self._bulk_slice_ahead is None:
+            self._bulk_slice_ahead = next(self._bulk_slices, None)
+            if self._bulk_slice_ahead:
+                self.job_manager.submit_job_ahead(self._bulk_slice_ahead, self.filter_field)
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -759,12 +783,19 @@ class IncrementalShopifyGraphQlBulkStream(IncrementalShopifyStream):
         self.job_manager.create_job(stream_slice, self.filter_field)
         stream_state = stream_state_cache.cached_state.get(self.name, {self.cursor_field: self.default_state_comparison_value})
 
-        filename = self.job_manager.job_check_for_completion()
-        # the `filename` could be `None`, meaning there are no data available for the slice period.
-        if filename:
+        job_result_url = self.job_manager.job_check_for_completion()
+        self.submit_next_job_ahead()
+        # the `job_result_url` could be `None`, meaning there are no data available for the slice period.
+        if job_result_url:
             # add `shop_url` field to each record produced
             records = self.add_shop_url_field(
-                # produce records from saved bulk job result
-                self.record_producer.read_file(filename)
+                # produce records from bulk job result, while it's downloaded
+                self.record_producer.read_result(self.job_manager.job_read_result(job_result_url))
             )
-            yield from self.filter_records_newer_than_state(stream_state, records)
+            try:
+                yield from self.filter_records_newer_than_state(stream_state, records)
+            except BaseException:
+                # the next slice is not read, when the read fails or is stopped early (GeneratorExit),
+                # so the job submitted for it would only hold the shop's BULK Job slot
+                self.job_manager.job_cancel_submitted_ahead()
+                raise
@@ -3,9 +3,12 @@
 #
 
 
+import threading
+
 import pytest
 import requests
 from airbyte_protocol.models import SyncMode
+from freezegun import freeze_time
 from source_shopify.shopify_graphql.bulk.exceptions import ShopifyBulkExceptions
 from source_shopify.shopify_graphql.bulk.status import ShopifyBulkJobStatus
 from source_shopify.streams.streams import (
@@ -117,7 +120,12 @@ def test_job_state_completed(auth_config) -> None:
 @pytest.mark.parametrize(
     "job_response, error_type, expected",
     [
-        ("bulk_job_completed_response", None, "bulk-123456789.jsonl"),
+        (
+            "bulk_job_completed_response",
+            None,
+            'https://some_url?response-content-disposition=attachment;+filename="bulk-123456789.jsonl";+filename*=UTF-8'
+            "bulk-123456789.jsonl&response-content-type=application/jsonl",
+        ),
         ("bulk_job_failed_response", ShopifyBulkExceptions.BulkJobFailed, "exited with FAILED"),
         ("bulk_job_timeout_response", ShopifyBulkExceptions.BulkJobTimout, "exited with TIMEOUT"),
         ("bulk_job_access_denied_response", ShopifyBulkExceptions.BulkJobAccessDenied, "exited with ACCESS_DENIED"),
@@ -237,17 +245,99 @@ def test_job_check_with_running_scenario(request, requests_mock, job_response, a
     assert stream.job_manager._job_state == expected
 
 
-def test_job_read_file_invalid_filename(mocker, auth_config) -> None:
+def test_job_read_result_produce_error(mocker, auth_config) -> None:
     stream = MetafieldOrders(auth_config)
     expected = "An error occured while producing records from BULK Job result"
     # patching the method to get the filename
     mocker.patch("source_shopify.shopify_graphql.bulk.record.ShopifyBulkRecord.produce_records", side_effect=Exception)
     with pytest.raises(ShopifyBulkExceptions.BulkRecordProduceError) as error:
-        list(stream.record_producer.read_file("test.jsonl"))
+        list(stream.record_producer.read_result(["{}"]))
 
     assert expected in repr(error.value)
 
 
+def test_job_read_result_lines_split_across_chunks(requests_mock, auth_config) -> None:
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager._retrieve_chunk_size = 7
+    requests_mock.get("https://some_url/bulk-123456789.jsonl", text='{"id": 1}\n{"id": "ÀÂÇ"}\n{"id": 3}')
+    lines = stream.job_manager.job_read_result("https://some_url/bulk-123456789.jsonl")
+    assert list(lines) == ['{"id": 1}', '{"id": "ÀÂÇ"}', '{"id": 3}']
+
+
+def test_job_read_result_stops_download_when_not_read_till_the_end(requests_mock, auth_config) -> None:
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager._retrieve_chunk_size = 10
+    stream.job_manager._retrieve_chunks_ahead = 1
+    requests_mock.get("https://some_url/bulk-123456789.jsonl", text='{"id": 1}\n' * 1000)
+    threads_before = threading.active_count()
+    lines = stream.job_manager.job_read_result("https://some_url/bulk-123456789.jsonl")
+    assert next(lines) == '{"id": 1}'
+    lines.close()
+    assert threading.active_count() == threads_before
+
+
+@freeze_time("2023-01-03T00:00:00Z")
+def test_bulk_stream_submits_next_job_before_reading_the_result(
+    requests_mock,
+    bulk_successful_response,
+    bulk_job_completed_response,
+    metafield_jsonl_content_example,
+    metafield_parse_response_expected_result,
+    auth_config,
+) -> None:
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager.job_size = 1
+    # job creation and completion, for each of the 2 slices
+    requests_mock.post(stream.job_manager.base_url, [{"json": bulk_successful_response}, {"json": bulk_job_completed_response}] * 2)
+    requests_mock.get(bulk_job_completed_response.get("data").get("node").get("url"), text=metafield_jsonl_content_example)
+
+    test_records = [
+        record
+        for stream_slice in stream.stream_slices(stream_state={})
+        for record in stream.read_records(SyncMode.incremental, stream_slice=stream_slice)
+    ]
+
+    assert test_records == [metafield_parse_response_expected_result] * 2
+    # the job of the second slice is created before the result of the first slice is downloaded
+    assert [request.method for request in requests_mock.request_history] == ["POST", "POST", "POST", "GET", "POST", "GET"]
+
+
+@freeze_time("2023-01-03T00:00:00Z")
+def test_bulk_stream_cancels_job_submitted_ahead_when_the_read_is_stopped(
+    mocker,
+    requests_mock,
+    bulk_successful_response,
+    bulk_job_completed_response,
+    metafield_jsonl_content_example,
+    auth_config,
+) -> None:
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager.job_size = 1
+    requests_mock.post(stream.job_manager.base_url, [{"json": bulk_successful_response}, {"json": bulk_job_completed_response}] * 2)
+    requests_mock.get(bulk_job_completed_response.get("data").get("node").get("url"), text=metafield_jsonl_content_example)
+    job_cancel_submitted_ahead = mocker.patch.object(stream.job_manager, "job_cancel_submitted_ahead")
+
+    records = stream.read_records(SyncMode.incremental, stream_slice=next(iter(stream.stream_slices(stream_state={}))))
+    next(records)
+    records.close()
+
+    job_cancel_submitted_ahead.assert_called_once()
+
+
+def test_job_cancel_submitted_ahead_when_the_result_is_not_read(requests_mock, bulk_successful_response, auth_config) -> None:
+    stream = MetafieldOrders(auth_config)
+    stream.job_manager._job_check_interval = 0
+    requests_mock.post(stream.job_manager.base_url, json=bulk_successful_response)
+    next_slice = {"start": "2023-01-02T00:00:00+00:00", "end": "2023-01-03T00:00:00+00:00"}
+    stream.job_manager.submit_job_ahead(next_slice, stream.filter_field)
+    assert stream.job_manager._job_submitted_ahead_slice == next_slice
+
+    stream.job_manager.job_cancel_submitted_ahead()
+
+    assert "bulkOperationCancel" in requests_mock.last_request.text
+    assert stream.job_manager._job_submitted_ahead_slice is None
+
+
 @pytest.mark.parametrize(
     "stream, json_content_example, expected",
     [
@@ -196,12 +196,11 @@ def test_buffer_flush(buffered_record, expected) -> None:
     ],
     ids=["test_compose"],
 )
-def test_record_compose(records_from_jsonl, record_composition, expected) -> None:
+def test_record_compose(mocker, records_from_jsonl, record_composition, expected) -> None:
+    # the record composition is taken from the query, when the record instance is created
+    mocker.patch.object(ShopifyBulkQuery, "record_composition", new_callable=mocker.PropertyMock, return_value=record_composition)
     query = ShopifyBulkQuery(shop_id=0)
-    # query.record_composition = record_composition
     record_instance = ShopifyBulkRecord(query)
-    record_instance.composition = record_composition
-    record_instance.components = record_composition.get("record_components")
     # process read jsonl records
     for record in records_from_jsonl:
         list(record_instance.record_compose(record))
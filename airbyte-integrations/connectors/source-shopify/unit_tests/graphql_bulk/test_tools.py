@@ -48,7 +48,15 @@ def test_fields_names_to_snake_case() -> None:
     assert BulkTools().fields_names_to_snake_case(dict_input) == expected_output
 
 
+def test_fields_names_to_snake_case_reuses_converted_field_names() -> None:
+    BulkTools.field_name_to_snake_case.cache_clear()
+    for _ in range(3):
+        BulkTools().fields_names_to_snake_case({"camelCase": "value", "__parentId": "value"})
+    assert BulkTools.field_name_to_snake_case.cache_info().misses == 2
+
+
 def test_resolve_str_id() -> None:
     assert BulkTools.resolve_str_id("123") == 123
     assert BulkTools.resolve_str_id("456", str) == "456"
+    assert BulkTools.resolve_str_id("gid://shopify/MailingAddress/789?model_name=CustomerAddress") == 789
     assert BulkTools.resolve_str_id(None) is None